@@ -1,16 +1,15 @@
 from fastapi import Depends
 
+from app.attachments.router import router as attachments_router
 from app.auth.deps import get_current_user
-
-# public
 from app.auth.router import router as auth_router
 from app.core.router import create_router
 from app.expenses.router import router as expenses_router
-
-# private
 from app.flights.router import router as flights_router
 from app.itinerary.router import router as itinerary_router
+from app.jobs.router import router as jobs_router
 from app.plans.router import router as plans_router
+from app.plans.router import ws_router as plans_ws_router
 from app.users.router import router as users_router
 
 router = create_router()
@@ -27,6 +26,14 @@ private_router.include_router(flights_router, prefix="/flights", tags=["Flights"
 private_router.include_router(itinerary_router, prefix="/itinerary", tags=["Itinerary"])
 private_router.include_router(plans_router, prefix="/plans", tags=["Plans"])
 private_router.include_router(expenses_router, prefix="/expenses", tags=["Expenses"])
+private_router.include_router(jobs_router, prefix="/jobs", tags=["Jobs"])
+private_router.include_router(
+    attachments_router, prefix="/attachments", tags=["Attachments"]
+)
+
+ws_router = create_router(prefix="/ws")
+ws_router.include_router(plans_ws_router, prefix="/plans", tags=["Plans"])
 
 router.include_router(public_router)
 router.include_router(private_router)
+router.include_router(ws_router)
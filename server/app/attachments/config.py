@@ -0,0 +1,9 @@
+from app.config import BaseConfig
+
+
+class AttachmentConfig(BaseConfig):
+    ATTACHMENT_MAX_SIZE: int = 50 * 1024 * 1024
+    """첨부 파일 하나의 최대 크기 (바이트)"""
+
+
+attachment_settings = AttachmentConfig.create()
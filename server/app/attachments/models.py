@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class Attachment(Base):
+    """
+    계획(또는 계획의 항공편, 일정)에 첨부한 파일 (예약 확인서, 바우처, 탑승권 등)
+    파일 내용은 app.storage에 해시(digest)를 key로 저장되므로, 같은 파일은 한 번만 저장됩니다.
+    """
+
+    __tablename__ = "attachment"
+    __table_args__ = (
+        Index(
+            "ix_attachment_plan_id",
+            "plan_id",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        init=False,
+        autoincrement=True,
+    )
+
+    plan_id: Mapped[int] = mapped_column(ForeignKey("plan.id"))
+
+    flight_id: Mapped[int | None] = mapped_column(ForeignKey("flight.id"))
+    """첨부한 항공편. 계획 자체에 첨부한 파일이면 None"""
+
+    itinerary_id: Mapped[int | None] = mapped_column(ForeignKey("itinerary.id"))
+    """첨부한 일정. 계획 자체에 첨부한 파일이면 None"""
+
+    digest: Mapped[str] = mapped_column(String(64))
+    """파일 내용의 SHA-256 (hex). 저장소의 key"""
+
+    size: Mapped[int] = mapped_column(BigInteger)
+
+    content_type: Mapped[str] = mapped_column(String(255))
+
+    filename: Mapped[str] = mapped_column(String(255))
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False
+    )
+
+    is_deleted: Mapped[bool] = mapped_column(default=False, nullable=False)
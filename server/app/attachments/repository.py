@@ -0,0 +1,88 @@
+from typing import Any, Sequence
+
+from sqlalchemy import insert, select, update
+
+from app.database.deps import SessionDep
+from app.flights.models import Flight
+from app.itinerary.models import Itinerary
+from app.utils.dependency import dependency
+
+from .models import Attachment
+
+
+@dependency
+class AttachmentRepository:
+    session: SessionDep
+
+    async def release_connection(self) -> None:
+        """
+        지금까지의 트랜잭션을 끝내고 커넥션을 풀에 돌려줍니다.
+        업로드처럼 오래 걸리는 작업 동안 커넥션을 잡고 있지 않도록 그 전에 호출합니다.
+        """
+        await self.session.commit()
+
+    async def has_target(
+        self, *, plan_id: int, flight_id: int | None, itinerary_id: int | None
+    ) -> bool:
+        """첨부할 항공편과 일정이 계획에 속해 있는지 확인합니다."""
+        if flight_id is not None:
+            found = await self.session.scalar(
+                select(Flight.id).where(
+                    Flight.id == flight_id,
+                    Flight.plan_id == plan_id,
+                    Flight.is_deleted.is_(False),
+                )
+            )
+            if found is None:
+                return False
+        if itinerary_id is not None:
+            found = await self.session.scalar(
+                select(Itinerary.id).where(
+                    Itinerary.id == itinerary_id,
+                    Itinerary.plan_id == plan_id,
+                    Itinerary.is_deleted.is_(False),
+                )
+            )
+            if found is None:
+                return False
+        return True
+
+    async def create(self, *, values: dict[str, Any]) -> Attachment:
+        result = await self.session.scalars(
+            insert(Attachment).values(values).returning(Attachment),
+            execution_options={"synchronize_session": False},
+        )
+        return result.one()
+
+    async def find_by_plan(self, *, plan_id: int) -> Sequence[Attachment]:
+        result = await self.session.scalars(
+            select(Attachment)
+            .where(Attachment.plan_id == plan_id, Attachment.is_deleted.is_(False))
+            .order_by(Attachment.id)
+        )
+        return result.all()
+
+    async def find_by_id(
+        self, *, plan_id: int, attachment_id: int
+    ) -> Attachment | None:
+        return await self.session.scalar(
+            select(Attachment).where(
+                Attachment.id == attachment_id,
+                Attachment.plan_id == plan_id,
+                Attachment.is_deleted.is_(False),
+            )
+        )
+
+    async def delete(self, *, plan_id: int, attachment_id: int) -> bool:
+        result = await self.session.scalar(
+            update(Attachment)
+            .where(
+                Attachment.id == attachment_id,
+                Attachment.plan_id == plan_id,
+                Attachment.is_deleted.is_(False),
+            )
+            .values(is_deleted=True)
+            .returning(Attachment.id),
+            execution_options={"synchronize_session": False},
+        )
+        return result is not None
@@ -0,0 +1,74 @@
+from typing import Annotated
+
+from fastapi import Header, HTTPException, Query, Request, Response, status
+
+from app.core.router import create_router
+
+from .config import attachment_settings
+from .schemas import AttachmentRead
+from .service import AttachmentService
+
+router = create_router()
+
+
+@router.post("/{plan_id}", status_code=status.HTTP_201_CREATED)
+async def upload_attachment(
+    attachment_service: AttachmentService,
+    request: Request,
+    plan_id: int,
+    filename: Annotated[str, Query(min_length=1, max_length=1024)],
+    flight_id: Annotated[int | None, Query(alias="flightId")] = None,
+    itinerary_id: Annotated[int | None, Query(alias="itineraryId")] = None,
+    content_type: Annotated[str, Header()] = "application/octet-stream",
+    content_length: Annotated[int | None, Header()] = None,
+) -> AttachmentRead:
+    """
+    계획에 파일을 첨부합니다. 파일 내용을 요청 본문에 그대로 담아 보냅니다. (multipart 아님)
+    flightId나 itineraryId를 주면 해당 항공편이나 일정에 첨부합니다.
+    """
+    if (
+        content_length is not None
+        and content_length > attachment_settings.ATTACHMENT_MAX_SIZE
+    ):
+        raise HTTPException(status_code=413, detail="파일이 너무 큽니다.")
+
+    return await attachment_service.upload(
+        plan_id=plan_id,
+        chunks=request.stream(),
+        filename=filename,
+        content_type=content_type[:255],
+        flight_id=flight_id,
+        itinerary_id=itinerary_id,
+    )
+
+
+@router.get("/{plan_id}", status_code=status.HTTP_200_OK)
+async def read_attachments(
+    attachment_service: AttachmentService,
+    plan_id: int,
+) -> list[AttachmentRead]:
+    return await attachment_service.read_all(plan_id=plan_id)
+
+
+@router.get("/{plan_id}/{attachment_id}/content")
+async def download_attachment(
+    attachment_service: AttachmentService,
+    plan_id: int,
+    attachment_id: int,
+) -> Response:
+    """
+    파일 내용을 내려받습니다. Range 요청으로 일부만 받을 수 있습니다.
+    S3 저장소를 사용하면 presigned URL로 redirect 합니다.
+    """
+    return await attachment_service.download(
+        plan_id=plan_id, attachment_id=attachment_id
+    )
+
+
+@router.delete("/{plan_id}/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_attachment(
+    attachment_service: AttachmentService,
+    plan_id: int,
+    attachment_id: int,
+) -> None:
+    await attachment_service.delete(plan_id=plan_id, attachment_id=attachment_id)
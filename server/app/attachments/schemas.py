@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from app.schemas import APISchema
+
+
+class AttachmentRead(APISchema):
+    id: int
+    plan_id: int
+    flight_id: int | None
+    itinerary_id: int | None
+    filename: str
+    content_type: str
+    size: int
+    created_at: datetime
@@ -0,0 +1,115 @@
+from pathlib import PurePosixPath
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Response
+
+from app.plans.deps import PlanOwnerGuard
+from app.plans.events import PlanEventType
+from app.plans.repository import PlanRepository
+from app.storage import rechunk
+from app.storage.config import storage_settings
+from app.storage.deps import StorageDep
+from app.utils.dependency import dependency
+
+from .config import attachment_settings
+from .repository import AttachmentRepository
+from .schemas import AttachmentRead
+
+
+def _clean_filename(filename: str) -> str:
+    name = PurePosixPath(filename.replace("\\", "/")).name.strip()
+    return name[-255:] or "file"
+
+
+@dependency
+class AttachmentService:
+    attachment_repository: AttachmentRepository
+    plan_repository: PlanRepository
+    plan_owner_guard: PlanOwnerGuard
+    storage: StorageDep
+
+    async def upload(
+        self,
+        *,
+        plan_id: int,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: str,
+        flight_id: int | None = None,
+        itinerary_id: int | None = None,
+    ) -> AttachmentRead:
+        """
+        요청 본문을 받는 대로 저장소에 저장하고 첨부 파일을 만듭니다.
+        권한을 확인한 뒤 트랜잭션을 끝내고 업로드하므로, 업로드 중에는 DB 커넥션을 사용하지 않습니다.
+        """
+        await self.plan_owner_guard.check(plan_id=plan_id)
+        if not await self.attachment_repository.has_target(
+            plan_id=plan_id, flight_id=flight_id, itinerary_id=itinerary_id
+        ):
+            raise HTTPException(
+                status_code=404, detail="첨부할 항공편이나 일정을 찾을 수 없습니다."
+            )
+        await self.attachment_repository.release_connection()
+
+        stored = await self.storage.save(
+            rechunk(chunks, storage_settings.STORAGE_CHUNK_SIZE),
+            max_size=attachment_settings.ATTACHMENT_MAX_SIZE,
+        )
+
+        attachment = await self.attachment_repository.create(
+            values={
+                "plan_id": plan_id,
+                "flight_id": flight_id,
+                "itinerary_id": itinerary_id,
+                "digest": stored.key,
+                "size": stored.size,
+                "content_type": content_type,
+                "filename": _clean_filename(filename),
+            }
+        )
+        await self.plan_repository.publish_event(
+            plan_id=plan_id,
+            event_type=PlanEventType.ATTACHMENT_CREATED,
+            ids=[attachment.id],
+        )
+
+        return AttachmentRead.model_validate(attachment)
+
+    async def read_all(self, *, plan_id: int) -> list[AttachmentRead]:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        attachments = await self.attachment_repository.find_by_plan(plan_id=plan_id)
+        return [AttachmentRead.model_validate(a) for a in attachments]
+
+    async def download(self, *, plan_id: int, attachment_id: int) -> Response:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        attachment = await self.attachment_repository.find_by_id(
+            plan_id=plan_id, attachment_id=attachment_id
+        )
+        if attachment is None:
+            raise HTTPException(status_code=404, detail="해당 파일을 찾을 수 없습니다.")
+
+        return await self.storage.download(
+            attachment.digest,
+            filename=attachment.filename,
+            content_type=attachment.content_type,
+        )
+
+    async def delete(self, *, plan_id: int, attachment_id: int) -> None:
+        """
+        첨부 파일만 삭제하고 저장소의 내용은 남겨둡니다.
+        같은 내용을 다른 첨부 파일이 참조하고 있을 수 있습니다.
+        """
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        if not await self.attachment_repository.delete(
+            plan_id=plan_id, attachment_id=attachment_id
+        ):
+            raise HTTPException(status_code=404, detail="해당 파일을 찾을 수 없습니다.")
+
+        await self.plan_repository.publish_event(
+            plan_id=plan_id,
+            event_type=PlanEventType.ATTACHMENT_DELETED,
+            ids=[attachment_id],
+        )
@@ -0,0 +1,73 @@
+"""
+JWT 검증 비용을 비교합니다.
+
+    uv run poe bench-jwt
+    uv run poe bench-jwt --number 5000
+
+.env의 키와 ALGORITHM으로 access token을 만들어 아래 세 경우의 decode 한 번 비용을 잽니다.
+- parse+verify: 매번 JWK를 파싱한 뒤 검증 (키를 캐시하기 전 방식)
+- cache miss: 파싱해 둔 키로 검증 (매번 처음 보는 토큰)
+- cache hit: 검증한 토큰 캐시에서 찾음
+"""
+
+import argparse
+import sys
+import time
+import timeit
+from typing import Callable
+
+import jwt
+
+from .config import auth_settings
+from .token import create_jwt_token, decode_jwt_token
+
+_REPEAT = 5
+
+
+def _parse_and_verify(token: str) -> None:
+    key = jwt.PyJWK.from_dict(auth_settings.PRIVATE_JWK.model_dump())
+    jwt.decode(token, key.key, algorithms=[auth_settings.ALGORITHM])
+
+
+def measure(func: Callable[[str], object], token: str, *, number: int) -> float:
+    """같은 토큰으로 number번 호출하기를 반복해, 가장 빠른 회차의 한 번 호출 시간 (초)"""
+    func(token)
+    timer = timeit.Timer(lambda: func(token))
+    return min(timer.repeat(repeat=_REPEAT, number=number)) / number
+
+
+def measure_cache_miss(*, number: int) -> float:
+    """처음 보는 토큰만 검증하도록 회차마다 토큰을 새로 발급해 둡니다."""
+    best = float("inf")
+    for _ in range(_REPEAT):
+        tokens = [create_jwt_token(sub) for sub in range(number)]
+        start = time.perf_counter()
+        for token in tokens:
+            decode_jwt_token(token)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(sys.argv[1:])
+
+    token = create_jwt_token(1)
+    print(f"algorithm={auth_settings.ALGORITHM} number={args.number}")
+
+    for name, seconds in (
+        ("parse+verify", measure(_parse_and_verify, token, number=args.number)),
+        ("cache miss", measure_cache_miss(number=args.number)),
+        ("cache hit", measure(decode_jwt_token, token, number=args.number)),
+    ):
+        print(f"{name:<13} {seconds * 1e6:>9.2f} us")
+
+    if auth_settings.VERIFIED_TOKEN_CACHE_SIZE <= 0:
+        print("VERIFIED_TOKEN_CACHE_SIZE가 0이므로 cache hit도 매번 검증합니다.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 import jwt
 
 from app.auth.schemas import PrivateJWK, PublicJWK
@@ -18,13 +20,41 @@ class AuthConfig(BaseConfig):
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
     """
-    HS256에서는 Private key만 알아도 public key를 알 수 있으나, 보안적으로 안전하게 하기 위해 따로 관리합니다. 
+    HS256에서는 Private key만 알아도 public key를 알 수 있으나, 보안적으로 안전하게 하기 위해 따로 관리합니다.
     키 로테이션을 위해 list 형태로 관리합니다.
     """
 
-    @property
+    GOOGLE_AUTH_URL: str = "https://accounts.google.com/o/oauth2/v2/auth"
+    GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_USERINFO_URL: str = "https://openidconnect.googleapis.com/v1/userinfo"
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_ISSUERS: list[str] = ["https://accounts.google.com", "accounts.google.com"]
+    """id_token의 iss로 허용하는 값. 로컬 가짜 issuer로 테스트할 때는 URL들과 함께 바꿉니다."""
+
+    JWKS_DEFAULT_MAX_AGE: float = 3600.0
+    """JWKS 응답에 Cache-Control max-age가 없을 때 캐시하는 시간 (초)"""
+
+    JWKS_MIN_REFRESH_INTERVAL: float = 30.0
+    """모르는 kid 때문에 JWKS를 다시 받는 최소 간격 (초). 위조 토큰으로 JWKS 요청이 몰리는 것을 막습니다."""
+
+    VERIFIED_TOKEN_CACHE_SIZE: int = 10_000
+    """서명 검증을 마친 토큰을 기억해 둘 최대 개수 (0이면 캐시하지 않음)"""
+
+    @cached_property
     def PRIVATE_JWK_INSTANCE(self) -> jwt.PyJWK:
         return jwt.PyJWK.from_dict(self.PRIVATE_JWK.model_dump())
 
+    @cached_property
+    def PUBLIC_JWK_INSTANCES(self) -> dict[str, jwt.PyJWK]:
+        """
+        kid별 검증 키. 로테이션 중인 이전 키와 현재 서명 키를 모두 포함합니다.
+        """
+        instances = {
+            jwk.kid: jwt.PyJWK.from_dict(jwk.model_dump())
+            for jwk in self.PUBLIC_JWK_SET
+        }
+        instances.setdefault(self.PRIVATE_JWK.kid, self.PRIVATE_JWK_INSTANCE)
+        return instances
+
 
 auth_settings = AuthConfig.create()
@@ -1,10 +1,12 @@
 from typing import Annotated, Optional
 
-from fastapi import Body, Depends, HTTPException
+from fastapi import Body, Depends, HTTPException, WebSocket
 from fastapi.security import APIKeyHeader
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.deps import SessionDep
 from app.schemas import APISchema
+from app.users.cache import AuthenticatedUser, user_cache
 from app.users.models import User
 
 from .models import UserAuthInfo
@@ -17,6 +19,25 @@ api_key_header = APIKeyHeader(
 )
 TokenDep = Annotated[str | None, Depends(api_key_header)]
 
+WEBSOCKET_AUTH_SUBPROTOCOL = "bearer"
+"""토큰을 담아 보내는 WebSocket 서브프로토콜. 연결을 수락할 때 이 값을 돌려줘야 합니다."""
+
+
+def get_websocket_token(websocket: WebSocket) -> Optional[str]:
+    """
+    브라우저 WebSocket은 헤더를 보낼 수 없으므로 서브프로토콜 목록으로 토큰을 받습니다.
+    URL 쿼리와 달리 access log나 프록시 로그에 남지 않습니다.
+
+        new WebSocket(url, ["bearer", token])  // Sec-WebSocket-Protocol: bearer, <token>
+    """
+    protocols: list[str] = websocket.scope.get("subprotocols", [])
+    if len(protocols) == 2 and protocols[0] == WEBSOCKET_AUTH_SUBPROTOCOL:
+        return protocols[1]
+    return None
+
+
+WebSocketTokenDep = Annotated[Optional[str], Depends(get_websocket_token)]
+
 
 async def validate_register_token(
     session: SessionDep,
@@ -61,34 +82,50 @@ async def validate_refresh_token(
 RefreshTokenDep = Annotated[User, Depends(validate_refresh_token)]
 
 
-async def get_current_user_or_none(
-    session: SessionDep, token: TokenDep
-) -> Optional[User]:
-    if token is None:
-        return None
-
+async def authenticate_token(
+    session: AsyncSession, token: str
+) -> Optional[AuthenticatedUser]:
     user_id = decode_jwt_token(token)
     if user_id is None:
         return None
 
-    user = await session.get(User, user_id)
-    if user and user.is_deleted:
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = await session.get(User, user_id)
+        if db_user is None:
+            return None
+
+        user = AuthenticatedUser.of(db_user)
+        user_cache.set(user_id, user)
+
+    if user.is_deleted:
         return None
 
     return user
 
 
-CurrentUserOptional = Annotated[Optional[User], Depends(get_current_user_or_none)]
+async def get_current_user_or_none(
+    session: SessionDep, token: TokenDep
+) -> Optional[AuthenticatedUser]:
+    if token is None:
+        return None
+
+    return await authenticate_token(session, token)
+
+
+CurrentUserOptional = Annotated[
+    Optional[AuthenticatedUser], Depends(get_current_user_or_none)
+]
 
 
-async def get_current_user(user: CurrentUserOptional) -> User:
+async def get_current_user(user: CurrentUserOptional) -> AuthenticatedUser:
     if not user:
         raise HTTPException(status_code=403)
 
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
 
 
 __all__ = ["TokenDep", "RegisterAuthDep", "CurrentUserOptional", "CurrentUser"]
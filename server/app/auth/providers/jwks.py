@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import re
+import time
+from typing import cast
+
+import httpx
+import jwt
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class JWKSError(Exception):
+    pass
+
+
+def _max_age(cache_control: str | None) -> float | None:
+    if not cache_control:
+        return None
+
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return float(match.group(1)) if match else None
+
+
+class JWKSCache:
+    """
+    외부 issuer의 JWKS를 워커 메모리에 캐시합니다.
+
+    - 응답의 Cache-Control max-age 동안 캐시하고, 지난 뒤에는 기존 키로 검증하면서 백그라운드에서 갱신합니다.
+    - 모르는 kid가 오면(키 로테이션) 즉시 다시 받되, min_refresh_interval 안에는 다시 받지 않습니다.
+    - 동시에 여러 요청이 갱신을 요구해도 JWKS 요청은 하나만 보냅니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        default_max_age: float,
+        min_refresh_interval: float,
+    ):
+        self.url = url
+        self._default_max_age = default_max_age
+        self._min_refresh_interval = min_refresh_interval
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._expires_at = 0.0
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def get_key(self, kid: str, *, client: httpx.AsyncClient) -> jwt.PyJWK:
+        key = self._keys.get(kid)
+
+        if key is not None:
+            if time.monotonic() >= self._expires_at:
+                # 만료된 키로도 검증은 계속하고, 갱신은 기다리지 않습니다.
+                self._start_refresh(client)
+            return key
+
+        if self._can_refresh():
+            await asyncio.shield(self._start_refresh(client))
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise JWKSError(f"Unknown key id: {kid}")
+        return key
+
+    def _can_refresh(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= self._min_refresh_interval
+        )
+
+    def _start_refresh(self, client: httpx.AsyncClient) -> asyncio.Task[None]:
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh(client))
+        return self._refresh_task
+
+    async def _refresh(self, client: httpx.AsyncClient) -> None:
+        try:
+            response = await client.get(self.url)
+            response.raise_for_status()
+            key_set = jwt.PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, ValueError, jwt.PyJWKSetError) as e:
+            # 기존 키는 유지하고, min_refresh_interval 뒤에 다시 시도할 수 있게 합니다.
+            logger.warning("Failed to refresh JWKS from %s: %s", self.url, e)
+            self._fetched_at = time.monotonic()
+        else:
+            max_age = _max_age(response.headers.get("Cache-Control"))
+            now = time.monotonic()
+
+            keys = cast(list[jwt.PyJWK], key_set.keys)  # type: ignore
+            self._keys = {key.key_id: key for key in keys if key.key_id}
+            self._fetched_at = now
+            self._expires_at = now + (
+                self._default_max_age if max_age is None else max_age
+            )
+        finally:
+            self._refresh_task = None
@@ -1,6 +1,17 @@
 from typing import TypedDict, Unpack
 
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    String,
+    and_,
+    exists,
+    false,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 from typing_extensions import NotRequired, Optional
 
 from app.database.deps import SessionDep
@@ -15,8 +26,7 @@ class AuthInfoCriteria(TypedDict, total=False):
     id: NotRequired[int]
     user_id: NotRequired[Optional[int]]
     verified_email: NotRequired[Optional[str]]
-    kakao_id: NotRequired[Optional[str]]
-    apple_id: NotRequired[Optional[str]]
+    google_id: NotRequired[Optional[str]]
 
 
 @dependency
@@ -51,3 +61,72 @@ class AuthRepository:
         await self.session.flush()
         await self.session.refresh(auth_info)
         return auth_info
+
+    async def upsert_email(self, *, email: str) -> UserAuthInfo:
+        """이메일 인증 정보를 찾거나 만듭니다. 동시에 호출되어도 한 row만 생깁니다."""
+        statement = insert(UserAuthInfo).values(verified_email=email)
+        auth = await self.session.scalar(
+            select(UserAuthInfo)
+            .from_statement(
+                statement.on_conflict_do_update(
+                    index_elements=[UserAuthInfo.verified_email],
+                    # 충돌한 row를 RETURNING으로 돌려받기 위해 같은 값으로 갱신합니다.
+                    set_={"verified_email": statement.excluded.verified_email},
+                ).returning(UserAuthInfo)
+            )
+            .execution_options(populate_existing=True)
+        )
+        assert auth is not None
+        return auth
+
+    async def upsert_google(
+        self, *, google_id: str, email: str | None
+    ) -> UserAuthInfo | None:
+        """
+        google_id로 인증 정보를 찾고, 없으면 같은 이메일의 인증 정보에 연결하고, 그것도 없으면 만듭니다.
+        한 문장(CTE)으로 실행하므로 한 번의 왕복으로 끝납니다.
+
+        동시에 처음 로그인한 다른 요청과 경합해 INSERT가 충돌하면 None을 반환합니다.
+        충돌한 트랜잭션이 끝난 뒤이므로 다시 호출하면 그 row를 찾습니다.
+        """
+        columns = UserAuthInfo.__table__.c
+
+        by_google = (
+            select(*columns).where(UserAuthInfo.google_id == google_id).cte("by_google")
+        )
+        not_found = ~exists(by_google.select())
+
+        linked = (
+            update(UserAuthInfo)
+            .where(
+                UserAuthInfo.verified_email == email if email is not None else false(),
+                not_found,
+            )
+            .values(google_id=google_id)
+            .returning(*columns)
+            .cte("linked")
+        )
+
+        inserted = (
+            insert(UserAuthInfo)
+            .from_select(
+                ["google_id", "verified_email"],
+                select(literal(google_id, String), literal(email, String)).where(
+                    not_found, ~exists(linked.select())
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(*columns)
+            .cte("inserted")
+        )
+
+        # CTE에서 변경한 row는 같은 문장의 다른 부분에서 보이지 않으므로 RETURNING 값을 그대로 사용합니다.
+        result = union_all(
+            by_google.select(), linked.select(), inserted.select()
+        ).subquery()
+
+        return await self.session.scalar(
+            select(aliased(UserAuthInfo, result)).execution_options(
+                populate_existing=True
+            )
+        )
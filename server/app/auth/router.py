@@ -3,14 +3,18 @@ from datetime import datetime, timezone
 from fastapi import Body, status
 
 from app.common.deps import HTTPClientDep
-from app.common.schemas import ValidationResult
 from app.core.router import create_router
-from app.users.schemas import UserCreate
+from app.users.schemas import HandleValidationResult, UserCreate
 from app.users.service import UserService
 
 from .config import auth_settings
 from .deps import CurrentUserOptional, RefreshTokenDep, RegisterAuthDep
-from .providers.google import get_google_login_url, get_google_token, get_google_user
+from .providers.google import (
+    get_google_login_url,
+    get_google_token,
+    get_google_user,
+    verify_google_id_token,
+)
 from .schemas import (
     AuthResponse,
     GoogleCallbackRequest,
@@ -43,9 +47,9 @@ async def get_keys() -> list[PublicJWK]:
 # 삭제?
 @router.post("/validate/handle")
 async def validate_handle(
-    user_service: UserService, handle: str = Body(...)
-) -> ValidationResult:
-    return await user_service.validate_handle(handle=handle)
+    user_service: UserService, handle: str = Body(...), suggest: bool = False
+) -> HandleValidationResult:
+    return await user_service.validate_handle(handle=handle, suggest=suggest)
 
 
 # 삭제?
@@ -89,10 +93,14 @@ async def google_callback(
 ) -> AuthResponse:
     # 1. 토큰 발급
     token_data = await get_google_token(client=client, code=query.code)
-    access_token = token_data["access_token"]
 
-    # 2. 사용자 정보
-    google_user = await get_google_user(client=client, access_token=access_token)
+    # 2. 사용자 정보 (id_token이 없을 때만 userinfo API 호출)
+    if id_token := token_data.get("id_token"):
+        google_user = await verify_google_id_token(client=client, id_token=id_token)
+    else:
+        google_user = await get_google_user(
+            client=client, access_token=token_data["access_token"]
+        )
 
     # 3. 인증 정보 처리
     auth_info = await auth_info_service.authenticate_with_google(
@@ -1,42 +1,37 @@
 from typing import Optional
 
+from fastapi import HTTPException
+
 from app.utils.dependency import dependency
 
 from .models import UserAuthInfo
 from .repository import AuthRepository
 
+_UPSERT_ATTEMPTS = 3
+
 
 @dependency
 class AuthInfoService:
     auth_repository: AuthRepository
 
     async def authenticate_with_email(self, *, email: str) -> UserAuthInfo:
-        existing = await self.auth_repository.find_by_criteria(verified_email=email)
-
-        if existing:
-            return existing
-
-        auth = UserAuthInfo.of_email(email)
-        return await self.auth_repository.save(auth)
+        return await self.auth_repository.upsert_email(email=email)
 
     async def authenticate_with_google(
         self, google_id: str, email: Optional[str] = None
     ) -> UserAuthInfo:
-        existing_auth = await self.auth_repository.find_by_criteria(apple_id=google_id)
-
-        if existing_auth:
-            return existing_auth
-
-        if email:
-            existing_email_auth = await self.auth_repository.find_by_criteria(
-                verified_email=email
+        """
+        google_id -> 같은 이메일 -> 새로 생성 순서로 인증 정보를 찾습니다.
+        처음 로그인하는 요청이 동시에 들어와 INSERT가 충돌하면 먼저 커밋된 row를 다시 찾습니다.
+        """
+        for _ in range(_UPSERT_ATTEMPTS):
+            auth = await self.auth_repository.upsert_google(
+                google_id=google_id, email=email
             )
-            if existing_email_auth:
-                existing_email_auth.google_id = google_id
-                return await self.auth_repository.save(existing_email_auth)
+            if auth is not None:
+                return auth
 
-        new_auth = UserAuthInfo.of_google(google_id=google_id, email=email)
-        return await self.auth_repository.save(new_auth)
+        raise HTTPException(status_code=409, detail="인증 정보를 저장하지 못했습니다.")
 
     async def connect_to_user(
         self, *, auth: UserAuthInfo, user_id: int
@@ -1,11 +1,15 @@
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import jwt
 
+from app.metrics.instruments import jwt_duration_seconds, jwt_verify_total
+from app.utils.cache import TTLCache
+
 from .config import auth_settings
 
 
@@ -48,6 +52,7 @@ def create_jwt_token(
 
     jti = str(uuid.uuid4())
 
+    start = time.perf_counter()
     encoded_jwt = jwt.encode(
         {
             "exp": datetime.now(timezone.utc) + token_type.value.expiry,
@@ -57,10 +62,55 @@ def create_jwt_token(
         },
         auth_settings.PRIVATE_JWK_INSTANCE.key,
         algorithm=auth_settings.ALGORITHM,
+        headers={"kid": auth_settings.PRIVATE_JWK.kid},
     )
+    jwt_duration_seconds.labels("sign").observe(time.perf_counter() - start)
     return encoded_jwt
 
 
+class VerifiedToken(NamedTuple):
+    """서명 검증을 마친 토큰의 클레임"""
+
+    sub: int
+    type: str
+
+
+_verified_tokens = TTLCache[str, VerifiedToken](
+    maxsize=auth_settings.VERIFIED_TOKEN_CACHE_SIZE
+)
+"""
+이미 검증한 토큰 캐시. 토큰 문자열 전체(서명 포함)를 키로 쓰고, 토큰의 exp에 맞춰 만료됩니다.
+"""
+
+
+def _get_verification_key(token: str) -> jwt.PyJWK | None:
+    kid = jwt.get_unverified_header(token).get("kid")
+
+    # kid가 없는 토큰은 kid 헤더를 넣기 전에 발급된 토큰입니다.
+    if kid is None:
+        return auth_settings.PRIVATE_JWK_INSTANCE
+
+    return auth_settings.PUBLIC_JWK_INSTANCES.get(kid)
+
+
+def _verify_jwt_token(token: str) -> VerifiedToken:
+    key = _get_verification_key(token)
+    if key is None:
+        raise jwt.InvalidKeyError("Unknown kid")
+
+    start = time.perf_counter()
+    payload = jwt.decode(
+        token,
+        key.key,
+        algorithms=[auth_settings.ALGORITHM],
+    )
+    jwt_duration_seconds.labels("verify").observe(time.perf_counter() - start)
+    verified = VerifiedToken(sub=int(payload["sub"]), type=payload["type"])
+
+    _verified_tokens.set(token, verified, ttl=payload["exp"] - time.time())
+    return verified
+
+
 def decode_jwt_token(
     token: str,
     *,
@@ -68,20 +118,21 @@ def decode_jwt_token(
 ) -> Optional[int]:
     """JWT 토큰을 디코딩합니다."""
     try:
-        payload = jwt.decode(
-            token,
-            auth_settings.PRIVATE_JWK_INSTANCE.key,
-            algorithms=[auth_settings.ALGORITHM],
-        )
-        sub: str = payload.get("sub")
-
-        if token_type.value.type != payload.get("type"):
-            raise jwt.PyJWTError()
-
-        return int(sub)
-    except jwt.PyJWTError:
+        verified = _verified_tokens.get(token)
+        if verified is None:
+            verified = _verify_jwt_token(token)
+            jwt_verify_total.labels("verified").inc()
+        else:
+            jwt_verify_total.labels("cache_hit").inc()
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        jwt_verify_total.labels("invalid").inc()
+        return None
+
+    if token_type.value.type != verified.type:
         return None
 
+    return verified.sub
+
 
 def create_token_pair(user_id: int) -> tuple[str, str]:
     """Access token과 refresh token 쌍을 생성합니다."""
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Conditional GET에 사용하는 ETag / Last-Modified 값"""
+
+    etag: str
+    last_modified: datetime
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            # 캐시는 하되 사용할 때마다 서버에 재검증하도록 합니다.
+            "Cache-Control": "private, no-cache",
+        }
+
+
+def make_validators(resource: str, version: datetime) -> Validators:
+    """
+    리소스의 버전(updated_at)으로 strong ETag를 만듭니다.
+    DB의 updated_at은 timezone 없이 저장되므로 UTC로 간주합니다.
+    """
+    if version.tzinfo is None:
+        version = version.replace(tzinfo=timezone.utc)
+
+    micros = (version - _EPOCH) // timedelta(microseconds=1)
+    return Validators(
+        etag=f'"{resource}-{micros:x}"',
+        last_modified=version.replace(microsecond=0),
+    )
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match는 weak 비교를 사용합니다.
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """If-None-Match가 있으면 그것만, 없으면 If-Modified-Since로 판단합니다."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    return validators.last_modified <= since
+
+
+def not_modified_response(validators: Validators) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+    )
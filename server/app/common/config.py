@@ -0,0 +1,53 @@
+from app.config import BaseConfig
+
+
+class HTTPClientConfig(BaseConfig):
+    HTTP_MAX_CONNECTIONS: int = 100
+    """워커별 외부 API 동시 커넥션 수"""
+
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    """요청이 끝난 뒤에도 열어두는 커넥션 수"""
+
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    """유휴 커넥션을 닫기까지의 시간 (초)"""
+
+    HTTP2: bool = False
+    """HTTP/2 사용 여부. h2 패키지(httpx[http2])가 필요하며, 없으면 HTTP/1.1로 동작합니다."""
+
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_TIMEOUT: float = 10.0
+    """커넥션 생성을 제외한 읽기/쓰기/풀 대기 타임아웃 (초)"""
+
+    HTTP_HOST_TIMEOUTS: dict[str, float] = {}
+    """호스트별 타임아웃 (초). 예: {"oauth2.googleapis.com": 5}"""
+
+    HTTP_RETRIES: int = 2
+    """
+    실패한 요청을 다시 시도하는 횟수.
+    커넥션을 맺지 못한 경우는 모든 메서드를, 응답을 받지 못했거나 5xx를 받은 경우는 GET 등 멱등 메서드만 재시도합니다.
+    """
+
+    HTTP_RETRY_BACKOFF: float = 0.2
+    """첫 재시도 전 대기 시간 (초). 재시도마다 두 배씩 늘어납니다."""
+
+    HTTP_RETRY_BACKOFF_MAX: float = 2.0
+
+    HTTP_HOST_OVERRIDES: dict[str, str] = {}
+    """
+    호스트별로 요청을 보낼 주소를 바꿉니다. 로컬 stub 서버로 부하 테스트할 때 사용합니다.
+    예: {"oauth2.googleapis.com": "http://localhost:9000"}
+    """
+
+
+http_client_settings = HTTPClientConfig.create()
+
+
+class ProcessPoolConfig(BaseConfig):
+    PROCESS_POOL_WORKERS: int = 2
+    """워커(uvicorn 프로세스)마다 CPU 작업(파일 분석 등)에 사용하는 프로세스 수"""
+
+    PROCESS_POOL_MAX_TASKS_PER_CHILD: int = 100
+    """프로세스 하나가 처리한 뒤 새 프로세스로 교체되는 작업 수. 파서의 메모리 누수를 막습니다."""
+
+
+process_pool_settings = ProcessPoolConfig.create()
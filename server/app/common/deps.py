@@ -1,23 +1,25 @@
-from typing import Annotated  # , Optional
+from typing import Annotated, Optional
 
-from fastapi import Depends  # , Query
+from fastapi import Depends, Query
 from httpx import AsyncClient
 
-# from .schemas import PaginationParams
+from .http import get_shared_http_client
+from .schemas import PaginationParams
 
 
-async def get_http_client():
-    async with AsyncClient() as client:
-        yield client
+def get_http_client() -> AsyncClient:
+    return get_shared_http_client()
 
 
 HTTPClientDep = Annotated[AsyncClient, Depends(get_http_client)]
 
 
-# def get_pagination_params(
-#     cursor: Annotated[Optional[int], Query()] = None,
-# ) -> PaginationParams:
-#     return PaginationParams(cursor=cursor)
+def get_pagination_params(
+    cursor: Annotated[Optional[str], Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    with_count: Annotated[bool, Query()] = False,
+) -> PaginationParams:
+    return PaginationParams(cursor=cursor, limit=limit, with_count=with_count)
 
 
-# PaginationDep = Annotated[PaginationParams, Depends(get_pagination_params)]
+PaginationDep = Annotated[PaginationParams, Depends(get_pagination_params)]
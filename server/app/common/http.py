@@ -0,0 +1,211 @@
+"""
+외부 API 호출에 사용하는 공유 httpx.AsyncClient
+
+요청마다 클라이언트를 만들면 매번 TCP/TLS 연결을 새로 맺으므로, 워커별로 하나의 클라이언트를 두고
+lifespan에서 정리합니다.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app.metrics.instruments import (
+    http_client_request_duration_seconds,
+    http_client_responses_total,
+)
+
+from .config import http_client_settings
+
+logger = logging.getLogger(__name__)
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """호스트별 타임아웃, 주소 변경, 재시도를 적용하는 transport"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        retries: int,
+        backoff: float,
+        backoff_max: float,
+        host_timeouts: dict[str, float],
+        host_overrides: dict[str, str],
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+        self._host_timeouts = host_timeouts
+        self._host_overrides = {
+            host: httpx.URL(url) for host, url in host_overrides.items()
+        }
+
+    def _prepare(self, request: httpx.Request) -> None:
+        host = request.url.host
+
+        timeout = self._host_timeouts.get(host)
+        if timeout is not None:
+            request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+
+        override = self._host_overrides.get(host)
+        if override is not None:
+            request.url = request.url.copy_with(
+                scheme=override.scheme, host=override.host, port=override.port
+            )
+            request.headers["Host"] = request.url.netloc.decode("ascii")
+
+    def _delay(self, attempt: int, response: httpx.Response | None) -> float:
+        delay = min(self._backoff * 2**attempt, self._backoff_max)
+
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after:
+            delay = max(delay, _parse_retry_after(retry_after))
+
+        # 여러 워커가 같은 시점에 다시 몰리지 않도록 지터를 줍니다.
+        return min(delay, self._backoff_max) * random.uniform(0.5, 1.0)
+
+    async def _send(self, request: httpx.Request, host: str) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            http_client_responses_total.labels(host, request.method, "error").inc()
+            raise
+        finally:
+            http_client_request_duration_seconds.labels(host, request.method).observe(
+                time.perf_counter() - start
+            )
+
+        http_client_responses_total.labels(
+            host, request.method, str(response.status_code)
+        ).inc()
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # 주소를 바꾸기 전의 호스트로 기록합니다.
+        host = request.url.host
+        self._prepare(request)
+        idempotent = request.method in _IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            response: httpx.Response | None = None
+            try:
+                response = await self._send(request, host)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # 요청이 서버에 닿지 않았으므로 POST도 재시도할 수 있습니다.
+                if attempt >= self._retries:
+                    raise
+            except (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError):
+                if not idempotent or attempt >= self._retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUS_CODES
+                    or not idempotent
+                    or attempt >= self._retries
+                ):
+                    return response
+                await response.aclose()
+
+            delay = self._delay(attempt, response)
+            attempt += 1
+            logger.warning(
+                "Retrying %s %s (attempt %d) in %.2fs",
+                request.method,
+                request.url.host,
+                attempt,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _parse_retry_after(value: str) -> float:
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+_transport: httpx.AsyncBaseTransport | None = None
+_client: httpx.AsyncClient | None = None
+
+
+def set_http_transport(transport: httpx.AsyncBaseTransport | None) -> None:
+    """
+    공유 클라이언트가 사용할 transport를 바꿉니다. (httpx.MockTransport, stub 서버 등)
+    재시도와 호스트별 설정은 주입한 transport 위에 그대로 적용됩니다. 다음에 만드는 클라이언트부터 반영됩니다.
+    """
+    global _transport
+    _transport = transport
+
+
+def _create_base_transport() -> httpx.AsyncBaseTransport:
+    limits = httpx.Limits(
+        max_connections=http_client_settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=http_client_settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=http_client_settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+    http2 = http_client_settings.HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("h2 is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    transport = RetryTransport(
+        _transport or _create_base_transport(),
+        retries=http_client_settings.HTTP_RETRIES,
+        backoff=http_client_settings.HTTP_RETRY_BACKOFF,
+        backoff_max=http_client_settings.HTTP_RETRY_BACKOFF_MAX,
+        host_timeouts=http_client_settings.HTTP_HOST_TIMEOUTS,
+        host_overrides=http_client_settings.HTTP_HOST_OVERRIDES,
+    )
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            http_client_settings.HTTP_TIMEOUT,
+            connect=http_client_settings.HTTP_CONNECT_TIMEOUT,
+        ),
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """워커의 공유 클라이언트. lifespan 밖(스크립트 등)에서 처음 사용할 때도 만들어집니다."""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,64 @@
+"""
+CPU를 오래 사용하는 작업(PDF 분석 등)을 이벤트 루프 밖에서 실행하는 공유 ProcessPoolExecutor
+
+스레드로 실행하면 GIL 때문에 이벤트 루프가 함께 느려지므로 별도 프로세스에서 실행합니다.
+실행할 함수와 인자, 반환값은 pickle 할 수 있어야 하며, 함수가 있는 모듈은 가볍게 import 되어야 합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable
+
+from .config import process_pool_settings
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """워커의 공유 프로세스 풀. 처음 사용할 때 만들어집니다."""
+    global _pool
+
+    if _pool is None:
+        # 이벤트 루프와 로그 스레드가 있는 프로세스를 fork 하지 않도록 forkserver로 시작합니다.
+        _pool = ProcessPoolExecutor(
+            max_workers=process_pool_settings.PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+            max_tasks_per_child=process_pool_settings.PROCESS_POOL_MAX_TASKS_PER_CHILD,
+        )
+
+    return _pool
+
+
+async def run_in_process[R](
+    func: Callable[..., R], *args: Any, timeout: float | None = None, **kwargs: Any
+) -> R:
+    """
+    func를 프로세스 풀에서 실행하고 결과를 기다립니다.
+    timeout이 지나면 TimeoutError가 발생하지만, 이미 실행 중인 작업은 끝날 때까지 프로세스를 점유합니다.
+    """
+    global _pool
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(get_process_pool(), partial(func, *args, **kwargs))
+
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except BrokenProcessPool:
+        # 프로세스가 비정상 종료되면 풀을 더 사용할 수 없으므로 다음 호출에서 새로 만듭니다.
+        logger.exception("Process pool is broken, recreating")
+        _pool = None
+        raise
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
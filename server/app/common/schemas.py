@@ -1,4 +1,4 @@
-from typing import TypeVar  # Generic, List,
+from typing import Generic, List, TypeVar
 
 from app.schemas import APISchema
 
@@ -14,14 +14,19 @@ class ValidationResult(APISchema):
     error: str | None
 
 
-# class PaginationParams(APISchema):
-#     cursor: int | None
+class PaginationParams(APISchema):
+    cursor: str | None
+    """이전 페이지 응답의 next_cursor. 첫 페이지는 None"""
 
+    limit: int
+    with_count: bool
+    """전체 개수(total_count)를 함께 계산할지 여부. 추가 COUNT 쿼리가 발생합니다."""
 
-# class Page(APISchema, Generic[T]):
-#     list: List[T]
-#     next_cursor: int | None
 
+class Page(APISchema, Generic[T]):
+    list: List[T]
+    next_cursor: str | None
 
-# class PageWithCount(Page[T], Generic[T]):
-#     total_count: int
+
+class PageWithCount(Page[T], Generic[T]):
+    total_count: int
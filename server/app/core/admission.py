@@ -0,0 +1,47 @@
+import asyncio
+from types import TracebackType
+
+
+class OverloadedError(Exception):
+    """동시 처리 수와 대기열이 모두 찼거나, 대기 시간 안에 차례가 오지 않은 경우"""
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 limit개까지 실행하고, 넘는 요청은 max_waiting개까지 timeout 동안 순서대로 기다립니다.
+    대기열이 가득 찼으면 기다리지 않고 바로 OverloadedError가 발생합니다.
+    단일 이벤트 루프 안에서 사용하는 것을 전제로 합니다.
+    """
+
+    def __init__(self, limit: int, *, max_waiting: int, timeout: float):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self._max_waiting = max_waiting
+        self._timeout = timeout
+        self.active = 0
+        self.waiting = 0
+
+    async def __aenter__(self) -> None:
+        if self._semaphore.locked():
+            if self.waiting >= self._max_waiting:
+                raise OverloadedError
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self._timeout)
+            except TimeoutError:
+                raise OverloadedError
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.active -= 1
+        self._semaphore.release()
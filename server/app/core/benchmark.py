@@ -0,0 +1,146 @@
+"""
+FastJSONRoute와 기본 라우트(LoggingRoute)의 응답 비용을 비교합니다.
+
+    uv run poe bench-fast-json
+    uv run poe bench-fast-json --items 200 --requests 300
+
+항공/일정/지출을 각각 items개 가진 여행 계획을 두 라우트에서 돌려주고, ASGI로 직접 요청해
+한 요청당 시간과 두 응답 본문이 같은지 출력합니다. DB는 사용하지 않습니다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.plans.schemas import PlanReadWithInforms
+
+from .router import create_router
+
+
+def build_plan(items: int) -> PlanReadWithInforms:
+    start = date(2026, 1, 1)
+    departure = datetime(2026, 1, 1, 9)
+
+    return PlanReadWithInforms.model_validate(
+        {
+            "id": 1,
+            "title": "benchmark",
+            "start_date": start,
+            "end_date": start + timedelta(days=items // 10 + 1),
+            "total_amount": sum(1000 + i for i in range(items)),
+            "flights": [
+                {
+                    "id": i,
+                    "airline": "KE",
+                    "flight_number": f"KE{i:04d}",
+                    "departure_airport": "ICN",
+                    "arrival_airport": "NRT",
+                    "departure_time": departure + timedelta(days=i),
+                    "arrival_time": departure + timedelta(days=i, hours=2),
+                    "seat_class": "economy",
+                    "seat_number": f"{i % 60 + 1}A",
+                }
+                for i in range(items)
+            ],
+            "itineraries": [
+                {
+                    "id": i,
+                    "title": f"일정 {i}",
+                    "description": "벤치마크용 일정",
+                    "country": "JP",
+                    "city": "Tokyo",
+                    "location": "Shibuya",
+                    "date": start + timedelta(days=i // 10),
+                    "start_time": dt_time(8 + i % 10),
+                    "end_time": dt_time(8 + i % 10, 50),
+                }
+                for i in range(items)
+            ],
+            "expenses": [
+                {
+                    "id": i,
+                    "category": "food",
+                    "amount": 1000 + i,
+                    "currency": "KRW",
+                    "home_amount": 1000 + i,
+                    "description": f"지출 {i}",
+                    "date": start + timedelta(days=i // 10),
+                }
+                for i in range(items)
+            ],
+        }
+    )
+
+
+def build_app(plan: PlanReadWithInforms) -> FastAPI:
+    """같은 엔드포인트를 /default (LoggingRoute)와 /fast (FastJSONRoute)에 둡니다."""
+    app = FastAPI()
+
+    for prefix, fast_json in (("/default", False), ("/fast", True)):
+        router = create_router(fast_json=fast_json)
+
+        @router.get("/plan", response_model=PlanReadWithInforms)
+        async def read_plan(response: Response) -> PlanReadWithInforms:
+            response.headers["ETag"] = '"benchmark"'
+            return plan
+
+        app.include_router(router, prefix=prefix)
+
+    return app
+
+
+async def measure(
+    client: httpx.AsyncClient, path: str, *, requests: int
+) -> tuple[float, bytes]:
+    """한 요청당 시간 (초)과 응답 본문"""
+    warmup = await client.get(path)
+    warmup.raise_for_status()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+    return (time.perf_counter() - start) / requests, warmup.content
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args(sys.argv[1:])
+
+    app = build_app(build_plan(args.items))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        default_time, default_body = await measure(
+            client, "/default/plan", requests=args.requests
+        )
+        fast_time, fast_body = await measure(
+            client, "/fast/plan", requests=args.requests
+        )
+
+    print(
+        f"items={args.items} requests={args.requests} body={len(fast_body) / 1024:.0f} KiB"
+    )
+    print(f"default route   {default_time * 1000:>7.2f} ms/req")
+    print(f"fast JSON route {fast_time * 1000:>7.2f} ms/req")
+
+    # 두 라우트의 응답이 달라지면 벤치마크 결과도 의미가 없으므로 실패로 끝냅니다.
+    if json.loads(default_body) != json.loads(fast_body):
+        print("responses differ")
+        return 1
+    print(f"responses identical: {default_body == fast_body}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Literal
 
 from app.config import BaseConfig
 
@@ -12,5 +13,99 @@ class Environment(str, Enum):
 class CoreConfig(BaseConfig):
     ENVIRONMENT: Environment = Environment.LOCAL
 
+    LOG_JSON: bool | None = None
+    """로그를 JSON 한 줄로 출력할지 여부 (기본값: prod에서만 켜짐)"""
+
+    REQUEST_ID_HEADER: str = "X-Request-ID"
+    """요청 ID를 주고받을 헤더. 클라이언트가 보낸 값이 있으면 그대로 사용합니다."""
+
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    """성공 응답의 access log를 남길 비율 (0~1). 5xx 응답은 항상 남깁니다."""
+
+    ACCESS_LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {}
+    """라우트 경로 템플릿별 샘플링 비율. 예: {"/private/plans/{plan_id}": 0.1}"""
+
+    ACCESS_LOG_BODY: bool | None = None
+    """응답 body를 access log에 포함할지 여부 (기본값: prod에서만 꺼짐)"""
+
+    ACCESS_LOG_BODY_MAX_BYTES: int = 1024
+    """access log에 포함할 응답 body 최대 길이"""
+
+    @property
+    def log_json(self) -> bool:
+        if self.LOG_JSON is None:
+            return self.ENVIRONMENT == Environment.PROD
+        return self.LOG_JSON
+
+    @property
+    def access_log_body(self) -> bool:
+        if self.ACCESS_LOG_BODY is None:
+            return self.ENVIRONMENT != Environment.PROD
+        return self.ACCESS_LOG_BODY
+
 
 core_settings = CoreConfig.create()
+
+
+class RateLimitConfig(BaseConfig):
+    RATE_LIMIT_ENABLED: bool = True
+
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    """
+    memory는 워커마다 따로 세므로 실제 한도는 워커 수만큼 늘어납니다.
+    워커나 서버가 여럿이면 redis로 한도를 공유합니다.
+    """
+
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+
+    RATE_LIMIT_USER_RATE: float = 10.0
+    """로그인한 유저별로 초당 채워지는 요청 수"""
+
+    RATE_LIMIT_USER_BURST: int = 50
+    """로그인한 유저가 한 번에 보낼 수 있는 최대 요청 수"""
+
+    RATE_LIMIT_ANONYMOUS_RATE: float = 2.0
+    """토큰이 없거나 잘못된 요청의 IP별 초당 요청 수 (로그인, 회원가입 등)"""
+
+    RATE_LIMIT_ANONYMOUS_BURST: int = 20
+
+    RATE_LIMIT_EXEMPT_PATHS: list[str] = ["/", "/docs", "/openapi.json", "/metrics"]
+
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    """
+    X-Forwarded-For의 첫 번째 주소를 클라이언트 IP로 사용합니다.
+    앞단의 게이트웨이가 헤더를 덮어쓰는 경우에만 켭니다. (직접 받으면 클라이언트가 위조할 수 있습니다.)
+    """
+
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 100_000
+    """memory 백엔드가 기억하는 유저/IP 수. 넘으면 가장 오래 쓰이지 않은 것부터 잊습니다."""
+
+
+rate_limit_settings = RateLimitConfig.create()
+
+
+class AdmissionConfig(BaseConfig):
+    ROUTE_CONCURRENCY_LIMIT: int | None = 4
+    """
+    라우트별로 워커에서 동시에 처리하는 요청 수. None이면 제한하지 않습니다.
+    DB 커넥션(POOL_SIZE + POOL_MAX_OVERFLOW)보다 작게 두어 한 라우트에 몰린 요청이
+    커넥션을 모두 차지하지 못하게 합니다.
+    """
+
+    ROUTE_CONCURRENCY_LIMITS: dict[str, int | None] = {}
+    """라우트 경로 템플릿별 동시 처리 수. 예: {"/private/expenses/{plan_id}/import": 1}"""
+
+    ROUTE_QUEUE_SIZE: int = 16
+    """동시 처리 수를 넘은 요청이 기다릴 수 있는 수. 넘으면 바로 503으로 응답합니다."""
+
+    ROUTE_QUEUE_TIMEOUT: float = 5.0
+    """
+    대기 중인 요청이 이 시간 안에 처리되지 않으면 503으로 응답합니다. (초)
+    POOL_TIMEOUT보다 짧게 두어 커넥션 풀에서 오래 기다리기 전에 포기합니다.
+    """
+
+    ROUTE_RETRY_AFTER: int = 1
+    """503 응답의 Retry-After (초)"""
+
+
+admission_settings = AdmissionConfig.create()
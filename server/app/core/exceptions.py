@@ -3,7 +3,7 @@ import logging
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 
-# from app.storage.exceptions import StorageError
+from app.storage.exceptions import StorageError
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -15,6 +15,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail},
+            headers=exc.headers,
         )
 
     @app.exception_handler(Exception)
@@ -24,10 +25,10 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=500, content={"detail": "Internal server error"}
         )
 
-    # @app.exception_handler(StorageError)
-    # async def storage_error_handler(request: Request, exc: StorageError):  # type: ignore
-    #     logger.error(f"Storage error: {str(exc)}")
-    #     return JSONResponse(
-    #         status_code=exc.status_code,
-    #         content={"detail": exc.detail},
-    #     )
+    @app.exception_handler(StorageError)
+    async def storage_error_handler(request: Request, exc: StorageError):  # type: ignore
+        logger.error(f"Storage error: {str(exc)}")
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+        )
@@ -0,0 +1,47 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+from fastapi import FastAPI
+
+from app.common.http import close_http_client, get_shared_http_client
+from app.common.process import shutdown_process_pool
+from app.core.ratelimit import close_rate_limit_backend, start_rate_limit_backend
+from app.database.engine import dispose_engines, warmup_pool
+from app.database.notify import pg_listener
+from app.jobs import handlers as _  # noqa: F401
+from app.jobs.config import job_settings
+from app.jobs.worker import job_worker
+from app.metrics.multiprocess import metrics_flusher
+from app.plans.events import plan_event_hub
+from app.storage import close_storage
+from app.users.cache import start_user_cache_invalidation
+from app.users.handles import handle_index, start_handle_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """앱 시작/종료 시 공유 리소스를 준비하고 정리합니다."""
+    await warmup_pool()
+    await start_rate_limit_backend()
+    await start_user_cache_invalidation()
+    await start_handle_index()
+    await plan_event_hub.start()
+    get_shared_http_client()
+    await metrics_flusher.start()
+    if job_settings.JOB_WORKER_IN_PROCESS:
+        await job_worker.start()
+
+    try:
+        yield
+    finally:
+        if job_settings.JOB_WORKER_IN_PROCESS:
+            await job_worker.stop()
+        shutdown_process_pool()
+        await metrics_flusher.stop()
+        await close_http_client()
+        await close_storage()
+        await close_rate_limit_backend()
+        await handle_index.stop()
+        await plan_event_hub.stop()
+        await pg_listener.stop()
+        await dispose_engines()
@@ -1,4 +1,11 @@
+import atexit
+import json
 import logging
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 from app.core.config import Environment, core_settings
 
@@ -14,14 +21,101 @@ def get_log_level() -> str:
     return _LOG_LEVEL_MAP.get(core_settings.ENVIRONMENT, "INFO")
 
 
-LOG_FORMAT_DEBUG = "%(levelname)s:%(message)s:%(pathname)s:%(funcName)s:%(lineno)d"
+LOG_FORMAT_DEBUG = (
+    "%(levelname)s:[%(request_id)s] %(message)s:%(pathname)s:%(funcName)s:%(lineno)d"
+)
+LOG_FORMAT = "%(levelname)s:%(name)s:[%(request_id)s] %(message)s"
+
+ACCESS_LOGGER_NAME = "api"
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+"""현재 요청의 ID. 요청 처리 중에 남기는 모든 로그에 함께 기록됩니다."""
+
+_RESERVED_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__.keys()
+    | {"message", "asctime", "request_id"}
+)
+
+_listener: QueueListener | None = None
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청 ID를 붙입니다."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 출력합니다. extra로 넘긴 필드도 함께 출력합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        request_id = getattr(record, "request_id", "-")
+        if request_id != "-":
+            data["request_id"] = request_id
+
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                data[key] = value
+
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _create_formatter(log_level: str) -> logging.Formatter:
+    if core_settings.log_json:
+        return JSONFormatter()
+    if log_level in ["DEBUG", "INFO"]:
+        return logging.Formatter(LOG_FORMAT_DEBUG)
+    return logging.Formatter(LOG_FORMAT)
 
 
 def configure_logging():
+    """
+    로그 출력(stdout/stderr I/O)이 이벤트 루프를 막지 않도록
+    QueueHandler로 레코드만 넘기고, 실제 출력은 QueueListener 스레드에서 처리합니다.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
     log_level = get_log_level()
 
-    if log_level in ["DEBUG", "INFO"]:
-        logging.basicConfig(level=log_level, format=LOG_FORMAT_DEBUG)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_create_formatter(log_level))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    queue_handler.addFilter(RequestIdFilter())
+
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
+
+    # access log는 샘플링으로 양을 조절하므로 환경과 관계없이 남깁니다.
+    logging.getLogger(ACCESS_LOGGER_NAME).setLevel(logging.INFO)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 출력하고 QueueListener를 종료합니다."""
+    global _listener
+
+    if _listener is None:
         return
 
-    logging.basicConfig(level=log_level)
+    _listener.stop()
+    _listener = None
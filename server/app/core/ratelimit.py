@@ -0,0 +1,234 @@
+"""
+유저/IP별 token bucket 요청 수 제한
+
+인증 토큰이 있으면 유저별로, 없거나 잘못된 토큰이면 IP별로 셉니다. 한도를 넘은 요청은 라우트와
+DB 커넥션에 닿기 전에 429와 Retry-After로 응답합니다.
+"""
+
+import json
+import logging
+import math
+import time
+from typing import Protocol, cast
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.connection import parse_url
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.auth.token import decode_jwt_token
+from app.metrics.instruments import http_rate_limited_total
+from app.utils.cache import TTLCache
+
+from .config import rate_limit_settings
+
+logger = logging.getLogger(__name__)
+
+_AUTH_HEADER = b"x-auth-token"
+_FORWARDED_FOR_HEADER = b"x-forwarded-for"
+
+
+class RateLimitBackend(Protocol):
+    async def start(self) -> None: ...
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        """요청 하나를 허용하면 0, 아니면 다시 시도할 수 있을 때까지의 시간 (초)"""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class MemoryRateLimitBackend:
+    """
+    워커 메모리에 bucket을 둡니다.
+    가득 찰 만큼 시간이 지난 bucket은 새 bucket과 같으므로 그때 만료시켜 메모리를 돌려받습니다.
+    """
+
+    def __init__(self, *, max_keys: int):
+        self._buckets = TTLCache[str, _Bucket](maxsize=max_keys)
+
+    async def start(self) -> None:
+        pass
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(float(burst), now)
+        else:
+            bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated_at) * rate)
+            bucket.updated_at = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - bucket.tokens) / rate
+
+        self._buckets.set(key, bucket, ttl=(burst - bucket.tokens) / rate)
+        return retry_after
+
+    async def close(self) -> None:
+        pass
+
+
+# 여러 워커가 같은 bucket을 쓰므로 읽고 고치는 과정을 Redis 안에서 한 번에 실행합니다.
+# 시간은 워커마다 시계가 다를 수 있어 Redis 서버 시간을 사용합니다.
+_REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimitBackend:
+    """워커와 서버가 Redis의 bucket을 함께 씁니다."""
+
+    def __init__(self, url: str):
+        # Redis.from_url과 같습니다. from_url은 **kwargs에 타입이 없어 직접 만듭니다.
+        self._redis = Redis.from_pool(ConnectionPool(**parse_url(url)))
+        self._script = self._redis.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def start(self) -> None:
+        # 주소나 인증 설정이 잘못되었으면 요청을 받기 전에 앱 시작을 실패시킵니다.
+        connection = self._redis.connection_pool.make_connection()
+        try:
+            await connection.connect()
+        finally:
+            await connection.disconnect()
+
+    async def acquire(self, key: str, *, rate: float, burst: int) -> float:
+        result = await self._script(keys=[f"ratelimit:{key}"], args=[rate, burst])
+        return float(result)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """RATE_LIMIT_BACKEND 설정에 따른 공유 백엔드"""
+    global _backend
+    if _backend is None:
+        if rate_limit_settings.RATE_LIMIT_BACKEND == "redis":
+            _backend = RedisRateLimitBackend(rate_limit_settings.RATE_LIMIT_REDIS_URL)
+        else:
+            _backend = MemoryRateLimitBackend(
+                max_keys=rate_limit_settings.RATE_LIMIT_MEMORY_MAX_KEYS
+            )
+    return _backend
+
+
+async def start_rate_limit_backend() -> None:
+    """
+    lifespan에서 공유 백엔드를 미리 만들고 연결을 확인합니다.
+    요청 중의 백엔드 장애는 통과시키므로, 설정 오류는 여기서 드러나야 합니다.
+    """
+    if rate_limit_settings.RATE_LIMIT_ENABLED:
+        await get_rate_limit_backend().start()
+
+
+async def close_rate_limit_backend() -> None:
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+    _backend = None
+
+
+def _client_ip(scope: Scope, headers: dict[bytes, bytes]) -> str:
+    if rate_limit_settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded_for = headers.get(_FORWARDED_FOR_HEADER)
+        if forwarded_for:
+            return forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    HTTP 요청마다 bucket에서 토큰 하나를 꺼냅니다.
+    공유 백엔드에 장애가 나면 요청을 막지 않고 통과시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp, backend: RateLimitBackend | None = None):
+        self.app = app
+        self._backend = backend
+        self._exempt_paths = frozenset(rate_limit_settings.RATE_LIMIT_EXEMPT_PATHS)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(cast(list[tuple[bytes, bytes]], scope["headers"]))
+        token = headers.get(_AUTH_HEADER)
+        # 검증한 토큰은 캐시되므로 라우트에서 다시 검증할 때는 비용이 거의 없습니다.
+        user_id = decode_jwt_token(token.decode("latin-1")) if token else None
+
+        if user_id is not None:
+            kind = "user"
+            key = f"user:{user_id}"
+            rate = rate_limit_settings.RATE_LIMIT_USER_RATE
+            burst = rate_limit_settings.RATE_LIMIT_USER_BURST
+        else:
+            kind = "ip"
+            key = f"ip:{_client_ip(scope, headers)}"
+            rate = rate_limit_settings.RATE_LIMIT_ANONYMOUS_RATE
+            burst = rate_limit_settings.RATE_LIMIT_ANONYMOUS_BURST
+
+        try:
+            backend = self._backend or get_rate_limit_backend()
+            retry_after = await backend.acquire(key, rate=rate, burst=burst)
+        except Exception:
+            logger.exception("Rate limit backend failed")
+            retry_after = 0.0
+
+        if retry_after <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        http_rate_limited_total.labels(kind).inc()
+        await _send_too_many_requests(send, math.ceil(retry_after))
+
+
+async def _send_too_many_requests(send: Send, retry_after: int) -> None:
+    body = json.dumps(
+        {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."},
+        ensure_ascii=False,
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
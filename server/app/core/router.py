@@ -1,34 +1,187 @@
-# app/logging/routes.py
+import inspect
 import logging
+import random
 import time
 import uuid
-from functools import partial
+from functools import cached_property, wraps
+from typing import Any, Awaitable, Callable
 
-from fastapi import APIRouter, Request, Response
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
 
-logger = logging.getLogger("api")
+from app.core.admission import ConcurrencyLimiter, OverloadedError
+from app.core.config import admission_settings, core_settings
+from app.core.logging import ACCESS_LOGGER_NAME, request_id_var
+from app.metrics.instruments import (
+    RequestStats,
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_responses_total,
+    request_stats_var,
+)
+from app.storage.exceptions import StorageError
+
+logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+def _get_request_id(request: Request) -> str:
+    request_id = request.headers.get(core_settings.REQUEST_ID_HEADER)
+    if request_id and len(request_id) <= _MAX_REQUEST_ID_LENGTH:
+        return request_id
+    return uuid.uuid4().hex
+
+
+def _capture_body(response: Response) -> str | None:
+    # StreamingResponse, FileResponse는 body가 없으므로 기록하지 않습니다.
+    body = getattr(response, "body", None)
+    if not isinstance(body, bytes):
+        return None
+
+    max_bytes = core_settings.ACCESS_LOG_BODY_MAX_BYTES
+    captured = body[:max_bytes].decode("utf-8", errors="replace")
+    if len(body) > max_bytes:
+        captured += f"...(truncated, {len(body)} bytes)"
+    return captured
 
 
 class LoggingRoute(APIRoute):
+    @cached_property
+    def _limiter(self) -> ConcurrencyLimiter | None:
+        """라우트의 동시 처리 수 제한 (admission_settings)"""
+        limit = admission_settings.ROUTE_CONCURRENCY_LIMITS.get(
+            self.path_format, admission_settings.ROUTE_CONCURRENCY_LIMIT
+        )
+        if limit is None:
+            return None
+        return ConcurrencyLimiter(
+            limit,
+            max_waiting=admission_settings.ROUTE_QUEUE_SIZE,
+            timeout=admission_settings.ROUTE_QUEUE_TIMEOUT,
+        )
+
+    async def _admit(
+        self, handler: Callable[[Request], Awaitable[Response]], request: Request
+    ) -> Response:
+        if self._limiter is None:
+            return await handler(request)
+
+        try:
+            async with self._limiter:
+                return await handler(request)
+        except OverloadedError:
+            # 기다리는 요청이 쌓여 DB 커넥션 풀에서 오래 대기하기 전에 바로 거절합니다.
+            raise HTTPException(
+                status_code=503,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(admission_settings.ROUTE_RETRY_AFTER)},
+            )
+
+    def _should_log(self, status_code: int) -> bool:
+        if status_code >= 500:
+            return True
+
+        sample_rate = core_settings.ACCESS_LOG_ROUTE_SAMPLE_RATES.get(
+            self.path_format, core_settings.ACCESS_LOG_SAMPLE_RATE
+        )
+        return sample_rate >= 1 or random.random() < sample_rate
+
+    def _log_access(
+        self,
+        request: Request,
+        *,
+        status_code: int,
+        start_time: float,
+        response: Response | None = None,
+    ) -> None:
+        if not self._should_log(status_code):
+            return
+
+        process_time = (time.perf_counter() - start_time) * 1000
+        extra: dict[str, Any] = {
+            "method": request.method,
+            "path": request.url.path,
+            "route": self.path_format,
+            "status": status_code,
+            "duration_ms": round(process_time, 2),
+        }
+        message = f"{request.method} {request.url.path} status={status_code} time={process_time:.2f}ms"
+
+        if response is not None and core_settings.access_log_body:
+            extra["response"] = _capture_body(response)
+            if not core_settings.log_json:
+                message += f" response={extra['response']}"
+
+        logger.info(message, extra=extra)
+
+    def _record_metrics(
+        self,
+        request: Request,
+        *,
+        status_code: int,
+        start_time: float,
+        stats: RequestStats,
+    ) -> None:
+        route, method = self.path_format, request.method
+        http_request_duration_seconds.labels(route, method).observe(
+            time.perf_counter() - start_time
+        )
+        http_responses_total.labels(route, method, str(status_code)).inc()
+        http_request_db_queries.labels(route).observe(stats.queries)
+
     def get_route_handler(self):
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
-            request_id = str(uuid.uuid4())
-            start_time = time.time()
+            request_id = _get_request_id(request)
+            request_id_var.set(request_id)
+            stats = RequestStats(self.path_format)
+            request_stats_var.set(stats)
+            in_flight = http_requests_in_flight.labels(self.path_format, request.method)
+            in_flight.inc()
+            # 응답 전에 취소된 요청(클라이언트 연결 끊김)은 499로 기록합니다.
+            status_code = 499
+            start_time = time.perf_counter()
 
-            logger.info(
-                f"Request started: {request.method} {request.url.path} [{request_id}]"
-            )
-
-            response = await original_route_handler(request)
+            try:
+                response = await self._admit(original_route_handler, request)
+                status_code = response.status_code
+            except HTTPException as exc:
+                status_code = exc.status_code
+                exc.headers = {
+                    **(exc.headers or {}),
+                    core_settings.REQUEST_ID_HEADER: request_id,
+                }
+                self._log_access(
+                    request, status_code=exc.status_code, start_time=start_time
+                )
+                raise
+            except StorageError as exc:
+                # 응답은 core.exceptions의 핸들러가 exc.status_code로 만듭니다.
+                status_code = exc.status_code
+                self._log_access(
+                    request, status_code=exc.status_code, start_time=start_time
+                )
+                raise
+            except Exception:
+                status_code = 500
+                self._log_access(request, status_code=500, start_time=start_time)
+                raise
+            finally:
+                in_flight.dec()
+                self._record_metrics(
+                    request, status_code=status_code, start_time=start_time, stats=stats
+                )
 
-            process_time = (time.time() - start_time) * 1000
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} [{request_id}] "
-                f"status={response.status_code} time={process_time:.2f}ms "
-                f"response={bytes(response.body).decode('utf-8')}"
+            response.headers[core_settings.REQUEST_ID_HEADER] = request_id
+            self._log_access(
+                request,
+                status_code=response.status_code,
+                start_time=start_time,
+                response=response,
             )
 
             return response
@@ -36,5 +189,95 @@ class LoggingRoute(APIRoute):
         return custom_route_handler
 
 
-create_router = partial(APIRouter, route_class=LoggingRoute)
-"""모든 라우터 생성 시 사용할 헬퍼 함수"""
+_RESPONSE_PARAM = "_fast_json_response"
+
+
+class FastJSONRoute(LoggingRoute):
+    """
+    엔드포인트가 돌려준 값을 response_model 기준으로 바로 JSON bytes로 직렬화합니다.
+
+    기본 APIRoute는 반환값을 response_model로 다시 검증한 뒤 jsonable_encoder를 거쳐 직렬화하는데,
+    엔드포인트가 이미 스키마 객체를 만들어 돌려주는 경우 이 과정은 같은 데이터를 두 번 처리하는 셈입니다.
+    다시 검증하지 않으므로 response_model과 맞는 값을 돌려주는 엔드포인트에만 사용합니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        if inspect.iscoroutinefunction(endpoint) and not hasattr(
+            endpoint, "__fast_json__"
+        ):
+            endpoint = self._wrap_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    @cached_property
+    def _adapter(self) -> TypeAdapter[Any] | None:
+        if self.response_model is None:
+            return None
+        return TypeAdapter(self.response_model)
+
+    def _render(self, content: Any, response: Response) -> Response:
+        assert self._adapter is not None
+
+        body = self._adapter.dump_json(
+            content,
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
+        rendered = Response(
+            content=body,
+            status_code=response.status_code or self.status_code or 200,
+            media_type="application/json",
+        )
+        # 엔드포인트가 주입받은 Response에 설정한 헤더(ETag 등)를 옮깁니다.
+        rendered.raw_headers.extend(
+            (key, value)
+            for key, value in response.raw_headers
+            if key not in (b"content-length", b"content-type")
+        )
+        return rendered
+
+    def _wrap_endpoint(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(endpoint, eval_str=True)
+        parameters = list(signature.parameters.values())
+
+        response_param = next(
+            (p.name for p in parameters if p.annotation is Response), None
+        )
+        if response_param is None:
+            # 헤더와 상태 코드를 받기 위해 FastAPI가 주입하는 Response를 숨은 파라미터로 받습니다.
+            response_param = _RESPONSE_PARAM
+            parameters.append(
+                inspect.Parameter(
+                    _RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+                )
+            )
+
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if response_param == _RESPONSE_PARAM:
+                response = kwargs.pop(_RESPONSE_PARAM)
+            else:
+                response = kwargs[response_param]
+
+            content = await endpoint(*args, **kwargs)
+
+            if content is None or isinstance(content, Response) or not self._adapter:
+                return content
+            return self._render(content, response)
+
+        setattr(wrapper, "__signature__", signature.replace(parameters=parameters))
+        # include_router가 라우트를 다시 만들 때 한 번 더 감싸지 않도록 표시합니다.
+        setattr(wrapper, "__fast_json__", True)
+        return wrapper
+
+
+def create_router(*, fast_json: bool = False, **kwargs: Any) -> APIRouter:
+    """
+    모든 라우터 생성 시 사용할 헬퍼 함수
+    fast_json=True면 응답을 다시 검증하지 않고 한 번에 직렬화합니다. (FastJSONRoute 참고)
+    """
+    route_class = FastJSONRoute if fast_json else LoggingRoute
+    return APIRouter(route_class=route_class, **kwargs)
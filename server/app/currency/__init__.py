@@ -0,0 +1,3 @@
+from .models import ExchangeRate
+
+__all__ = ["ExchangeRate"]
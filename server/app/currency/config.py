@@ -0,0 +1,12 @@
+from app.config import BaseConfig
+
+
+class CurrencyConfig(BaseConfig):
+    FX_BASE_CURRENCY: str = "USD"
+    """exchange_rate 테이블의 환율 기준 통화. rate는 기준 통화 1 단위당 해당 통화의 금액입니다."""
+
+    FX_RATE_CACHE_TTL: float = 3600.0
+    """워커별 환율 캐시를 DB에서 다시 읽는 주기 (초)"""
+
+
+currency_settings = CurrencyConfig.create()
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.database.deps import SessionDep
+
+from .rates import RateCache, rate_cache
+
+
+async def get_rate_cache(session: SessionDep) -> RateCache:
+    await rate_cache.ensure_loaded(session)
+    return rate_cache
+
+
+RateCacheDep = Annotated[RateCache, Depends(get_rate_cache)]
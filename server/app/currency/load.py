@@ -0,0 +1,57 @@
+"""
+환율 파일을 exchange_rate 테이블에 넣습니다. 같은 (통화, 날짜)는 덮어씁니다.
+
+    uv run poe load-exchange-rates rates.csv
+"""
+
+import asyncio
+import sys
+from itertools import batched
+from pathlib import Path
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import dispose_engines, get_engine
+
+from .models import ExchangeRate
+from .provider import FileRateProvider, RateProvider
+
+_BATCH_SIZE = 1_000
+
+
+async def load_rates(session: AsyncSession, provider: RateProvider) -> int:
+    count = 0
+
+    for batch in batched(provider.fetch(), _BATCH_SIZE):
+        statement = insert(ExchangeRate).values([row._asdict() for row in batch])
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ExchangeRate.currency, ExchangeRate.date],
+                set_={"rate": statement.excluded.rate},
+            )
+        )
+        count += len(batch)
+
+    return count
+
+
+async def main() -> int:
+    if len(sys.argv) != 2:
+        print("usage: python -m app.currency.load <rates.csv>")
+        return 2
+
+    try:
+        async with get_engine().sessionmaker() as session:
+            count = await load_rates(session, FileRateProvider(Path(sys.argv[1])))
+            await session.commit()
+    finally:
+        await dispose_engines()
+
+    # 각 워커의 환율 캐시는 FX_RATE_CACHE_TTL 이내에 새 환율을 읽습니다.
+    print(f"{count} rate(s) loaded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
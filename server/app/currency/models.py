@@ -0,0 +1,21 @@
+import datetime
+from decimal import Decimal
+
+from sqlalchemy import Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class ExchangeRate(Base):
+    __tablename__ = "exchange_rate"
+
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    """ISO 4217 통화 코드"""
+
+    # 기본값이 먼저 대입되므로 필드 이름과 같은 date 대신 모듈 경로로 씁니다.
+    date: Mapped[datetime.date] = mapped_column(primary_key=True)
+    """환율 기준일"""
+
+    rate: Mapped[Decimal] = mapped_column(Numeric(20, 10), nullable=False)
+    """FX_BASE_CURRENCY 1 단위당 해당 통화의 금액"""
@@ -0,0 +1,43 @@
+import csv
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Iterator, NamedTuple, Protocol
+
+
+class RateRow(NamedTuple):
+    currency: str
+    date: date
+    rate: Decimal
+    """FX_BASE_CURRENCY 1 단위당 해당 통화의 금액"""
+
+
+class RateProvider(Protocol):
+    """환율 공급원. 외부 API 공급원도 같은 형태로 추가할 수 있습니다."""
+
+    def fetch(self) -> Iterator[RateRow]: ...
+
+
+class FileRateProvider:
+    """
+    date,currency,rate 헤더를 가진 CSV 파일에서 환율을 읽습니다.
+
+        date,currency,rate
+        2025-07-01,KRW,1364.5
+        2025-07-01,JPY,144.2
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def fetch(self) -> Iterator[RateRow]:
+        with self.path.open(newline="", encoding="utf-8-sig") as f:
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    yield RateRow(
+                        currency=row["currency"].strip().upper(),
+                        date=date.fromisoformat(row["date"].strip()),
+                        rate=Decimal(row["rate"].strip()),
+                    )
+                except (KeyError, ValueError, InvalidOperation) as e:
+                    raise ValueError(f"{self.path}:{line}: 잘못된 환율 row") from e
@@ -0,0 +1,158 @@
+"""
+환율 변환
+
+금액은 통화의 최소 단위 정수입니다. (KRW 1원, USD 1센트)
+환율은 exchange_rate 테이블 전체를 워커 메모리에 올려두고, 통화별로 정렬된 날짜 배열에서 이분 탐색합니다.
+"""
+
+import asyncio
+import time
+from bisect import bisect_right
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import groupby
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import currency_settings
+from .models import ExchangeRate
+
+# ISO 4217에서 소수 자릿수가 2가 아닌 통화
+_MINOR_UNITS = {
+    **dict.fromkeys(
+        [
+            "BIF", "CLP", "DJF", "GNF", "ISK", "JPY", "KMF", "KRW",
+            "PYG", "RWF", "UGX", "UYI", "VND", "VUV", "XAF", "XOF", "XPF",
+        ],
+        0,
+    ),
+    **dict.fromkeys(["BHD", "IQD", "JOD", "KWD", "LYD", "OMR", "TND"], 3),
+}  # fmt: skip
+
+
+def minor_units(currency: str) -> int:
+    """통화의 소수 자릿수"""
+    return _MINOR_UNITS.get(currency, 2)
+
+
+class ExchangeRateNotFoundError(LookupError):
+    def __init__(self, currency: str, on: date):
+        super().__init__(f"{on} 이전의 {currency} 환율 정보가 없습니다.")
+        self.currency = currency
+        self.on = on
+
+
+class RateCache:
+    """
+    통화별 (날짜 배열, 환율 배열)을 들고 있는 워커별 환율 캐시.
+    날짜에 정확히 맞는 환율이 없으면(주말, 미래 날짜 등) 그 이전의 가장 최근 환율을 사용합니다.
+    """
+
+    def __init__(self, *, base: str, ttl: float):
+        self.base = base
+        self._ttl = ttl
+        self._dates: dict[str, list[date]] = {}
+        self._rates: dict[str, list[Decimal]] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self._ttl
+        )
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """캐시가 비었거나 TTL이 지났으면 DB에서 다시 읽습니다. 동시에 여러 요청이 와도 한 번만 읽습니다."""
+        if self._is_fresh():
+            return
+
+        async with self._lock:
+            if self._is_fresh():
+                return
+
+            result = await session.execute(
+                select(
+                    ExchangeRate.currency, ExchangeRate.date, ExchangeRate.rate
+                ).order_by(ExchangeRate.currency, ExchangeRate.date)
+            )
+            self.load(result.tuples())
+
+    def load(self, rows: Iterable[tuple[str, date, Decimal]]) -> None:
+        """(통화, 날짜, 환율)을 통화, 날짜 순으로 받아 캐시를 교체합니다."""
+        dates: dict[str, list[date]] = {}
+        rates: dict[str, list[Decimal]] = {}
+
+        for currency, group in groupby(rows, key=lambda row: row[0]):
+            items = list(group)
+            dates[currency] = [on for _, on, _ in items]
+            rates[currency] = [rate for _, _, rate in items]
+
+        self._dates, self._rates = dates, rates
+        self._loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        self._loaded_at = None
+
+    def rate(self, currency: str, on: date) -> Decimal:
+        """on 날짜의 기준 통화 대비 환율"""
+        if currency == self.base:
+            return Decimal(1)
+
+        dates = self._dates.get(currency)
+        index = bisect_right(dates, on) if dates else 0
+        if index == 0:
+            raise ExchangeRateNotFoundError(currency, on)
+
+        return self._rates[currency][index - 1]
+
+    def has_rate(self, currency: str, on: date) -> bool:
+        if currency == self.base:
+            return True
+
+        dates = self._dates.get(currency)
+        return bool(dates) and dates[0] <= on
+
+    def factor(self, source: str, target: str, on: date) -> Decimal:
+        """source 최소 단위 금액에 곱하면 target 최소 단위 금액이 되는 값"""
+        if source == target:
+            return Decimal(1)
+
+        source_rate = self.rate(source, on)
+        target_rate = self.rate(target, on)
+        return (
+            target_rate
+            / source_rate
+            * Decimal(10) ** (minor_units(target) - minor_units(source))
+        )
+
+    def convert_many(
+        self, items: Iterable[tuple[int, str, date]], *, to: str
+    ) -> list[int]:
+        """
+        (금액, 통화, 날짜) 목록을 한 번에 변환합니다.
+        환율 조회는 row마다가 아니라 (통화, 날짜) 조합마다 한 번씩만 합니다.
+        """
+        items = list(items)
+        factors = {
+            (currency, on): self.factor(currency, to, on)
+            for currency, on in {(currency, on) for _, currency, on in items}
+        }
+
+        return [
+            amount
+            if currency == to
+            else int((amount * factors[currency, on]).to_integral_value(ROUND_HALF_UP))
+            for amount, currency, on in items
+        ]
+
+    def convert(self, amount: int, currency: str, on: date, *, to: str) -> int:
+        return self.convert_many([(amount, currency, on)], to=to)[0]
+
+
+rate_cache = RateCache(
+    base=currency_settings.FX_BASE_CURRENCY,
+    ttl=currency_settings.FX_RATE_CACHE_TTL,
+)
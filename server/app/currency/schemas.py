@@ -0,0 +1,7 @@
+import re
+from typing import Annotated
+
+from pydantic import Field
+
+CurrencyCode = Annotated[str, Field(pattern=re.compile(r"^[A-Z]{3}$"))]
+"""ISO 4217 통화 코드"""
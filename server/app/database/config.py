@@ -10,6 +10,35 @@ class DatabaseConfig(BaseConfig):
     POSTGRES_DB: str
     POSTGRES_SSL: bool = False
 
+    POOL_SIZE: int = 5
+    """워커별로 유지하는 커넥션 수"""
+
+    POOL_MAX_OVERFLOW: int = 2
+    """POOL_SIZE를 넘어 임시로 열 수 있는 커넥션 수"""
+
+    POOL_TIMEOUT: float = 30.0
+    """커넥션을 얻기 위해 대기하는 최대 시간 (초)"""
+
+    POOL_RECYCLE: int = 300
+    """커넥션 재사용 최대 시간 (초)"""
+
+    POOL_PRE_PING: bool = True
+
+    POOL_WARMUP: int = 0
+    """시작 시 미리 열어둘 커넥션 수 (POOL_SIZE를 넘지 않음)"""
+
+    CONNECT_TIMEOUT: float = 10.0
+    """DB 커넥션 생성 타임아웃 (초)"""
+
+    COMMAND_TIMEOUT: float | None = None
+    """쿼리 실행 타임아웃 (초)"""
+
+    PGBOUNCER_TRANSACTION_MODE: bool = False
+    """
+    PgBouncer transaction pooling 뒤에서 동작하는 경우 켭니다.
+    서버 커넥션이 트랜잭션마다 바뀌므로 asyncpg의 prepared statement 캐시를 끕니다.
+    """
+
     def create_database_uri(self, *, dialect: str, options: dict[str, str] | None):
         return (
             f"postgresql+{dialect}://"
@@ -18,11 +47,22 @@ class DatabaseConfig(BaseConfig):
         )
 
     @property
-    def DATABASE_URI(self):
-        return self.create_database_uri(
-            dialect="asyncpg",
-            options={"ssl": "require"} if self.POSTGRES_SSL else None,
+    def DSN(self):
+        """SQLAlchemy를 거치지 않고 asyncpg로 직접 연결할 때 사용하는 DSN"""
+        return (
+            f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}/{self.POSTGRES_DB}"
+            + ("?sslmode=require" if self.POSTGRES_SSL else "")
         )
 
+    @property
+    def DATABASE_URI(self):
+        options: dict[str, str] = {}
+        if self.POSTGRES_SSL:
+            options["ssl"] = "require"
+        if self.PGBOUNCER_TRANSACTION_MODE:
+            options["prepared_statement_cache_size"] = "0"
+
+        return self.create_database_uri(dialect="asyncpg", options=options or None)
+
 
 database_settings = DatabaseConfig.create()
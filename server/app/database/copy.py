@@ -0,0 +1,36 @@
+from typing import Any, Iterable, Protocol, Sequence, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class _CopyConnection(Protocol):
+    """copy_records에서 사용하는 asyncpg.Connection 메서드"""
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str],
+    ) -> str: ...
+
+
+async def copy_records(
+    session: AsyncSession,
+    table: str,
+    *,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> int:
+    """
+    asyncpg COPY로 row를 한 번에 저장하고 저장한 row 수를 반환합니다.
+    세션과 같은 커넥션(트랜잭션)을 사용하므로 요청이 실패하면 함께 롤백됩니다.
+    ORM을 거치지 않으므로 컬럼의 Python 기본값은 적용되지 않습니다.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = cast(_CopyConnection, raw.driver_connection)
+
+    status = await driver.copy_records_to_table(table, records=records, columns=columns)
+    # "COPY 123"
+    return int(status.rsplit(" ", 1)[-1])
@@ -1,5 +1,7 @@
 import asyncio
-from typing import Dict, NamedTuple
+import time
+from typing import Any, Dict, NamedTuple
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -7,8 +9,47 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.metrics import REGISTRY
+from app.metrics.instruments import (
+    db_pool_checked_in,
+    db_pool_checked_out,
+    db_pool_checkout_wait_seconds,
+    db_pool_overflow,
+    db_pool_timeouts_total,
+    instrument_engine,
+)
 
 from .config import database_settings
+from .schemas import PoolStats
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득 대기 시간을 기록하는 QueuePool"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.timeout_count = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except Exception:
+            self.timeout_count += 1
+            db_pool_timeouts_total.inc()
+            raise
+
+        elapsed = time.perf_counter() - start
+        db_pool_checkout_wait_seconds.observe(elapsed)
+        self.checkout_count += 1
+        self.wait_time_total += elapsed
+        self.wait_time_max = max(self.wait_time_max, elapsed)
+        return entry
 
 
 class EngineCache(NamedTuple):
@@ -19,6 +60,20 @@ class EngineCache(NamedTuple):
 _engine_cache: Dict[asyncio.AbstractEventLoop, EngineCache] = {}
 
 
+def _connect_args() -> dict[str, Any]:
+    connect_args: dict[str, Any] = {
+        "timeout": database_settings.CONNECT_TIMEOUT,
+        "command_timeout": database_settings.COMMAND_TIMEOUT,
+    }
+
+    if database_settings.PGBOUNCER_TRANSACTION_MODE:
+        # PgBouncer가 트랜잭션마다 서버 커넥션을 바꾸므로 prepared statement 이름이 겹치지 않게 합니다.
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+    return connect_args
+
+
 def get_engine() -> EngineCache:
     """
     전역 엔진을 사용하면 Event loop mismatch가 발생할 수 있으므로
@@ -29,13 +84,81 @@ def get_engine() -> EngineCache:
     if loop not in _engine_cache:
         engine = create_async_engine(
             database_settings.DATABASE_URI,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=2,
-            pool_recycle=300,
+            poolclass=InstrumentedQueuePool,
+            pool_pre_ping=database_settings.POOL_PRE_PING,
+            pool_size=database_settings.POOL_SIZE,
+            max_overflow=database_settings.POOL_MAX_OVERFLOW,
+            pool_timeout=database_settings.POOL_TIMEOUT,
+            pool_recycle=database_settings.POOL_RECYCLE,
+            connect_args=_connect_args(),
         )
+        instrument_engine(engine.sync_engine)
         session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
 
         _engine_cache[loop] = EngineCache(engine=engine, sessionmaker=session_factory)
 
     return _engine_cache[loop]
+
+
+async def warmup_pool(connections: int | None = None) -> None:
+    """시작 시 커넥션을 미리 열어 첫 요청들이 커넥션 생성 비용을 치르지 않게 합니다."""
+    count = min(
+        database_settings.POOL_WARMUP if connections is None else connections,
+        database_settings.POOL_SIZE,
+    )
+    if count <= 0:
+        return
+
+    engine = get_engine().engine
+    conns = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
+async def dispose_engines() -> None:
+    """
+    캐시된 엔진을 모두 정리합니다.
+    다른 이벤트 루프에서 만든 엔진의 커넥션은 현재 루프에서 닫을 수 없으므로 참조만 끊습니다.
+    """
+    loop = asyncio.get_event_loop()
+
+    for cached_loop, cache in list(_engine_cache.items()):
+        if cached_loop is loop:
+            await cache.engine.dispose()
+        else:
+            await cache.engine.dispose(close=False)
+        del _engine_cache[cached_loop]
+
+
+def get_pool_stats() -> PoolStats:
+    """현재 이벤트 루프의 커넥션 풀 상태를 반환합니다."""
+    pool = get_engine().engine.pool
+    assert isinstance(pool, InstrumentedQueuePool)
+
+    return PoolStats(
+        size=pool.size(),
+        max_overflow=database_settings.POOL_MAX_OVERFLOW,
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        checkout_count=pool.checkout_count,
+        timeout_count=pool.timeout_count,
+        wait_time_total_ms=pool.wait_time_total * 1000,
+        wait_time_max_ms=pool.wait_time_max * 1000,
+    )
+
+
+def _collect_pool_metrics() -> None:
+    checked_out = checked_in = overflow = 0
+    for cache in _engine_cache.values():
+        pool = cache.engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            checked_out += pool.checkedout()
+            checked_in += pool.checkedin()
+            overflow += max(pool.overflow(), 0)
+
+    db_pool_checked_out.set(checked_out)
+    db_pool_checked_in.set(checked_in)
+    db_pool_overflow.set(overflow)
+
+
+REGISTRY.add_collector(_collect_pool_metrics)
@@ -0,0 +1,150 @@
+"""
+주요 조회 쿼리가 의도한 인덱스를 사용하는지 EXPLAIN으로 확인합니다.
+
+    uv run poe check-query-plans
+
+데이터가 적은 개발 DB에서는 Postgres가 seq scan을 고르므로 enable_seqscan을 끄고 실행 계획을 봅니다.
+의도한 인덱스를 사용하지 않는 쿼리가 있으면 종료 코드 1로 끝납니다.
+"""
+
+import asyncio
+import sys
+from datetime import date, datetime
+from typing import Any, Iterator, NamedTuple, cast
+
+from sqlalchemy import Select, func, literal, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSRANGE
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import dispose_engines, get_engine
+from app.expenses.models import Expense
+from app.flights.models import Flight
+from app.itinerary.models import Itinerary
+from app.plans.models import Plan
+from app.users.models import User
+
+
+class HotQuery(NamedTuple):
+    name: str
+    statement: Select[Any]
+    expected_index: str
+
+
+def hot_queries() -> list[HotQuery]:
+    """Repository에서 실제로 사용하는 접근 경로"""
+    return [
+        HotQuery(
+            "plan list by owner (keyset)",
+            select(Plan)
+            .where(
+                Plan.owner_id == 1,
+                Plan.is_deleted.is_(False),
+                tuple_(Plan.start_date, Plan.id)
+                < tuple_(literal(date(2100, 1, 1)), literal(1)),
+            )
+            .order_by(Plan.start_date.desc(), Plan.id.desc())
+            .limit(21),
+            "ix_plan_owner_start_date",
+        ),
+        HotQuery(
+            "itineraries of plan",
+            select(Itinerary)
+            .where(Itinerary.plan_id.in_([1, 2]), Itinerary.is_deleted.is_(False))
+            .order_by(Itinerary.plan_id, Itinerary.date, Itinerary.start_time),
+            "ix_itinerary_plan_date_start_time",
+        ),
+        HotQuery(
+            "calendar itineraries of owner",
+            select(Itinerary)
+            .join(Plan, Plan.id == Itinerary.plan_id)
+            .where(
+                Plan.owner_id == 1,
+                Plan.is_deleted.is_(False),
+                Itinerary.is_deleted.is_(False),
+                Itinerary.time_range.overlaps(
+                    func.tsrange(
+                        literal(datetime(2026, 10, 1)),
+                        literal(datetime(2026, 11, 1)),
+                        type_=TSRANGE,
+                    )
+                ),
+            ),
+            "ix_itinerary_plan_time_range",
+        ),
+        HotQuery(
+            "flights of plan",
+            select(Flight)
+            .where(Flight.plan_id.in_([1, 2]), Flight.is_deleted.is_(False))
+            .order_by(Flight.plan_id, Flight.departure_time),
+            "ix_flight_plan_departure_time",
+        ),
+        HotQuery(
+            "expenses of plan",
+            select(Expense)
+            .where(Expense.plan_id.in_([1, 2]), Expense.is_deleted.is_(False))
+            .order_by(Expense.plan_id, Expense.date),
+            "ix_expense_plan_date",
+        ),
+        HotQuery(
+            "handle lookup",
+            select(User.id).where(User.handle == "handle"),
+            "ix_user_handle",
+        ),
+    ]
+
+
+def _index_names(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        for key, value in cast(dict[str, Any], node).items():
+            if key == "Index Name" and isinstance(value, str):
+                yield value
+            else:
+                yield from _index_names(value)
+    elif isinstance(node, list):
+        for item in cast(list[Any], node):
+            yield from _index_names(item)
+
+
+async def explain(session: AsyncSession, statement: Select[Any]) -> Any:
+    sql = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    return await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+
+
+async def check_query_plans() -> list[str]:
+    """의도한 인덱스를 사용하지 않는 쿼리 이름 목록을 반환합니다."""
+    failures: list[str] = []
+
+    async with get_engine().sessionmaker() as session:
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+
+        for query in hot_queries():
+            plan = await explain(session, query.statement)
+            used = set(_index_names(plan))
+
+            if query.expected_index in used:
+                print(f"ok   {query.name}: {query.expected_index}")
+            else:
+                print(
+                    f"FAIL {query.name}: expected {query.expected_index}, used {used or '-'}"
+                )
+                failures.append(query.name)
+
+        await session.rollback()
+
+    return failures
+
+
+async def main() -> int:
+    try:
+        failures = await check_query_plans()
+    finally:
+        await dispose_engines()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
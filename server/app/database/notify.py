@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Protocol, cast
+
+import asyncpg  # type: ignore
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import database_settings
+
+logger = logging.getLogger(__name__)
+
+type NotificationHandler = Callable[[str], None]
+type ResetHandler = Callable[[], None]
+type LostHandler = Callable[[], None]
+type _AsyncpgListener = Callable[[Any, int, str, str], None]
+
+
+class _ListenConnection(Protocol):
+    """PgListener가 사용하는 asyncpg.Connection 메서드"""
+
+    async def add_listener(self, channel: str, callback: _AsyncpgListener) -> None: ...
+
+    async def remove_listener(
+        self, channel: str, callback: _AsyncpgListener
+    ) -> None: ...
+
+    def add_termination_listener(self, callback: Callable[[Any], None]) -> None: ...
+
+    def is_closed(self) -> bool: ...
+
+    async def close(self) -> None: ...
+
+
+_connect = cast(
+    Callable[..., Awaitable[_ListenConnection]],
+    asyncpg.connect,  # type: ignore
+)
+
+
+async def notify(session: AsyncSession, channel: str, payload: str) -> None:
+    """
+    현재 트랜잭션에 NOTIFY를 예약합니다.
+    Postgres는 트랜잭션이 커밋될 때만 알림을 전달하므로, 롤백된 변경은 다른 워커에 알려지지 않습니다.
+    """
+    await session.execute(select(func.pg_notify(channel, payload)))
+
+
+class PgListener:
+    """
+    워커마다 LISTEN 전용 커넥션 하나를 열어 여러 채널을 구독합니다.
+    커넥션 풀과 별개의 커넥션을 사용하며, PgBouncer transaction pooling에서는 LISTEN이 동작하지 않으므로
+    Postgres에 직접 연결할 수 있어야 합니다.
+    """
+
+    def __init__(
+        self, *, reconnect_delay: float = 1.0, max_reconnect_delay: float = 30.0
+    ):
+        self._handlers: defaultdict[str, list[NotificationHandler]] = defaultdict(list)
+        self._reset_handlers: list[ResetHandler] = []
+        self._lost_handlers: list[LostHandler] = []
+        self._conn: _ListenConnection | None = None
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._closing = False
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+    async def subscribe(
+        self,
+        channel: str,
+        handler: NotificationHandler,
+        *,
+        on_reset: ResetHandler | None = None,
+        on_lost: LostHandler | None = None,
+    ) -> None:
+        """
+        채널을 구독합니다.
+        on_lost는 연결이 끊겨 알림을 받지 못하게 되었을 때, on_reset은 다시 연결되어
+        끊긴 동안의 알림이 유실됐을 수 있을 때 호출됩니다.
+        """
+        self._closing = False
+        self._handlers[channel].append(handler)
+        if on_reset is not None:
+            self._reset_handlers.append(on_reset)
+        if on_lost is not None:
+            self._lost_handlers.append(on_lost)
+
+        async with self._lock:
+            conn = await self._ensure_connection()
+            if len(self._handlers[channel]) == 1:
+                await conn.add_listener(channel, self._dispatch)
+
+    async def unsubscribe(self, channel: str, handler: NotificationHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if not handlers or handler not in handlers:
+            return
+
+        handlers.remove(handler)
+        if handlers:
+            return
+
+        del self._handlers[channel]
+        async with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                await self._conn.remove_listener(channel, self._dispatch)
+
+    async def stop(self) -> None:
+        self._closing = True
+
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        async with self._lock:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
+
+        self._handlers.clear()
+        self._reset_handlers.clear()
+        self._lost_handlers.clear()
+
+    async def _ensure_connection(self) -> _ListenConnection:
+        if self._conn is None or self._conn.is_closed():
+            conn = await _connect(
+                database_settings.DSN,
+                timeout=database_settings.CONNECT_TIMEOUT,
+            )
+            conn.add_termination_listener(self._on_terminated)
+            self._conn = conn
+
+        return self._conn
+
+    def _dispatch(self, _conn: Any, _pid: int, channel: str, payload: str) -> None:
+        for handler in list(self._handlers.get(channel, ())):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("Notification handler failed: channel=%s", channel)
+
+    def _on_terminated(self, _conn: Any) -> None:
+        if self._closing or self._reconnect_task is not None:
+            return
+
+        logger.warning("LISTEN connection lost, reconnecting")
+        for lost in list(self._lost_handlers):
+            try:
+                lost()
+            except Exception:
+                logger.exception("LISTEN connection lost handler failed")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self._reconnect_delay
+
+        while not self._closing:
+            try:
+                async with self._lock:
+                    self._conn = None
+                    conn = await self._ensure_connection()
+                    for channel in self._handlers:
+                        await conn.add_listener(channel, self._dispatch)
+                break
+            except (OSError, asyncpg.PostgresError, asyncio.TimeoutError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+
+        self._reconnect_task = None
+        if self._closing:
+            return
+
+        # 끊겨 있는 동안의 알림은 받지 못했으므로 구독자가 상태를 초기화하도록 합니다.
+        for reset in list(self._reset_handlers):
+            reset()
+
+
+pg_listener = PgListener()
@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, NamedTuple, Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+_RAW_CURSOR = TypeAdapter(list[Any])
+
+
+class KeysetPage[T](NamedTuple):
+    items: list[T]
+    next_cursor: str | None
+    total_count: int | None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 클라이언트에 넘길 불투명한 문자열로 만듭니다."""
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = _RAW_CURSOR.validate_json(base64.urlsafe_b64decode(padded))
+        if len(raw) != len(types):
+            raise InvalidCursorError(cursor)
+
+        return [
+            TypeAdapter(type_).validate_python(value)
+            for type_, value in zip(types, raw)
+        ]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(cursor) from e
+
+
+async def paginate[T](
+    session: AsyncSession,
+    stmt: Select[tuple[T]],
+    *,
+    keys: Sequence[InstrumentedAttribute[Any]],
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+    with_count: bool = False,
+) -> KeysetPage[T]:
+    """
+    Keyset(seek) 방식으로 페이지를 조회합니다.
+    keys는 유일한 정렬 순서를 만들어야 하므로 마지막 키는 PK 등 유일한 컬럼이어야 합니다.
+    OFFSET을 쓰지 않으므로 몇 번째 페이지든 (keys에 맞는 인덱스가 있다면) 비용이 O(limit) 입니다.
+    """
+    page_stmt = stmt.order_by(
+        *(key.desc() if descending else key.asc() for key in keys)
+    ).limit(limit + 1)
+
+    if cursor is not None:
+        values = decode_cursor(cursor, [key.type.python_type for key in keys])
+        row = tuple_(*keys)
+        page_stmt = page_stmt.where(
+            row < tuple_(*values) if descending else row > tuple_(*values)
+        )
+
+    items = list((await session.scalars(page_stmt)).all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+
+    total_count = None
+    if with_count:
+        total_count = await session.scalar(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        )
+
+    return KeysetPage(items=items, next_cursor=next_cursor, total_count=total_count)
@@ -0,0 +1,17 @@
+from app.schemas import APISchema
+
+
+class PoolStats(APISchema):
+    """워커 한 개의 커넥션 풀 상태"""
+
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    """pool_size를 넘어 열려 있는 커넥션 수"""
+
+    checkout_count: int
+    timeout_count: int
+    wait_time_total_ms: float
+    wait_time_max_ms: float
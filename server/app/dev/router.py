@@ -4,6 +4,13 @@ from app.auth.schemas import TokenResponse
 from app.auth.service import AuthInfoService
 from app.auth.token import TokenType, create_jwt_token, create_token_pair
 from app.core.router import create_router
+from app.database.deps import SessionDep
+from app.database.engine import get_pool_stats
+from app.database.schemas import PoolStats
+from app.expenses.reconcile import reconcile
+from app.expenses.schemas import TotalAmountDrift
+from app.jobs.queue import enqueue
+from app.jobs.schemas import JobRead
 from app.users.models import Gender
 from app.users.schemas import UserCreate
 from app.users.service import UserService
@@ -55,3 +62,33 @@ async def create_test_user(
     access_token, refresh_token = create_token_pair(created_user.id)
 
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.get("/pool-stats")
+async def read_pool_stats() -> PoolStats:
+    """
+    현재 워커의 DB 커넥션 풀 상태
+    """
+    return get_pool_stats()
+
+
+@router.post("/reconcile-expenses")
+async def reconcile_expenses(
+    session: SessionDep, fix: bool = False
+) -> list[TotalAmountDrift]:
+    """
+    Plan.total_amount가 실제 지출 합계와 다른 계획 목록. fix=true면 바로잡습니다.
+    """
+    return await reconcile(session, fix=fix)
+
+
+@router.post("/jobs/reconcile-expenses")
+async def enqueue_reconcile_expenses(
+    session: SessionDep, owner_id: int | None = None, fix: bool = True
+) -> JobRead:
+    """
+    reconcile-expenses를 백그라운드 작업으로 실행합니다.
+    owner_id를 지정하면 해당 유저가 /private/jobs에서 상태를 조회할 수 있습니다.
+    """
+    job = await enqueue(session, "expenses.reconcile", {"fix": fix}, owner_id=owner_id)
+    return JobRead.model_validate(job)
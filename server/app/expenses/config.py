@@ -0,0 +1,15 @@
+from app.config import BaseConfig
+
+
+class ExpenseConfig(BaseConfig):
+    IMPORT_CHUNK_SIZE: int = 64 * 1024
+    """CSV 업로드를 한 번에 읽는 크기 (바이트)"""
+
+    IMPORT_BATCH_SIZE: int = 2_000
+    """검증 후 한 번의 COPY로 저장하는 row 수"""
+
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+    """응답에 포함하는 row 오류의 최대 개수. 전체 오류 개수는 항상 함께 반환합니다."""
+
+
+expense_settings = ExpenseConfig.create()
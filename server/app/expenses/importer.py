@@ -0,0 +1,257 @@
+"""
+지출 내역 CSV 파싱과 검증
+
+업로드 파일을 조금씩 읽어 row 단위로 넘기므로 파일 전체를 메모리에 올리지 않습니다.
+"""
+
+import codecs
+import csv
+import io
+import re
+from datetime import date
+from decimal import Decimal
+from typing import AsyncIterator, Literal, NamedTuple
+
+from fastapi import UploadFile
+
+from app.currency.rates import minor_units
+
+from .models import ExpenseCategory
+
+type CSVEncoding = Literal["utf-8", "cp949"]
+
+_DECODERS: dict[CSVEncoding, str] = {
+    # 엑셀에서 저장한 UTF-8 CSV는 BOM으로 시작합니다.
+    "utf-8": "utf-8-sig",
+    "cp949": "cp949",
+}
+
+_HEADER_ALIASES = {
+    "date": "date",
+    "날짜": "date",
+    "지출날짜": "date",
+    "category": "category",
+    "카테고리": "category",
+    "분류": "category",
+    "amount": "amount",
+    "금액": "amount",
+    "currency": "currency",
+    "통화": "currency",
+    "description": "description",
+    "설명": "description",
+    "내용": "description",
+}
+
+_CATEGORY_ALIASES = {
+    "식비": ExpenseCategory.FOOD,
+    "교통": ExpenseCategory.TRANSPORT,
+    "항공": ExpenseCategory.FLIGHT,
+    "액티비티": ExpenseCategory.ACTIVITY,
+    "숙박": ExpenseCategory.ACCOMMODATION,
+    "쇼핑": ExpenseCategory.SHOPPING,
+    "기타": ExpenseCategory.ETC,
+}
+
+_CATEGORIES = (
+    {category.value: category for category in ExpenseCategory}
+    | {category.name.lower(): category for category in ExpenseCategory}
+    | _CATEGORY_ALIASES
+)
+
+
+class CSVFormatError(ValueError):
+    """row 단위로 건너뛸 수 없는 파일 전체의 오류 (인코딩, 헤더 등)"""
+
+
+class CSVRow(NamedTuple):
+    line: int
+    """row가 시작하는 줄 번호 (1부터)"""
+
+    values: list[str]
+
+
+class CSVColumns(NamedTuple):
+    """헤더에서 찾은 각 컬럼의 위치"""
+
+    date: int
+    category: int
+    amount: int
+    currency: int | None
+    description: int | None
+
+
+_CURRENCY_PATTERN = re.compile(r"^[A-Z]{3}$")
+
+
+class ExpenseRecord(NamedTuple):
+    line: int
+    category: ExpenseCategory
+    amount: int
+    currency: str
+    description: str
+    date: date
+
+
+class RowError(NamedTuple):
+    line: int
+    message: str
+
+
+class _RecordSplitter:
+    """
+    디코딩된 텍스트를 CSV record 단위로 나눕니다.
+    따옴표 안의 줄바꿈은 record를 끝내지 않으므로, 따옴표 개수가 짝수가 될 때까지 줄을 모읍니다.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._record: list[str] = []
+        self._quotes = 0
+        self._line = 0
+        self._start = 1
+
+    def feed(self, text: str, *, final: bool = False) -> list[tuple[int, str]]:
+        lines = io.StringIO(self._buffer + text, newline="").readlines()
+        self._buffer = ""
+
+        # 청크 경계에서 잘린 줄, 그리고 \r\n 사이에서 잘린 \r은 다음 청크와 합칩니다.
+        if lines and not final and not lines[-1].endswith("\n"):
+            self._buffer = lines.pop()
+
+        records: list[tuple[int, str]] = []
+        for line in lines:
+            self._line += 1
+            self._record.append(line)
+            self._quotes += line.count('"')
+
+            if self._quotes % 2 == 0:
+                records.append((self._start, "".join(self._record)))
+                self._record.clear()
+                self._quotes = 0
+                self._start = self._line + 1
+
+        if final and self._record:
+            records.append((self._start, "".join(self._record)))
+            self._record.clear()
+
+        return records
+
+
+async def read_csv_rows(
+    file: UploadFile, *, encoding: CSVEncoding, chunk_size: int
+) -> AsyncIterator[CSVRow]:
+    """업로드 파일을 chunk_size 바이트씩 읽어 CSV row를 순서대로 돌려줍니다."""
+    decoder = codecs.getincrementaldecoder(_DECODERS[encoding])()
+    splitter = _RecordSplitter()
+
+    final = False
+    while not final:
+        chunk = await file.read(chunk_size)
+        final = not chunk
+
+        try:
+            text = decoder.decode(chunk, final=final)
+        except UnicodeDecodeError:
+            raise CSVFormatError(f"{encoding} 인코딩의 CSV 파일이 아닙니다.")
+
+        records = splitter.feed(text, final=final)
+        if not records:
+            continue
+
+        # record는 항상 완전한 한 row이므로 csv.reader도 record마다 정확히 한 row를 돌려줍니다.
+        rows = csv.reader(record for _, record in records)
+        for (line, _), values in zip(records, rows):
+            yield CSVRow(line=line, values=values)
+
+
+def parse_header(values: list[str]) -> CSVColumns:
+    positions: dict[str, int] = {}
+    for position, name in enumerate(values):
+        column = _HEADER_ALIASES.get(name.strip().lower())
+        if column is not None:
+            positions.setdefault(column, position)
+
+    missing = [c for c in ("date", "category", "amount") if c not in positions]
+    if missing:
+        raise CSVFormatError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    return CSVColumns(
+        date=positions["date"],
+        category=positions["category"],
+        amount=positions["amount"],
+        currency=positions.get("currency"),
+        description=positions.get("description"),
+    )
+
+
+def _parse_date(value: str) -> date:
+    # 2025-07-19, 2025.07.19, 2025/07/19, 20250719
+    return date.fromisoformat(value.strip().replace(".", "-").replace("/", "-"))
+
+
+def _parse_amount(value: str, currency: str) -> int:
+    """금액을 통화의 최소 단위 정수로 바꿉니다. (USD 12.50 -> 1250)"""
+    amount = Decimal(value.strip().replace(",", "").removesuffix("원"))
+    scaled = amount.scaleb(minor_units(currency))
+    if scaled != scaled.to_integral_value():
+        raise ValueError(value)
+
+    return int(scaled)
+
+
+def validate_rows(
+    rows: list[CSVRow], columns: CSVColumns, *, default_currency: str
+) -> tuple[list[ExpenseRecord], list[RowError]]:
+    """
+    row 묶음을 검증해 저장할 지출과 row별 오류로 나눕니다.
+    통화 컬럼이 없거나 비어 있으면 default_currency를 사용합니다.
+    """
+    records: list[ExpenseRecord] = []
+    errors: list[RowError] = []
+    width = max(position for position in columns if position is not None) + 1
+
+    for line, values in rows:
+        if len(values) < width:
+            values = values + [""] * (width - len(values))
+
+        category = _CATEGORIES.get(values[columns.category].strip().lower())
+        if category is None:
+            errors.append(
+                RowError(line, f"알 수 없는 카테고리입니다: {values[columns.category]}")
+            )
+            continue
+
+        currency = (
+            values[columns.currency].strip().upper()
+            if columns.currency is not None
+            else ""
+        ) or default_currency
+        if not _CURRENCY_PATTERN.fullmatch(currency):
+            errors.append(RowError(line, f"잘못된 통화입니다: {currency}"))
+            continue
+
+        try:
+            amount = _parse_amount(values[columns.amount], currency)
+        except (ValueError, ArithmeticError):
+            errors.append(
+                RowError(line, f"잘못된 금액입니다: {values[columns.amount]}")
+            )
+            continue
+
+        try:
+            expense_date = _parse_date(values[columns.date])
+        except ValueError:
+            errors.append(RowError(line, f"잘못된 날짜입니다: {values[columns.date]}"))
+            continue
+
+        description = (
+            values[columns.description].strip()
+            if columns.description is not None
+            else ""
+        )
+
+        records.append(
+            ExpenseRecord(line, category, amount, currency, description, expense_date)
+        )
+
+    return records, errors
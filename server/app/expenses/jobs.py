@@ -0,0 +1,19 @@
+from typing import Any
+
+from app.jobs.registry import JobContext, job_handler
+
+from .reconcile import find_drifts, fix_drifts
+
+
+@job_handler("expenses.reconcile")
+async def reconcile_expenses(
+    ctx: JobContext, payload: dict[str, Any]
+) -> dict[str, Any]:
+    """Plan.total_amount가 어긋난 계획을 찾아 바로잡습니다. payload: {"fix": bool}"""
+    drifts = await find_drifts(ctx.session)
+    await ctx.report_progress(0.5, f"{len(drifts)}개 계획의 총 금액이 어긋나 있습니다.")
+
+    if payload.get("fix", True):
+        await fix_drifts(ctx.session, [drift.plan_id for drift in drifts])
+
+    return {"drifts": [drift.model_dump(mode="json") for drift in drifts]}
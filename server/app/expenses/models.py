@@ -2,7 +2,7 @@ import enum
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base
@@ -24,11 +24,18 @@ class ExpenseCategory(enum.Enum):
 
 class Expense(Base):
     __tablename__ = "expense"
+    __table_args__ = (
+        Index(
+            "ix_expense_plan_date",
+            "plan_id",
+            "date",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
         init=False,
-        index=True,
         autoincrement=True,
     )
 
@@ -36,7 +43,21 @@ class Expense(Base):
     """카테고리"""
 
     amount: Mapped[int]
-    """금액"""
+    """금액 (currency의 최소 단위)"""
+
+    currency: Mapped[str] = mapped_column(
+        String(3),
+        default="KRW",
+        server_default="KRW",
+        kw_only=True,
+    )
+    """통화 (ISO 4217)"""
+
+    home_amount: Mapped[int] = mapped_column(default=0, kw_only=True)
+    """
+    여행 계획 주인의 기본 통화로 환산한 금액. 지출 날짜의 환율로 저장할 때 계산합니다.
+    Plan.total_amount와 지출 요약은 이 값을 합산합니다.
+    """
 
     description: Mapped[str]
     """설명"""
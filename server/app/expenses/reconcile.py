@@ -0,0 +1,98 @@
+"""
+Plan.total_amount와 실제 지출 합계의 차이를 찾아 바로잡습니다.
+
+total_amount는 지출이 바뀔 때마다 변경분만 더해 유지하므로, 직접 수정한 데이터나 버그로 어긋날 수 있습니다.
+
+    uv run poe reconcile-expenses          # 차이만 확인
+    uv run poe reconcile-expenses --fix    # 차이를 바로잡음
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import BigInteger, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import dispose_engines, get_engine
+from app.plans.events import PlanEventType, publish_plan_event
+from app.plans.models import Plan
+
+from .models import Expense
+from .schemas import TotalAmountDrift
+
+
+def _expected_amount():
+    return func.coalesce(
+        select(cast(func.sum(Expense.home_amount), BigInteger))
+        .where(Expense.plan_id == Plan.id, Expense.is_deleted.is_(False))
+        .scalar_subquery(),
+        0,
+    )
+
+
+async def find_drifts(session: AsyncSession) -> list[TotalAmountDrift]:
+    expected = _expected_amount()
+    result = await session.execute(
+        select(Plan.id, Plan.total_amount, expected)
+        .where(Plan.is_deleted.is_(False), Plan.total_amount != expected)
+        .order_by(Plan.id)
+    )
+    return [
+        TotalAmountDrift(plan_id=plan_id, total_amount=total, expected_amount=amount)
+        for plan_id, total, amount in result.tuples()
+    ]
+
+
+async def fix_drifts(session: AsyncSession, plan_ids: list[int]) -> None:
+    """
+    계획 row를 먼저 잠근 뒤 새 스냅샷에서 합계를 다시 계산합니다.
+    그 사이 커밋되지 않은 지출 변경은 잠금이 풀린 뒤 변경분을 더하므로 결과가 어긋나지 않습니다.
+    """
+    if not plan_ids:
+        return
+
+    await session.execute(
+        select(Plan.id).where(Plan.id.in_(plan_ids)).with_for_update()
+    )
+    await session.execute(
+        update(Plan)
+        .where(Plan.id.in_(plan_ids))
+        .values(total_amount=_expected_amount())
+    )
+    for plan_id in plan_ids:
+        await publish_plan_event(session, plan_id, PlanEventType.PLAN_UPDATED)
+
+
+async def reconcile(session: AsyncSession, *, fix: bool) -> list[TotalAmountDrift]:
+    """어긋난 계획 목록을 반환하고, fix가 True면 바로잡습니다."""
+    drifts = await find_drifts(session)
+
+    if fix:
+        await fix_drifts(session, [drift.plan_id for drift in drifts])
+
+    return drifts
+
+
+async def main() -> int:
+    fix = "--fix" in sys.argv[1:]
+
+    try:
+        async with get_engine().sessionmaker() as session:
+            drifts = await reconcile(session, fix=fix)
+            await session.commit()
+    finally:
+        await dispose_engines()
+
+    for drift in drifts:
+        print(
+            f"plan {drift.plan_id}: total_amount={drift.total_amount}, "
+            f"expected={drift.expected_amount}"
+        )
+    print(f"{len(drifts)} plan(s) {'fixed' if fix else 'drifted'}")
+
+    # 확인만 하는 경우 차이가 있으면 실패로 끝내 cron 등에서 알림을 받을 수 있게 합니다.
+    return 1 if drifts and not fix else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
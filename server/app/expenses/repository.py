@@ -0,0 +1,155 @@
+from datetime import date
+from typing import Any, Sequence
+
+from sqlalchemy import BigInteger, Integer, cast, column, func, insert, select, update
+from sqlalchemy import values as values_
+
+from app.database.copy import copy_records
+from app.database.deps import SessionDep
+from app.utils.dependency import dependency
+
+from .importer import ExpenseRecord
+from .models import Expense, ExpenseCategory
+from .reconcile import fix_drifts
+
+_COPY_COLUMNS = (
+    "category",
+    "amount",
+    "currency",
+    "home_amount",
+    "description",
+    "date",
+    "plan_id",
+    "is_deleted",
+)
+
+
+@dependency
+class ExpenseRepository:
+    session: SessionDep
+
+    async def create(self, *, plan_id: int, values: dict[str, Any]) -> Expense:
+        expense = await self.session.scalar(
+            insert(Expense).values(plan_id=plan_id, **values).returning(Expense)
+        )
+        assert expense is not None
+        return expense
+
+    async def find_for_update(self, *, plan_id: int, expense_id: int) -> Expense | None:
+        """금액 변경분을 계산하는 동안 다른 요청이 바꾸지 않도록 row를 잠그고 조회합니다."""
+        return await self.session.scalar(
+            select(Expense)
+            .where(
+                Expense.id == expense_id,
+                Expense.plan_id == plan_id,
+                Expense.is_deleted.is_(False),
+            )
+            .with_for_update()
+        )
+
+    async def update(self, *, expense_id: int, values: dict[str, Any]) -> Expense:
+        expense = await self.session.scalar(
+            update(Expense)
+            .where(Expense.id == expense_id)
+            .values(**values)
+            .returning(Expense)
+        )
+        assert expense is not None
+        return expense
+
+    async def delete(self, *, plan_id: int, expense_id: int) -> int | None:
+        """지출을 soft delete 하고 삭제한 금액(기본 통화)을 반환합니다. 이미 삭제된 경우 None"""
+        return await self.session.scalar(
+            update(Expense)
+            .where(
+                Expense.id == expense_id,
+                Expense.plan_id == plan_id,
+                Expense.is_deleted.is_(False),
+            )
+            .values(is_deleted=True)
+            .returning(Expense.home_amount)
+        )
+
+    async def copy_many(
+        self, *, plan_id: int, records: list[ExpenseRecord], home_amounts: list[int]
+    ) -> int:
+        """COPY로 지출을 한 번에 저장합니다. ORM flush를 거치지 않습니다."""
+        return await copy_records(
+            self.session,
+            "expense",
+            columns=_COPY_COLUMNS,
+            # DB enum에는 ExpenseCategory 이름(FOOD)이 저장됩니다.
+            records=(
+                (
+                    r.category.name,
+                    r.amount,
+                    r.currency,
+                    home_amount,
+                    r.description,
+                    r.date,
+                    plan_id,
+                    False,
+                )
+                for r, home_amount in zip(records, home_amounts)
+            ),
+        )
+
+    async def find_amounts(
+        self, *, plan_id: int
+    ) -> Sequence[tuple[int, int, str, date]]:
+        """(id, 금액, 통화, 날짜)"""
+        result = await self.session.execute(
+            select(Expense.id, Expense.amount, Expense.currency, Expense.date).where(
+                Expense.plan_id == plan_id, Expense.is_deleted.is_(False)
+            )
+        )
+        return result.tuples().all()
+
+    async def update_home_amounts(
+        self, *, plan_id: int, home_amounts: list[tuple[int, int]]
+    ) -> None:
+        """(id, 환산 금액) 목록을 UPDATE ... FROM (VALUES ...) 한 번으로 반영하고 총 금액을 다시 계산합니다."""
+        if home_amounts:
+            data = values_(
+                column("id", Integer), column("home_amount", BigInteger), name="data"
+            ).data(home_amounts)
+            await self.session.execute(
+                update(Expense)
+                .where(Expense.id == data.c.id)
+                .values(home_amount=data.c.home_amount),
+                execution_options={"synchronize_session": False},
+            )
+
+        await fix_drifts(self.session, [plan_id])
+
+    async def summarize_by_category(
+        self, *, plan_id: int
+    ) -> Sequence[tuple[ExpenseCategory, int, int]]:
+        """(카테고리, 기본 통화 금액 합계, 건수)"""
+        amount = cast(func.sum(Expense.home_amount), BigInteger)
+        result = await self.session.execute(
+            select(Expense.category, amount, func.count())
+            .where(Expense.plan_id == plan_id, Expense.is_deleted.is_(False))
+            .group_by(Expense.category)
+            .order_by(amount.desc())
+        )
+        return result.tuples().all()
+
+    async def summarize_by_day(
+        self, *, plan_id: int
+    ) -> Sequence[tuple[date, int, int]]:
+        """(날짜, 기본 통화 금액 합계, 누적 금액)"""
+        amount = func.sum(Expense.home_amount)
+        # 집계 결과 위에 window 함수를 적용하므로 GROUP BY 한 번으로 누적 금액까지 계산합니다.
+        running_total = func.sum(amount).over(order_by=Expense.date)
+        result = await self.session.execute(
+            select(
+                Expense.date,
+                cast(amount, BigInteger),
+                cast(running_total, BigInteger),
+            )
+            .where(Expense.plan_id == plan_id, Expense.is_deleted.is_(False))
+            .group_by(Expense.date)
+            .order_by(Expense.date)
+        )
+        return result.tuples().all()
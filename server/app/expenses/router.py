@@ -1,3 +1,82 @@
+from fastapi import UploadFile, status
+
 from app.core.router import create_router
+from app.currency.schemas import CurrencyCode
+
+from .importer import CSVEncoding
+from .schemas import (
+    ExpenseCreate,
+    ExpenseImportResult,
+    ExpenseRead,
+    ExpenseSummary,
+    ExpenseUpdate,
+)
+from .service import ExpenseService
 
 router = create_router()
+
+
+@router.post("/{plan_id}", status_code=status.HTTP_201_CREATED)
+async def create_expense(
+    expense_service: ExpenseService,
+    plan_id: int,
+    expense_data: ExpenseCreate,
+) -> ExpenseRead:
+    return await expense_service.create(plan_id=plan_id, expense_data=expense_data)
+
+
+@router.patch("/{plan_id}/{expense_id}", status_code=status.HTTP_200_OK)
+async def update_expense(
+    expense_service: ExpenseService,
+    plan_id: int,
+    expense_id: int,
+    expense_data: ExpenseUpdate,
+) -> ExpenseRead:
+    return await expense_service.update(
+        plan_id=plan_id, expense_id=expense_id, expense_data=expense_data
+    )
+
+
+@router.delete("/{plan_id}/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_expense(
+    expense_service: ExpenseService,
+    plan_id: int,
+    expense_id: int,
+) -> None:
+    await expense_service.delete(plan_id=plan_id, expense_id=expense_id)
+
+
+@router.get("/{plan_id}/summary", status_code=status.HTTP_200_OK)
+async def read_expense_summary(
+    expense_service: ExpenseService,
+    plan_id: int,
+) -> ExpenseSummary:
+    """카테고리별, 날짜별 지출 합계와 날짜별 누적 금액"""
+    return await expense_service.summarize(plan_id=plan_id)
+
+
+@router.post("/{plan_id}/import", status_code=status.HTTP_200_OK)
+async def import_expenses(
+    expense_service: ExpenseService,
+    plan_id: int,
+    file: UploadFile,
+    encoding: CSVEncoding = "utf-8",
+    currency: CurrencyCode | None = None,
+) -> ExpenseImportResult:
+    """
+    카드 명세서 등의 CSV로 지출 내역을 한 번에 등록합니다.
+    헤더에 date(날짜), category(카테고리), amount(금액) 컬럼이 필요하며 currency(통화), description(설명)은 선택입니다.
+    통화 컬럼이 없으면 currency, currency도 없으면 기본 통화로 처리합니다.
+    """
+    return await expense_service.import_csv(
+        plan_id=plan_id, file=file, encoding=encoding, currency=currency
+    )
+
+
+@router.post("/{plan_id}/reconvert", status_code=status.HTTP_204_NO_CONTENT)
+async def reconvert_expenses(
+    expense_service: ExpenseService,
+    plan_id: int,
+) -> None:
+    """계획의 모든 지출을 현재 기본 통화와 환율로 다시 환산합니다."""
+    await expense_service.reconvert(plan_id=plan_id)
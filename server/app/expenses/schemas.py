@@ -1,9 +1,23 @@
+import datetime
+from datetime import date
+from typing import Any
+
+from pydantic import field_validator
+
+from app.currency.schemas import CurrencyCode
 from app.schemas import APISchema
 
+from .models import ExpenseCategory
+
 
 class ExpenseBase(APISchema):
-    title: str
+    category: ExpenseCategory
     amount: int
+    """금액 (currency의 최소 단위)"""
+
+    currency: CurrencyCode = "KRW"
+    description: str
+    date: date
 
 
 class ExpenseCreate(ExpenseBase):
@@ -12,3 +26,78 @@ class ExpenseCreate(ExpenseBase):
 
 class ExpenseRead(ExpenseBase):
     id: int
+    home_amount: int
+    """여행 계획 주인의 기본 통화로 환산한 금액"""
+
+
+class ExpenseImportRowError(APISchema):
+    line: int
+    """CSV 파일의 줄 번호 (헤더가 1)"""
+
+    message: str
+
+
+class ExpenseImportResult(APISchema):
+    imported_count: int
+    imported_amount: int
+    """이번에 가져온 지출 금액의 합 (기본 통화)"""
+
+    total_amount: int
+    """가져온 뒤 여행 계획의 총 금액"""
+
+    error_count: int
+    errors: list[ExpenseImportRowError]
+    """오류가 난 row. 최대 IMPORT_MAX_REPORTED_ERRORS 개까지만 포함합니다."""
+
+
+class ExpenseUpdate(APISchema):
+    """보낸 필드만 변경합니다. 모든 필드가 필수 값이므로 null은 보낼 수 없습니다."""
+
+    category: ExpenseCategory | None = None
+    amount: int | None = None
+    currency: CurrencyCode | None = None
+    description: str | None = None
+    # 기본값이 먼저 대입되므로 필드 이름과 같은 date 대신 모듈 경로로 씁니다.
+    date: datetime.date | None = None
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def reject_null(cls, value: Any) -> Any:
+        # None 기본값은 보내지 않은 필드를 나타낼 뿐이고, 검증기는 보낸 값에만 실행됩니다.
+        if value is None:
+            raise ValueError("null로 변경할 수 없습니다.")
+        return value
+
+
+class ExpenseCategorySummary(APISchema):
+    category: ExpenseCategory
+    amount: int
+    count: int
+
+
+class ExpenseDailySummary(APISchema):
+    date: date
+    amount: int
+    running_total: int
+    """여행 시작부터 해당 날짜까지의 누적 금액"""
+
+
+class ExpenseSummary(APISchema):
+    currency: str
+    """금액의 통화. 여행 계획 주인의 기본 통화입니다."""
+
+    total_amount: int
+    categories: list[ExpenseCategorySummary]
+    """금액이 큰 카테고리부터"""
+
+    days: list[ExpenseDailySummary]
+    """지출이 있는 날짜만 날짜순으로"""
+
+
+class TotalAmountDrift(APISchema):
+    plan_id: int
+    total_amount: int
+    """Plan.total_amount에 저장되어 있던 값"""
+
+    expected_amount: int
+    """삭제되지 않은 지출의 기본 통화 금액(home_amount) 합계"""
@@ -0,0 +1,285 @@
+from datetime import date
+
+from fastapi import HTTPException, UploadFile
+
+from app.auth.deps import CurrentUser
+from app.currency.deps import RateCacheDep
+from app.currency.rates import ExchangeRateNotFoundError
+from app.plans.deps import PlanOwnerGuard
+from app.plans.events import PlanEventType
+from app.plans.repository import PlanRepository
+from app.utils.dependency import dependency
+
+from .config import expense_settings
+from .importer import (
+    CSVColumns,
+    CSVEncoding,
+    CSVFormatError,
+    CSVRow,
+    RowError,
+    parse_header,
+    read_csv_rows,
+    validate_rows,
+)
+from .repository import ExpenseRepository
+from .schemas import (
+    ExpenseCategorySummary,
+    ExpenseCreate,
+    ExpenseDailySummary,
+    ExpenseImportResult,
+    ExpenseImportRowError,
+    ExpenseRead,
+    ExpenseSummary,
+    ExpenseUpdate,
+)
+
+
+@dependency
+class ExpenseService:
+    current_user: CurrentUser
+    expense_repository: ExpenseRepository
+    plan_repository: PlanRepository
+    plan_owner_guard: PlanOwnerGuard
+    rates: RateCacheDep
+
+    def _to_home_amount(self, amount: int, currency: str, on: date) -> int:
+        try:
+            return self.rates.convert(
+                amount, currency, on, to=self.current_user.home_currency
+            )
+        except ExchangeRateNotFoundError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def create(self, *, plan_id: int, expense_data: ExpenseCreate) -> ExpenseRead:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        home_amount = self._to_home_amount(
+            expense_data.amount, expense_data.currency, expense_data.date
+        )
+        expense = await self.expense_repository.create(
+            plan_id=plan_id,
+            values=expense_data.model_dump() | {"home_amount": home_amount},
+        )
+        await self.plan_repository.add_total_amount(plan_id=plan_id, amount=home_amount)
+        await self.plan_repository.publish_event(
+            plan_id=plan_id, event_type=PlanEventType.EXPENSE_CREATED, ids=[expense.id]
+        )
+
+        return ExpenseRead.model_validate(expense)
+
+    async def update(
+        self, *, plan_id: int, expense_id: int, expense_data: ExpenseUpdate
+    ) -> ExpenseRead:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        expense = await self.expense_repository.find_for_update(
+            plan_id=plan_id, expense_id=expense_id
+        )
+        if expense is None:
+            raise HTTPException(status_code=404, detail="해당 지출을 찾을 수 없습니다.")
+
+        values = expense_data.model_dump(exclude_unset=True)
+        old_home_amount = expense.home_amount
+
+        if values.keys() & {"amount", "currency", "date"}:
+            values["home_amount"] = self._to_home_amount(
+                values.get("amount", expense.amount),
+                values.get("currency", expense.currency),
+                values.get("date", expense.date),
+            )
+
+        expense = await self.expense_repository.update(
+            expense_id=expense_id, values=values
+        )
+        if expense.home_amount != old_home_amount:
+            await self.plan_repository.add_total_amount(
+                plan_id=plan_id, amount=expense.home_amount - old_home_amount
+            )
+        await self.plan_repository.publish_event(
+            plan_id=plan_id, event_type=PlanEventType.EXPENSE_UPDATED, ids=[expense_id]
+        )
+
+        return ExpenseRead.model_validate(expense)
+
+    async def delete(self, *, plan_id: int, expense_id: int) -> None:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        home_amount = await self.expense_repository.delete(
+            plan_id=plan_id, expense_id=expense_id
+        )
+        if home_amount is None:
+            raise HTTPException(status_code=404, detail="해당 지출을 찾을 수 없습니다.")
+
+        await self.plan_repository.add_total_amount(
+            plan_id=plan_id, amount=-home_amount
+        )
+        await self.plan_repository.publish_event(
+            plan_id=plan_id, event_type=PlanEventType.EXPENSE_DELETED, ids=[expense_id]
+        )
+
+    async def summarize(self, *, plan_id: int) -> ExpenseSummary:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        categories = [
+            ExpenseCategorySummary(category=category, amount=amount, count=count)
+            for category, amount, count in await self.expense_repository.summarize_by_category(
+                plan_id=plan_id
+            )
+        ]
+        days = [
+            ExpenseDailySummary(date=day, amount=amount, running_total=running_total)
+            for day, amount, running_total in await self.expense_repository.summarize_by_day(
+                plan_id=plan_id
+            )
+        ]
+
+        return ExpenseSummary(
+            currency=self.current_user.home_currency,
+            total_amount=sum(category.amount for category in categories),
+            categories=categories,
+            days=days,
+        )
+
+    async def reconvert(self, *, plan_id: int) -> None:
+        """
+        계획의 모든 지출을 현재 기본 통화와 환율로 다시 환산합니다.
+        기본 통화를 바꿨거나 환율을 새로 불러온 뒤에 사용합니다.
+        """
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        rows = await self.expense_repository.find_amounts(plan_id=plan_id)
+
+        try:
+            home_amounts = self.rates.convert_many(
+                ((amount, currency, on) for _, amount, currency, on in rows),
+                to=self.current_user.home_currency,
+            )
+        except ExchangeRateNotFoundError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        await self.expense_repository.update_home_amounts(
+            plan_id=plan_id,
+            home_amounts=[
+                (expense_id, home_amount)
+                for (expense_id, *_), home_amount in zip(rows, home_amounts)
+            ],
+        )
+        await self.plan_repository.publish_event(
+            plan_id=plan_id,
+            event_type=PlanEventType.EXPENSE_UPDATED,
+            ids=[expense_id for expense_id, *_ in rows],
+        )
+
+    async def import_csv(
+        self,
+        *,
+        plan_id: int,
+        file: UploadFile,
+        encoding: CSVEncoding,
+        currency: str | None,
+    ) -> ExpenseImportResult:
+        """
+        CSV의 올바른 row만 저장하고, 잘못된 row는 오류로 돌려줍니다.
+        인코딩이나 헤더처럼 파일 전체의 오류는 400으로 응답하며, 이미 저장한 row도 함께 롤백됩니다.
+        """
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        default_currency = currency or self.current_user.home_currency
+        columns: CSVColumns | None = None
+        batch: list[CSVRow] = []
+        result = ExpenseImportResult(
+            imported_count=0,
+            imported_amount=0,
+            total_amount=0,
+            error_count=0,
+            errors=[],
+        )
+
+        try:
+            async for row in read_csv_rows(
+                file, encoding=encoding, chunk_size=expense_settings.IMPORT_CHUNK_SIZE
+            ):
+                if columns is None:
+                    columns = parse_header(row.values)
+                    continue
+                if not any(value.strip() for value in row.values):
+                    continue
+
+                batch.append(row)
+                if len(batch) >= expense_settings.IMPORT_BATCH_SIZE:
+                    await self._import_batch(
+                        plan_id, batch, columns, default_currency, result
+                    )
+                    batch.clear()
+        except CSVFormatError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if columns is None:
+            raise HTTPException(status_code=400, detail="빈 CSV 파일입니다.")
+
+        if batch:
+            await self._import_batch(plan_id, batch, columns, default_currency, result)
+
+        total_amount = await self.plan_repository.add_total_amount(
+            plan_id=plan_id, amount=result.imported_amount
+        )
+        result.total_amount = total_amount or 0
+        if result.imported_count:
+            await self.plan_repository.publish_event(
+                plan_id=plan_id, event_type=PlanEventType.EXPENSE_CREATED
+            )
+
+        return result
+
+    async def _import_batch(
+        self,
+        plan_id: int,
+        batch: list[CSVRow],
+        columns: CSVColumns,
+        default_currency: str,
+        result: ExpenseImportResult,
+    ) -> None:
+        records, errors = validate_rows(
+            batch, columns, default_currency=default_currency
+        )
+
+        # 환율이 없는 row는 (통화, 날짜) 조합마다 한 번만 확인해 오류로 돌립니다.
+        # 변환에는 row 통화와 기준 통화의 환율이 모두 필요합니다.
+        home_currency = self.current_user.home_currency
+        missing: dict[tuple[str, date], str] = {}
+        for currency, on in {(r.currency, r.date) for r in records}:
+            if currency == home_currency:
+                continue
+            for needed in (currency, home_currency):
+                if not self.rates.has_rate(needed, on):
+                    missing[currency, on] = needed
+                    break
+
+        if missing:
+            errors.extend(
+                RowError(
+                    record.line,
+                    str(ExchangeRateNotFoundError(missing[key], record.date)),
+                )
+                for record in records
+                if (key := (record.currency, record.date)) in missing
+            )
+            errors.sort(key=lambda error: error.line)
+            records = [r for r in records if (r.currency, r.date) not in missing]
+
+        if records:
+            home_amounts = self.rates.convert_many(
+                ((r.amount, r.currency, r.date) for r in records),
+                to=home_currency,
+            )
+            result.imported_count += await self.expense_repository.copy_many(
+                plan_id=plan_id, records=records, home_amounts=home_amounts
+            )
+            result.imported_amount += sum(home_amounts)
+
+        result.error_count += len(errors)
+        room = expense_settings.IMPORT_MAX_REPORTED_ERRORS - len(result.errors)
+        result.errors.extend(
+            ExpenseImportRowError(line=error.line, message=error.message)
+            for error in errors[: max(room, 0)]
+        )
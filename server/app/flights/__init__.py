@@ -1,3 +1,3 @@
-from .models import Flight
+from .models import Flight, ParsedDocument
 
-__all__ = ["Flight"]
+__all__ = ["Flight", "ParsedDocument"]
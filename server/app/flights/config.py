@@ -0,0 +1,12 @@
+from app.config import BaseConfig
+
+
+class FlightConfig(BaseConfig):
+    TICKET_MAX_SIZE: int = 10 * 1024 * 1024
+    """업로드할 수 있는 e-ticket 파일의 최대 크기 (바이트)"""
+
+    TICKET_PARSE_TIMEOUT: float = 30.0
+    """e-ticket 분석을 기다리는 최대 시간 (초)"""
+
+
+flight_settings = FlightConfig.create()
@@ -0,0 +1,223 @@
+"""
+e-ticket(항공권 확인서)에서 항공편 정보를 추출합니다.
+
+app.common.process의 프로세스 풀에서 실행되므로 표준 라이브러리와 pypdf(PDF)만 사용하고, 결과는 pickle 할 수 있는
+dict 목록으로 반환합니다.
+"""
+
+import html
+import io
+import re
+from datetime import datetime
+from typing import Iterator
+
+PARSER_VERSION = 1
+"""추출 규칙을 바꾸면 올려서 이전 분석 결과 캐시를 무효화합니다."""
+
+AIRLINES = {
+    "KE": "대한항공",
+    "OZ": "아시아나항공",
+    "7C": "제주항공",
+    "LJ": "진에어",
+    "TW": "티웨이항공",
+    "BX": "에어부산",
+    "RS": "에어서울",
+    "ZE": "이스타항공",
+    "YP": "에어프레미아",
+    "JL": "일본항공",
+    "NH": "전일본공수",
+    "MM": "피치항공",
+    "CX": "캐세이퍼시픽",
+    "SQ": "싱가포르항공",
+    "VN": "베트남항공",
+    "VJ": "비엣젯항공",
+    "DL": "델타항공",
+    "UA": "유나이티드항공",
+    "AA": "아메리칸항공",
+}
+
+SEAT_CLASSES = (
+    ("first", re.compile(r"일등석|퍼스트|\bFIRST\b", re.IGNORECASE)),
+    (
+        "business",
+        re.compile(r"비즈니스|프레스티지|\bBUSINESS\b|\bPRESTIGE\b", re.IGNORECASE),
+    ),
+    (
+        "premium_economy",
+        re.compile(
+            r"프리미엄\s*(?:일반석|이코노미)|\bPREMIUM\s*ECONOMY\b", re.IGNORECASE
+        ),
+    ),
+    ("economy", re.compile(r"일반석|이코노미|\bECONOMY\b", re.IGNORECASE)),
+)
+
+_MONTHS = {
+    month: index + 1
+    for index, month in enumerate(
+        "JAN FEB MAR APR MAY JUN JUL AUG SEP OCT NOV DEC".split()
+    )
+}
+
+# 항공사 코드는 영문 2자리 또는 영문+숫자 조합입니다. (KE, 7C 등)
+_FLIGHT_NUMBER = re.compile(r"\b((?:[A-Z]{2}|[A-Z]\d|\d[A-Z]))\s?(\d{1,4})\b")
+_AIRPORT = re.compile(r"\(([A-Z]{3})\)|\b([A-Z]{3})\b")
+_DATETIMES = (
+    # 2026-10-20 09:30, 2026.10.20(화) 09:30
+    re.compile(
+        r"(?P<year>\d{4})[-./]\s?(?P<month>\d{1,2})[-./]\s?(?P<day>\d{1,2})\.?"
+        r"\s*(?:\([^)]{1,3}\))?\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+    ),
+    # 2026년 10월 20일 (화) 09:30
+    re.compile(
+        r"(?P<year>\d{4})년\s*(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일"
+        r"\s*(?:\([^)]{1,3}\))?\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+    ),
+    # 20OCT26 0930, 20OCT 09:30
+    re.compile(
+        r"\b(?P<day>\d{1,2})(?P<mon>[A-Z]{3})(?P<year>\d{2}|\d{4})?"
+        r"\s+(?P<hour>\d{2}):?(?P<minute>\d{2})\b"
+    ),
+)
+_SEAT_NUMBER = re.compile(
+    r"(?:좌석(?:\s*번호)?|SEAT(?:\s*NO\.?)?)\s*[:：]?\s*(\d{1,2}[A-K])\b", re.IGNORECASE
+)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t ]+")
+
+# 공항 코드처럼 보이는 영문 3자리 단어
+_NOT_AIRPORTS = (
+    frozenset("KRW USD JPY EUR CNY PNR ETK ADT CHD INF THE AND FOR MRS TKT".split())
+    | _MONTHS.keys()
+)
+
+
+class TicketParseError(Exception):
+    pass
+
+
+def extract_text(data: bytes, content_type: str | None) -> str:
+    if data.startswith(b"%PDF-") or content_type == "application/pdf":
+        return _extract_pdf_text(data)
+
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        try:
+            text = data.decode("cp949")
+        except UnicodeDecodeError:
+            raise TicketParseError("텍스트, HTML, PDF 파일만 읽을 수 있습니다.")
+
+    if content_type == "text/html" or "<html" in text[:1000].lower():
+        text = html.unescape(_HTML_TAG.sub("\n", text))
+
+    return text
+
+
+def _extract_pdf_text(data: bytes) -> str:
+    # API 프로세스가 pypdf를 불러오지 않도록 PDF를 읽는 프로세스 풀에서만 import 합니다.
+    from pypdf import PdfReader
+    from pypdf.errors import PdfReadError
+
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    except PdfReadError:
+        raise TicketParseError("PDF 파일을 읽을 수 없습니다.")
+
+
+def _datetimes(text: str, default_year: int) -> Iterator[tuple[int, datetime]]:
+    for pattern in _DATETIMES:
+        for match in pattern.finditer(text):
+            groups = match.groupdict()
+            try:
+                if groups.get("mon") is not None:
+                    month = _MONTHS[groups["mon"]]
+                    year = int(groups["year"] or default_year)
+                    year += 2000 if year < 100 else 0
+                else:
+                    month = int(groups["month"])
+                    year = int(groups["year"])
+
+                yield (
+                    match.start(),
+                    datetime(
+                        year,
+                        month,
+                        int(groups["day"]),
+                        int(groups["hour"]),
+                        int(groups["minute"]),
+                    ),
+                )
+            except (KeyError, ValueError):
+                continue
+
+
+def _airports(text: str) -> list[str]:
+    return [
+        code
+        for match in _AIRPORT.finditer(text)
+        if (code := match.group(1) or match.group(2)) not in _NOT_AIRPORTS
+    ]
+
+
+def _seat_class(text: str) -> str:
+    for name, pattern in SEAT_CLASSES:
+        if pattern.search(text):
+            return name
+    return ""
+
+
+def parse_segments(text: str) -> list[dict[str, str]]:
+    """
+    항공편 번호마다 다음 항공편 번호 전까지를 한 구간으로 보고, 그 안에서
+    공항 코드 두 개(출발, 도착)와 날짜/시간 두 개(출발, 도착)를 찾은 구간만 반환합니다.
+    """
+    text = _SPACES.sub(" ", text)
+    years = [
+        dt.year for _, dt in _datetimes(text, datetime.now().year) if dt.year > 2000
+    ]
+    default_year = years[0] if years else datetime.now().year
+
+    matches = [
+        m for m in _FLIGHT_NUMBER.finditer(text) if not m.group(2).startswith("0")
+    ]
+    segments: list[dict[str, str]] = []
+    seen: set[tuple[str, str]] = set()
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end() : end]
+
+        airports = _airports(body)
+        times = [dt for _, dt in sorted(_datetimes(body, default_year))]
+        if len(airports) < 2 or len(times) < 2:
+            continue
+
+        airline_code, number = match.groups()
+        flight_number = f"{airline_code}{number}"
+        departure_time = times[0].isoformat()
+        # 같은 편명이 여러 번 나오는 확인서(요약표 + 상세)에서 한 번만 반환합니다.
+        if (flight_number, departure_time) in seen:
+            continue
+        seen.add((flight_number, departure_time))
+
+        seat_number = _SEAT_NUMBER.search(body)
+        segments.append(
+            {
+                "airline": AIRLINES.get(airline_code, airline_code),
+                "flight_number": flight_number,
+                "departure_airport": airports[0],
+                "arrival_airport": airports[1],
+                "departure_time": departure_time,
+                "arrival_time": times[1].isoformat(),
+                "seat_class": _seat_class(body),
+                "seat_number": seat_number.group(1).upper() if seat_number else "",
+            }
+        )
+
+    return segments
+
+
+def parse_ticket(data: bytes, content_type: str | None) -> list[dict[str, str]]:
+    """프로세스 풀에서 실행하는 진입점"""
+    return parse_segments(extract_text(data, content_type))
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base
@@ -13,11 +14,18 @@ if TYPE_CHECKING:
 
 class Flight(Base):
     __tablename__ = "flight"
+    __table_args__ = (
+        Index(
+            "ix_flight_plan_departure_time",
+            "plan_id",
+            "departure_time",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
         init=False,
-        index=True,
         autoincrement=True,
     )
 
@@ -60,3 +68,24 @@ class Flight(Base):
     )
 
     is_deleted: Mapped[bool] = mapped_column(default=False, nullable=False)
+
+
+class ParsedDocument(Base):
+    """
+    업로드된 문서(e-ticket 등)의 분석 결과 캐시
+    같은 파일을 다시 올리면 분석하지 않고 저장된 결과를 사용합니다.
+    """
+
+    __tablename__ = "parsed_document"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    """파일 내용의 SHA-256 (hex)"""
+
+    parser_version: Mapped[int]
+    """분석에 사용한 파서 버전. 현재 버전과 다르면 다시 분석합니다."""
+
+    result: Mapped[list[dict[str, Any]]] = mapped_column(JSONB)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False
+    )
@@ -0,0 +1,91 @@
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    column,
+    exists,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy import values as values_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.types import TypeEngine
+
+from app.database.deps import SessionDep
+from app.utils.dependency import dependency
+
+from .models import Flight, ParsedDocument
+from .schemas import FlightCreate
+
+_COLUMNS: tuple[tuple[str, type[TypeEngine[Any]]], ...] = (
+    ("airline", String),
+    ("flight_number", String),
+    ("departure_airport", String),
+    ("arrival_airport", String),
+    ("departure_time", DateTime),
+    ("arrival_time", DateTime),
+    ("seat_class", String),
+    ("seat_number", String),
+)
+
+
+@dependency
+class FlightRepository:
+    session: SessionDep
+
+    async def find_parsed(
+        self, *, digest: str, parser_version: int
+    ) -> list[dict[str, Any]] | None:
+        return await self.session.scalar(
+            select(ParsedDocument.result).where(
+                ParsedDocument.digest == digest,
+                ParsedDocument.parser_version == parser_version,
+            )
+        )
+
+    async def save_parsed(
+        self, *, digest: str, parser_version: int, result: list[dict[str, Any]]
+    ) -> None:
+        statement = pg_insert(ParsedDocument).values(
+            digest=digest, parser_version=parser_version, result=result
+        )
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ParsedDocument.digest],
+                set_={
+                    "parser_version": statement.excluded.parser_version,
+                    "result": statement.excluded.result,
+                },
+            )
+        )
+
+    async def create_many(
+        self, *, plan_id: int, flights: list[FlightCreate]
+    ) -> Sequence[Flight]:
+        """
+        INSERT ... SELECT 한 번으로 항공편들을 저장하고 저장한 항공편을 반환합니다.
+        계획에 이미 있는 항공편(편명과 출발 시간이 같은)은 건너뜁니다.
+        """
+        data = values_(
+            *(column(name, type_) for name, type_ in _COLUMNS), name="data"
+        ).data(
+            [tuple(getattr(flight, name) for name, _ in _COLUMNS) for flight in flights]
+        )
+
+        source = select(*data.c, literal(plan_id, Integer)).where(
+            ~exists().where(
+                Flight.plan_id == plan_id,
+                Flight.flight_number == data.c.flight_number,
+                Flight.departure_time == data.c.departure_time,
+                Flight.is_deleted.is_(False),
+            )
+        )
+        result = await self.session.scalars(
+            insert(Flight)
+            .from_select([name for name, _ in _COLUMNS] + ["plan_id"], source)
+            .returning(Flight)
+        )
+        return result.all()
@@ -1,3 +1,21 @@
+from fastapi import UploadFile, status
+
 from app.core.router import create_router
 
+from .schemas import FlightRead
+from .service import FlightService
+
 router = create_router()
+
+
+@router.post("/{plan_id}/import-ticket", status_code=status.HTTP_201_CREATED)
+async def import_ticket(
+    flight_service: FlightService,
+    plan_id: int,
+    file: UploadFile,
+) -> list[FlightRead]:
+    """
+    e-ticket(항공권 확인서) 파일에서 항공편을 추출해 계획에 추가하고, 새로 추가한 항공편을 반환합니다.
+    텍스트, HTML, PDF 파일을 읽을 수 있으며 이미 계획에 있는 항공편은 건너뜁니다.
+    """
+    return await flight_service.import_ticket(plan_id=plan_id, file=file)
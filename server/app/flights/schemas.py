@@ -4,9 +4,14 @@ from app.schemas import APISchema
 
 
 class FlightBase(APISchema):
-    title: str
+    airline: str
+    flight_number: str
+    departure_airport: str
+    arrival_airport: str
     departure_time: datetime
     arrival_time: datetime
+    seat_class: str
+    seat_number: str
 
 
 class FlightCreate(FlightBase):
@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import logging
+
+from fastapi import HTTPException, UploadFile
+
+from app.common.process import run_in_process
+from app.plans.deps import PlanOwnerGuard
+from app.plans.events import PlanEventType
+from app.plans.repository import PlanRepository
+from app.utils.dependency import dependency
+
+from .config import flight_settings
+from .eticket import PARSER_VERSION, TicketParseError, parse_ticket
+from .repository import FlightRepository
+from .schemas import FlightCreate, FlightRead
+
+logger = logging.getLogger(__name__)
+
+
+@dependency
+class FlightService:
+    flight_repository: FlightRepository
+    plan_repository: PlanRepository
+    plan_owner_guard: PlanOwnerGuard
+
+    async def import_ticket(
+        self, *, plan_id: int, file: UploadFile
+    ) -> list[FlightRead]:
+        """
+        e-ticket에서 항공편을 추출해 계획에 추가합니다.
+        분석은 프로세스 풀에서 실행하고, 결과는 파일 해시로 캐시하므로 같은 파일은 다시 분석하지 않습니다.
+        """
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        data = await file.read(flight_settings.TICKET_MAX_SIZE + 1)
+        if len(data) > flight_settings.TICKET_MAX_SIZE:
+            raise HTTPException(status_code=413, detail="파일이 너무 큽니다.")
+
+        digest = await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
+        segments = await self.flight_repository.find_parsed(
+            digest=digest, parser_version=PARSER_VERSION
+        )
+
+        if segments is None:
+            try:
+                segments = await run_in_process(
+                    parse_ticket,
+                    data,
+                    file.content_type,
+                    timeout=flight_settings.TICKET_PARSE_TIMEOUT,
+                )
+            except TicketParseError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except TimeoutError:
+                logger.warning("E-ticket parsing timed out: digest=%s", digest)
+                raise HTTPException(
+                    status_code=400,
+                    detail="파일을 분석하는 데 시간이 너무 오래 걸립니다.",
+                )
+
+            await self.flight_repository.save_parsed(
+                digest=digest, parser_version=PARSER_VERSION, result=segments
+            )
+
+        if not segments:
+            raise HTTPException(
+                status_code=400, detail="파일에서 항공편 정보를 찾을 수 없습니다."
+            )
+
+        flights = await self.flight_repository.create_many(
+            plan_id=plan_id,
+            flights=[FlightCreate.model_validate(segment) for segment in segments],
+        )
+        if flights:
+            await self.plan_repository.publish_event(
+                plan_id=plan_id,
+                event_type=PlanEventType.FLIGHT_CREATED,
+                ids=[flight.id for flight in flights],
+            )
+
+        return [FlightRead.model_validate(flight) for flight in flights]
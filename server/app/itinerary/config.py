@@ -0,0 +1,12 @@
+from app.config import BaseConfig
+
+
+class ItineraryConfig(BaseConfig):
+    CALENDAR_MAX_DAYS: int = 42
+    """달력 조회 한 번에 요청할 수 있는 최대 일 수. 월간 달력(6주)을 한 번에 불러올 수 있는 크기입니다."""
+
+    BATCH_MAX_SIZE: int = 500
+    """일괄 이동/복사 요청 한 번에 포함할 수 있는 최대 항목 수"""
+
+
+itinerary_settings = ItineraryConfig.create()
@@ -1,7 +1,8 @@
-from datetime import date, time
+from datetime import date, datetime, time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import Computed, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import TSRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base
@@ -9,14 +10,41 @@ from app.models import Base
 if TYPE_CHECKING:
     from app.plans.models import Plan
 
+TIME_RANGE_EXPRESSION = """
+tsrange(
+    date + start_time,
+    CASE WHEN end_time < start_time THEN date + 1 + end_time ELSE date + end_time END,
+    CASE WHEN end_time = start_time THEN '[]' ELSE '[)' END
+)
+"""
+"""
+종료 시간이 시작 시간보다 이르면 자정을 넘기는 일정으로 보고 다음 날 종료 시간까지로 계산합니다.
+시작과 종료가 같은 일정은 빈 범위가 되지 않도록 양 끝을 포함합니다.
+"""
+
 
 class Itinerary(Base):
     __tablename__ = "itinerary"
+    __table_args__ = (
+        Index(
+            "ix_itinerary_plan_date_start_time",
+            "plan_id",
+            "date",
+            "start_time",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        Index(
+            "ix_itinerary_plan_time_range",
+            "plan_id",
+            "time_range",
+            postgresql_using="gist",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
         init=False,
-        index=True,
         autoincrement=True,
     )
 
@@ -44,6 +72,13 @@ class Itinerary(Base):
     end_time: Mapped[time]
     """종료 시간"""
 
+    time_range: Mapped[Range[datetime]] = mapped_column(
+        TSRANGE,
+        Computed(TIME_RANGE_EXPRESSION, persisted=True),
+        init=False,
+    )
+    """일정이 차지하는 시간 범위. 달력 조회에서 ix_itinerary_plan_time_range로 겹치는 일정을 찾습니다."""
+
     plan_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("plan.id"),
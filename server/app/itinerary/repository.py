@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Date, Integer, Time, column, func, insert, select, update
+from sqlalchemy import values as values_
+from sqlalchemy.dialects.postgresql import Range
+
+from app.database.deps import SessionDep
+from app.plans.models import Plan
+from app.utils.dependency import dependency
+
+from .models import Itinerary
+from .schemas import ItineraryPlacement
+
+# 복사할 때 원본에서 그대로 가져오는 컬럼
+_COPIED_COLUMNS = ("title", "description", "country", "city", "location", "plan_id")
+
+
+def _placements(placements: list[ItineraryPlacement]):
+    return values_(
+        column("id", Integer),
+        column("date", Date),
+        column("start_time", Time),
+        column("end_time", Time),
+        name="placement",
+    ).data([(p.id, p.new_date, p.new_start_time, p.new_end_time) for p in placements])
+
+
+@dependency
+class ItineraryRepository:
+    session: SessionDep
+
+    async def find_by_owner_in_range(
+        self, *, owner_id: int, start: datetime, end: datetime
+    ) -> Sequence[Itinerary]:
+        """
+        유저의 모든 계획에서 [start, end)와 겹치는 일정을 시작 시간 순으로 조회합니다.
+        계획마다 ix_itinerary_plan_time_range 인덱스로 범위 스캔합니다.
+        """
+        result = await self.session.scalars(
+            select(Itinerary)
+            .join(Plan, Plan.id == Itinerary.plan_id)
+            .where(
+                Plan.owner_id == owner_id,
+                Plan.is_deleted.is_(False),
+                Itinerary.is_deleted.is_(False),
+                Itinerary.time_range.overlaps(Range(start, end)),
+            )
+            .order_by(func.lower(Itinerary.time_range), Itinerary.id)
+        )
+        return result.all()
+
+    async def move_many(
+        self, *, owner_id: int, placements: list[ItineraryPlacement]
+    ) -> Sequence[Itinerary]:
+        """
+        UPDATE ... FROM (VALUES ...) 한 번으로 일정들을 옮기고 옮긴 일정을 반환합니다.
+        owner_id의 계획에 속한 일정만 옮기므로, 반환된 개수로 권한을 확인합니다.
+        """
+        data = _placements(placements)
+        result = await self.session.scalars(
+            update(Itinerary)
+            .where(
+                Itinerary.id == data.c.id,
+                Itinerary.is_deleted.is_(False),
+                Plan.id == Itinerary.plan_id,
+                Plan.owner_id == owner_id,
+                Plan.is_deleted.is_(False),
+            )
+            .values(
+                date=data.c.date,
+                start_time=data.c.start_time,
+                end_time=data.c.end_time,
+            )
+            .returning(Itinerary),
+            execution_options={"synchronize_session": False},
+        )
+        return result.all()
+
+    async def copy_many(
+        self, *, owner_id: int, placements: list[ItineraryPlacement]
+    ) -> Sequence[Itinerary]:
+        """
+        INSERT ... SELECT 한 번으로 일정들을 새 위치에 복사하고 새 일정을 반환합니다.
+        owner_id의 계획에 속한 일정만 복사하므로, 반환된 개수로 권한을 확인합니다.
+        """
+        data = _placements(placements)
+        source = (
+            select(
+                *(Itinerary.__table__.c[name] for name in _COPIED_COLUMNS),
+                data.c.date,
+                data.c.start_time,
+                data.c.end_time,
+            )
+            .join(data, data.c.id == Itinerary.id)
+            .join(Plan, Plan.id == Itinerary.plan_id)
+            .where(
+                Itinerary.is_deleted.is_(False),
+                Plan.owner_id == owner_id,
+                Plan.is_deleted.is_(False),
+            )
+        )
+        result = await self.session.scalars(
+            insert(Itinerary)
+            .from_select([*_COPIED_COLUMNS, "date", "start_time", "end_time"], source)
+            .returning(Itinerary)
+        )
+        return result.all()
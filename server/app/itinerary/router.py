@@ -1,3 +1,38 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import Query, status
+
 from app.core.router import create_router
 
-router = create_router()
+from .schemas import CalendarRead, ItineraryBatch, ItineraryBatchResult
+from .service import ItineraryService
+
+router = create_router(fast_json=True)
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def read_calendar(
+    itinerary_service: ItineraryService,
+    start_date: Annotated[date, Query(alias="from")],
+    end_date: Annotated[date, Query(alias="to")],
+) -> CalendarRead:
+    """
+    내 모든 여행 계획의 일정을 달력 형태로 조회합니다. from, to 날짜를 모두 포함합니다.
+    월간/주간 달력을 스크롤할 때 보이는 기간만큼씩 요청합니다.
+    """
+    return await itinerary_service.read_calendar(
+        start_date=start_date, end_date=end_date
+    )
+
+
+@router.post("/batch", status_code=status.HTTP_200_OK)
+async def apply_itinerary_batch(
+    itinerary_service: ItineraryService,
+    batch: ItineraryBatch,
+) -> ItineraryBatchResult:
+    """
+    여러 일정을 한 번에 옮기거나 복사합니다. (달력 드래그 앤 드롭)
+    내 일정이 아닌 항목이 포함되어 있으면 404로 응답하고 아무것도 반영하지 않습니다.
+    """
+    return await itinerary_service.apply_batch(batch=batch)
@@ -1,12 +1,17 @@
-from datetime import datetime
+from datetime import date, time
 
 from app.schemas import APISchema
 
 
 class ItineraryBase(APISchema):
     title: str
-    start_time: datetime
-    end_time: datetime
+    description: str
+    country: str
+    city: str
+    location: str
+    date: date
+    start_time: time
+    end_time: time
 
 
 class ItineraryCreate(ItineraryBase):
@@ -15,3 +20,54 @@ class ItineraryCreate(ItineraryBase):
 
 class ItineraryRead(ItineraryBase):
     id: int
+
+
+class CalendarItem(ItineraryRead):
+    plan_id: int
+
+
+class CalendarSlot(APISchema):
+    hour: int
+    """0 ~ 23시 슬롯"""
+
+    items: list[CalendarItem]
+    """이 슬롯에서 시작하는 일정. 전날부터 이어지는 일정은 0시 슬롯에 들어갑니다."""
+
+
+class CalendarDay(APISchema):
+    date: date
+    slots: list[CalendarSlot]
+    """일정이 있는 슬롯만 시간 순으로 포함합니다."""
+
+
+class CalendarRead(APISchema):
+    start_date: date
+    end_date: date
+    days: list[CalendarDay]
+    """일정이 있는 날만 날짜 순으로 포함합니다."""
+
+
+class ItineraryPlacement(APISchema):
+    """일정을 옮기거나 복사할 위치"""
+
+    id: int
+    new_date: date
+    new_start_time: time
+    new_end_time: time
+
+
+class ItineraryBatch(APISchema):
+    moves: list[ItineraryPlacement] = []
+    """id의 일정을 새 위치로 옮깁니다."""
+
+    copies: list[ItineraryPlacement] = []
+    """id의 일정을 같은 계획의 새 위치에 복사합니다. 이동보다 나중에 적용됩니다."""
+
+    allow_conflicts: bool = False
+    """False면 옮기거나 복사한 일정이 다른 일정/항공편과 겹칠 때 409로 응답하고 반영하지 않습니다."""
+
+
+class ItineraryBatchResult(APISchema):
+    moved: list[CalendarItem]
+    copied: list[CalendarItem]
+    """새로 만든 일정 (id 순)"""
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Sequence
+
+from fastapi import HTTPException
+
+from app.auth.deps import CurrentUser
+from app.plans.events import PlanEventType
+from app.plans.repository import PlanRepository
+from app.plans.schedule import ScheduleEntry, ScheduleKind, build_indexes
+from app.utils.dependency import dependency
+
+from .config import itinerary_settings
+from .models import Itinerary
+from .repository import ItineraryRepository
+from .schemas import (
+    CalendarDay,
+    CalendarItem,
+    CalendarRead,
+    CalendarSlot,
+    ItineraryBatch,
+    ItineraryBatchResult,
+)
+
+
+@dependency
+class ItineraryService:
+    current_user: CurrentUser
+    itinerary_repository: ItineraryRepository
+    plan_repository: PlanRepository
+
+    async def read_calendar(self, *, start_date: date, end_date: date) -> CalendarRead:
+        """start_date부터 end_date까지(포함) 유저의 모든 일정을 날짜와 시간 슬롯별로 묶습니다."""
+        if end_date < start_date:
+            raise HTTPException(
+                status_code=400, detail="종료 날짜가 시작 날짜보다 이릅니다."
+            )
+        if (end_date - start_date).days >= itinerary_settings.CALENDAR_MAX_DAYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 {itinerary_settings.CALENDAR_MAX_DAYS}일까지 조회할 수 있습니다.",
+            )
+
+        itineraries = await self.itinerary_repository.find_by_owner_in_range(
+            owner_id=self.current_user.id,
+            start=datetime.combine(start_date, time.min),
+            end=datetime.combine(end_date + timedelta(days=1), time.min),
+        )
+
+        slots: defaultdict[date, defaultdict[int, list[CalendarItem]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for itinerary in itineraries:
+            lower, upper = itinerary.time_range.lower, itinerary.time_range.upper
+            assert lower is not None and upper is not None
+
+            item = CalendarItem.model_validate(itinerary)
+            # 자정을 넘기는 일정은 걸쳐 있는 날마다 넣습니다. 자정에 끝나는 일정은 다음 날에 넣지 않습니다.
+            first = max(lower.date(), start_date)
+            last = min((upper - timedelta(microseconds=1)).date(), end_date)
+
+            day = first
+            while day <= max(first, last):
+                hour = lower.hour if day == lower.date() else 0
+                slots[day][hour].append(item)
+                day += timedelta(days=1)
+
+        return CalendarRead(
+            start_date=start_date,
+            end_date=end_date,
+            days=[
+                CalendarDay(
+                    date=day,
+                    slots=[
+                        CalendarSlot(hour=hour, items=items)
+                        for hour, items in sorted(hours.items())
+                    ],
+                )
+                for day, hours in sorted(slots.items())
+            ],
+        )
+
+    async def apply_batch(self, *, batch: ItineraryBatch) -> ItineraryBatchResult:
+        """
+        달력에서 드래그한 일정들을 한 트랜잭션에서 옮기고 복사합니다.
+        내 일정이 아닌 항목이 하나라도 있으면 아무것도 반영하지 않습니다.
+        """
+        if len(batch.moves) + len(batch.copies) > itinerary_settings.BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 {itinerary_settings.BATCH_MAX_SIZE}개까지 옮기거나 복사할 수 있습니다.",
+            )
+        if len({move.id for move in batch.moves}) != len(batch.moves):
+            raise HTTPException(
+                status_code=400, detail="같은 일정을 여러 번 옮길 수 없습니다."
+            )
+
+        moved: Sequence[Itinerary] = ()
+        if batch.moves:
+            moved = await self.itinerary_repository.move_many(
+                owner_id=self.current_user.id, placements=batch.moves
+            )
+            if len(moved) != len(batch.moves):
+                raise HTTPException(
+                    status_code=404, detail="해당 일정을 찾을 수 없습니다."
+                )
+
+        copied: Sequence[Itinerary] = ()
+        if batch.copies:
+            copied = await self.itinerary_repository.copy_many(
+                owner_id=self.current_user.id, placements=batch.copies
+            )
+            if len(copied) != len(batch.copies):
+                raise HTTPException(
+                    status_code=404, detail="해당 일정을 찾을 수 없습니다."
+                )
+
+        if not batch.allow_conflicts:
+            await self._check_conflicts([*moved, *copied])
+
+        await self._publish(PlanEventType.ITINERARY_MOVED, moved)
+        await self._publish(PlanEventType.ITINERARY_CREATED, copied)
+
+        return ItineraryBatchResult(
+            moved=[CalendarItem.model_validate(itinerary) for itinerary in moved],
+            copied=[
+                CalendarItem.model_validate(itinerary)
+                for itinerary in sorted(copied, key=lambda itinerary: itinerary.id)
+            ],
+        )
+
+    async def _publish(
+        self, event_type: PlanEventType, itineraries: Sequence[Itinerary]
+    ) -> None:
+        ids_by_plan: defaultdict[int, list[int]] = defaultdict(list)
+        for itinerary in itineraries:
+            ids_by_plan[itinerary.plan_id].append(itinerary.id)
+
+        for plan_id, ids in ids_by_plan.items():
+            await self.plan_repository.publish_event(
+                plan_id=plan_id, event_type=event_type, ids=ids
+            )
+
+    async def _check_conflicts(self, itineraries: Sequence[Itinerary]) -> None:
+        """반영된 일정들이 같은 계획의 다른 일정이나 항공편과 겹치면 409로 응답합니다."""
+        if not itineraries:
+            return
+
+        rows = await self.plan_repository.find_schedule(
+            plan_ids={itinerary.plan_id for itinerary in itineraries}
+        )
+        schedules = build_indexes(rows)
+
+        for itinerary in itineraries:
+            lower, upper = itinerary.time_range.lower, itinerary.time_range.upper
+            assert lower is not None and upper is not None
+
+            entry = ScheduleEntry.of(ScheduleKind.ITINERARY, itinerary.id, lower, upper)
+            for other in schedules[itinerary.plan_id].overlapping(
+                entry.start, entry.end
+            ):
+                if (other.kind, other.id) == (entry.kind, entry.id):
+                    continue
+                other_name = (
+                    "일정" if other.kind == ScheduleKind.ITINERARY else "항공편"
+                )
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"일정 {itinerary.id}이(가) {other_name} {other.id}과(와) 시간이 겹칩니다.",
+                )
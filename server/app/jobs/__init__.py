@@ -0,0 +1,3 @@
+from .models import Job
+
+__all__ = ["Job"]
@@ -0,0 +1,53 @@
+"""
+작업 워커를 API와 별도 프로세스로 실행합니다.
+
+    uv run poe worker                  # JOB_QUEUES의 모든 큐
+    uv run poe worker default=4 export=1
+
+SIGINT/SIGTERM을 받으면 실행 중인 작업을 JOB_SHUTDOWN_TIMEOUT까지 기다린 뒤 종료합니다.
+"""
+
+import asyncio
+import signal
+import sys
+
+from app.core.logging import configure_logging
+from app.database.engine import dispose_engines
+from app.database.notify import pg_listener
+
+from . import handlers as _  # noqa: F401
+from .config import job_settings
+from .worker import JobWorker
+
+
+def _parse_queues(args: list[str]) -> dict[str, int]:
+    queues: dict[str, int] = {}
+    for arg in args:
+        name, _, concurrency = arg.partition("=")
+        queues[name] = int(concurrency or job_settings.JOB_QUEUES.get(name, 1))
+    return queues
+
+
+async def main() -> int:
+    configure_logging()
+
+    worker = JobWorker(_parse_queues(sys.argv[1:]) or None)
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await worker.start()
+        await stop.wait()
+        await worker.stop()
+    finally:
+        await pg_listener.stop()
+        await dispose_engines()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
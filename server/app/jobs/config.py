@@ -0,0 +1,38 @@
+from app.config import BaseConfig
+
+
+class JobConfig(BaseConfig):
+    JOB_QUEUES: dict[str, int] = {"default": 2}
+    """워커가 처리할 큐와 큐별 동시 실행 수"""
+
+    JOB_WORKER_IN_PROCESS: bool = False
+    """True면 API 워커마다 lifespan에서 작업 워커를 함께 실행합니다. False면 python -m app.jobs로 따로 실행합니다."""
+
+    JOB_POLL_INTERVAL: float = 5.0
+    """NOTIFY를 받지 못했을 때 큐를 다시 확인하는 간격 (초)"""
+
+    JOB_LEASE: float = 60.0
+    """
+    실행 중인 작업을 점유하는 시간 (초). 워커는 실행하는 동안 주기적으로 연장하며,
+    워커가 죽어 연장되지 않은 작업은 다시 대기 상태가 됩니다.
+    """
+
+    JOB_MAX_ATTEMPTS: int = 5
+    """enqueue 시 지정하지 않은 경우의 최대 실행 횟수"""
+
+    JOB_RETRY_BACKOFF: float = 10.0
+    """첫 재시도 전 대기 시간 (초). 재시도마다 두 배씩 늘어납니다."""
+
+    JOB_RETRY_BACKOFF_MAX: float = 3600.0
+
+    JOB_SHUTDOWN_TIMEOUT: float = 30.0
+    """종료 시 실행 중인 작업을 기다리는 시간 (초). 끝나지 않은 작업은 점유 시간이 지나면 다시 실행됩니다."""
+
+    JOB_NOTIFY_CHANNEL: str = "job_queued"
+    """새 작업을 워커에 알리는 채널. payload는 큐 이름"""
+
+    JOB_EVENTS_CHANNEL: str = "job_events"
+    """작업 상태/진행률 변경을 알리는 채널. payload는 작업 id"""
+
+
+job_settings = JobConfig.create()
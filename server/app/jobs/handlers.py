@@ -0,0 +1,7 @@
+"""
+작업 핸들러를 등록하는 모듈 목록
+
+워커가 실행할 수 있도록 job_handler를 사용하는 모듈을 여기에 추가합니다.
+"""
+
+import app.expenses.jobs as _  # noqa: F401
@@ -0,0 +1,87 @@
+import enum
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class Job(Base):
+    __tablename__ = "job"
+    __table_args__ = (
+        # 워커가 실행할 작업을 찾는 경로
+        Index(
+            "ix_job_queue_run_at",
+            "queue",
+            "run_at",
+            postgresql_where=text("status = 'QUEUED'"),
+        ),
+        # 점유 시간이 지난 작업을 찾는 경로
+        Index(
+            "ix_job_locked_until",
+            "locked_until",
+            postgresql_where=text("status = 'RUNNING'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, init=False, autoincrement=True
+    )
+
+    queue: Mapped[str] = mapped_column(String(32))
+    """작업 큐 이름. 큐마다 워커의 동시 실행 수를 따로 정합니다."""
+
+    name: Mapped[str] = mapped_column(String(64))
+    """실행할 핸들러 이름 (app.jobs.registry.job_handler)"""
+
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+
+    max_attempts: Mapped[int]
+
+    owner_id: Mapped[int | None] = mapped_column(ForeignKey("user.id"))
+    """작업을 요청한 유저. 상태 조회 권한에 사용하며, 시스템 작업은 None"""
+
+    status: Mapped[JobStatus] = mapped_column(default=JobStatus.QUEUED, kw_only=True)
+
+    attempts: Mapped[int] = mapped_column(default=0, kw_only=True)
+    """지금까지 실행을 시작한 횟수"""
+
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False
+    )
+    """이 시간 이후에 실행합니다. 재시도 시 backoff 만큼 미뤄집니다."""
+
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime, init=False)
+    """실행 중인 워커의 점유 만료 시간"""
+
+    progress: Mapped[float] = mapped_column(default=0.0, kw_only=True)
+    """진행률 (0 ~ 1)"""
+
+    progress_message: Mapped[str | None] = mapped_column(default=None, kw_only=True)
+
+    result: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB, default=None, kw_only=True
+    )
+
+    error: Mapped[str | None] = mapped_column(default=None, kw_only=True)
+    """마지막 실패 원인"""
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, init=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, init=False)
@@ -0,0 +1,202 @@
+"""
+job 테이블에 대한 작업 큐 연산
+
+모든 시간은 워커 간 시계 차이가 없도록 DB의 now()를 기준으로 합니다.
+점유한 뒤의 연산은 (id, attempts)로 점유를 확인하므로, 점유 시간이 지나 다른 워커가 다시 가져간
+작업을 이전 실행이 덮어쓰지 않습니다. 점유를 잃었으면 False를 반환합니다.
+"""
+
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.notify import notify
+
+from .config import job_settings
+from .models import Job, JobStatus
+
+
+def _owned(job_id: int, attempt: int) -> ColumnElement[bool]:
+    return and_(
+        Job.id == job_id,
+        Job.status == JobStatus.RUNNING,
+        Job.attempts == attempt,
+    )
+
+
+async def _notify_event(session: AsyncSession, job_id: int) -> None:
+    await notify(session, job_settings.JOB_EVENTS_CHANNEL, str(job_id))
+
+
+async def enqueue(
+    session: AsyncSession,
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    queue: str = "default",
+    owner_id: int | None = None,
+    max_attempts: int | None = None,
+    delay: timedelta | None = None,
+) -> Job:
+    """
+    작업을 추가합니다. 현재 트랜잭션이 커밋되어야 워커가 작업을 볼 수 있고 NOTIFY도 전달됩니다.
+    """
+    job = Job(
+        queue=queue,
+        name=name,
+        payload=payload or {},
+        max_attempts=max_attempts or job_settings.JOB_MAX_ATTEMPTS,
+        owner_id=owner_id,
+    )
+    session.add(job)
+    await session.flush()
+
+    if delay is not None:
+        await session.execute(
+            update(Job).where(Job.id == job.id).values(run_at=func.now() + delay)
+        )
+    await session.refresh(job)
+
+    await notify(session, job_settings.JOB_NOTIFY_CHANNEL, queue)
+    return job
+
+
+async def claim(session: AsyncSession, queue: str) -> Job | None:
+    """
+    실행할 때가 된 작업 하나를 점유합니다.
+    다른 워커가 잠근 row는 SKIP LOCKED로 건너뛰므로 워커끼리 같은 작업을 기다리지 않습니다.
+    """
+    candidate = (
+        select(Job.id)
+        .where(
+            Job.queue == queue,
+            Job.status == JobStatus.QUEUED,
+            Job.run_at <= func.now(),
+        )
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return await session.scalar(
+        update(Job)
+        .where(Job.id == candidate)
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=Job.attempts + 1,
+            started_at=func.now(),
+            locked_until=func.now() + timedelta(seconds=job_settings.JOB_LEASE),
+        )
+        .returning(Job),
+        execution_options={"synchronize_session": False},
+    )
+
+
+async def extend_lease(session: AsyncSession, job_id: int, attempt: int) -> bool:
+    result = await session.execute(
+        update(Job)
+        .where(_owned(job_id, attempt))
+        .values(locked_until=func.now() + timedelta(seconds=job_settings.JOB_LEASE))
+    )
+    return result.rowcount > 0
+
+
+async def report_progress(
+    session: AsyncSession,
+    job_id: int,
+    attempt: int,
+    progress: float,
+    message: str | None,
+) -> bool:
+    result = await session.execute(
+        update(Job)
+        .where(_owned(job_id, attempt))
+        .values(progress=progress, progress_message=message)
+    )
+    if not result.rowcount:
+        return False
+
+    await _notify_event(session, job_id)
+    return True
+
+
+async def succeed(
+    session: AsyncSession,
+    job_id: int,
+    attempt: int,
+    result: dict[str, Any] | None,
+) -> bool:
+    updated = await session.execute(
+        update(Job)
+        .where(_owned(job_id, attempt))
+        .values(
+            status=JobStatus.SUCCEEDED,
+            result=result,
+            error=None,
+            progress=1.0,
+            locked_until=None,
+            finished_at=func.now(),
+        )
+    )
+    if not updated.rowcount:
+        return False
+
+    await _notify_event(session, job_id)
+    return True
+
+
+async def fail(
+    session: AsyncSession,
+    job_id: int,
+    attempt: int,
+    error: str,
+    *,
+    retry_in: timedelta | None,
+) -> bool:
+    """retry_in이 None이면 더 이상 실행하지 않고, 아니면 그만큼 뒤에 다시 실행합니다."""
+    if retry_in is None:
+        values: dict[str, Any] = {
+            "status": JobStatus.FAILED,
+            "finished_at": func.now(),
+        }
+    else:
+        values = {"status": JobStatus.QUEUED, "run_at": func.now() + retry_in}
+
+    result = await session.execute(
+        update(Job)
+        .where(_owned(job_id, attempt))
+        .values(error=error, locked_until=None, **values)
+    )
+    if not result.rowcount:
+        return False
+
+    await _notify_event(session, job_id)
+    return True
+
+
+async def requeue_expired(session: AsyncSession) -> int:
+    """
+    점유 시간이 지난 작업(실행하던 워커가 죽은 경우)을 다시 대기 상태로 돌리고, 돌린 개수를 반환합니다.
+    이미 최대 횟수만큼 실행한 작업은 실패로 끝냅니다.
+    """
+    expired = (Job.status == JobStatus.RUNNING) & (Job.locked_until < func.now())
+    error = "작업 점유 시간이 지났습니다. (워커 종료)"
+
+    await session.execute(
+        update(Job)
+        .where(expired, Job.attempts >= Job.max_attempts)
+        .values(
+            status=JobStatus.FAILED,
+            error=error,
+            locked_until=None,
+            finished_at=func.now(),
+        )
+    )
+    result = await session.execute(
+        update(Job)
+        .where(expired)
+        .values(status=JobStatus.QUEUED, error=error, locked_until=None)
+    )
+    return result.rowcount
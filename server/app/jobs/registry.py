@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import get_engine
+
+from . import queue
+
+
+@dataclass
+class JobContext:
+    job_id: int
+    attempt: int
+    """몇 번째 실행인지 (1부터)"""
+
+    session: AsyncSession
+    """
+    작업 전용 세션. 핸들러가 성공적으로 끝나면 작업 완료 기록과 함께 커밋되고, 예외가 발생하거나
+    그 사이 점유를 잃었으면(점유 시간이 지나 다른 워커가 다시 가져간 경우) 롤백됩니다.
+    """
+
+    async def report_progress(
+        self, progress: float, message: str | None = None
+    ) -> None:
+        """
+        진행률을 기록합니다. 작업 세션과 별개의 트랜잭션으로 바로 커밋되므로
+        작업이 끝나기 전에도 상태 조회와 SSE에 반영됩니다.
+        """
+        async with get_engine().sessionmaker() as session:
+            await queue.report_progress(
+                session,
+                self.job_id,
+                self.attempt,
+                min(max(progress, 0.0), 1.0),
+                message,
+            )
+            await session.commit()
+
+
+type JobHandler = Callable[
+    [JobContext, dict[str, Any]], Awaitable[dict[str, Any] | None]
+]
+"""payload를 받아 실행하고, 결과(JSON)를 반환하는 작업 핸들러"""
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    작업 핸들러를 등록합니다. 워커가 찾을 수 있도록 등록한 모듈을 app.jobs.handlers에서 import 합니다.
+
+        @job_handler("expenses.reconcile")
+        async def reconcile_expenses(ctx: JobContext, payload: dict[str, Any]) -> dict[str, Any]: ...
+    """
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        if name in _handlers:
+            raise ValueError(f"Job handler already registered: {name}")
+        _handlers[name] = handler
+        return handler
+
+    return decorator
+
+
+def get_handler(name: str) -> JobHandler | None:
+    return _handlers.get(name)
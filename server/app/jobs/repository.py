@@ -0,0 +1,16 @@
+from sqlalchemy import select
+
+from app.database.deps import SessionDep
+from app.utils.dependency import dependency
+
+from .models import Job
+
+
+@dependency
+class JobRepository:
+    session: SessionDep
+
+    async def find_by_owner(self, *, job_id: int, owner_id: int) -> Job | None:
+        return await self.session.scalar(
+            select(Job).where(Job.id == job_id, Job.owner_id == owner_id)
+        )
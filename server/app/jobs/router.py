@@ -0,0 +1,40 @@
+from fastapi import status
+from fastapi.responses import StreamingResponse
+
+from app.core.router import create_router
+
+from .schemas import JobRead
+from .service import JobService
+
+router = create_router()
+
+
+@router.get("/{job_id}", status_code=status.HTTP_200_OK)
+async def read_job(
+    job_service: JobService,
+    job_id: int,
+) -> JobRead:
+    """내가 요청한 작업의 상태와 진행률"""
+    return await job_service.read(job_id=job_id)
+
+
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_job_events(
+    job_service: JobService,
+    job_id: int,
+) -> StreamingResponse:
+    """
+    작업 상태와 진행률을 Server-Sent Events로 받습니다.
+    상태가 바뀔 때마다 job 이벤트(JobRead)를 보내고, 작업이 끝나면 연결을 닫습니다.
+    """
+    events = await job_service.stream_events(job_id=job_id)
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
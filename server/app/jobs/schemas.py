@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Any
+
+from app.schemas import APISchema
+
+from .models import JobStatus
+
+
+class JobRead(APISchema):
+    id: int
+    queue: str
+    name: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    progress: float
+    progress_message: str | None
+    result: dict[str, Any] | None
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
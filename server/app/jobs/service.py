@@ -0,0 +1,79 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.auth.deps import CurrentUser
+from app.database.engine import get_engine
+from app.database.notify import pg_listener
+from app.utils.dependency import dependency
+
+from .config import job_settings
+from .models import Job
+from .repository import JobRepository
+from .schemas import JobRead
+
+
+async def _read_job(job_id: int) -> JobRead:
+    # 스트리밍 응답은 요청 세션이 닫힌 뒤에도 이어지므로 조회마다 세션을 새로 엽니다.
+    async with get_engine().sessionmaker() as session:
+        job = await session.scalar(select(Job).where(Job.id == job_id))
+        assert job is not None
+        return JobRead.model_validate(job)
+
+
+@dependency
+class JobService:
+    current_user: CurrentUser
+    job_repository: JobRepository
+
+    async def read(self, *, job_id: int) -> JobRead:
+        job = await self.job_repository.find_by_owner(
+            job_id=job_id, owner_id=self.current_user.id
+        )
+        if job is None:
+            raise HTTPException(status_code=404, detail="해당 작업을 찾을 수 없습니다.")
+
+        return JobRead.model_validate(job)
+
+    async def stream_events(self, *, job_id: int) -> AsyncIterator[str]:
+        """
+        작업 상태가 바뀔 때마다 SSE 이벤트를 보내고, 작업이 끝나면 스트림을 닫습니다.
+        알림을 놓친 경우를 위해 JOB_POLL_INTERVAL마다 상태를 다시 확인합니다.
+        """
+        job = await self.read(job_id=job_id)
+
+        async def events() -> AsyncIterator[str]:
+            changed = asyncio.Event()
+
+            def on_event(payload: str) -> None:
+                if payload == str(job_id):
+                    changed.set()
+
+            await pg_listener.subscribe(job_settings.JOB_EVENTS_CHANNEL, on_event)
+            try:
+                current = job
+                yield f"event: job\ndata: {current.model_dump_json(by_alias=True)}\n\n"
+
+                while not current.status.is_finished:
+                    try:
+                        await asyncio.wait_for(
+                            changed.wait(), job_settings.JOB_POLL_INTERVAL
+                        )
+                    except TimeoutError:
+                        pass
+                    changed.clear()
+
+                    latest = await _read_job(job_id)
+                    if latest == current:
+                        # 프록시가 유휴 연결을 끊지 않도록 주석 줄을 보냅니다.
+                        yield ": keep-alive\n\n"
+                        continue
+
+                    current = latest
+                    yield f"event: job\ndata: {current.model_dump_json(by_alias=True)}\n\n"
+            finally:
+                await pg_listener.unsubscribe(job_settings.JOB_EVENTS_CHANNEL, on_event)
+
+        return events()
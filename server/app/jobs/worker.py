@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import random
+from datetime import timedelta
+
+from app.database.engine import get_engine
+from app.database.notify import pg_listener
+
+from . import queue
+from .config import job_settings
+from .models import Job
+from .registry import JobContext, get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    delay = min(
+        job_settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1),
+        job_settings.JOB_RETRY_BACKOFF_MAX,
+    )
+    # 같은 원인으로 함께 실패한 작업들이 동시에 다시 실행되지 않도록 흩뜨립니다.
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+class JobWorker:
+    """
+    큐마다 정해진 수의 실행 슬롯을 두고 작업을 가져와 실행합니다.
+    새 작업은 NOTIFY로 바로 깨어나 가져오며, 알림을 놓친 경우를 위해 JOB_POLL_INTERVAL마다 큐를 확인합니다.
+    """
+
+    def __init__(self, queues: dict[str, int] | None = None):
+        self._queues = queues or job_settings.JOB_QUEUES
+        self._wakeups = {name: asyncio.Event() for name in self._queues}
+        self._slots: list[asyncio.Task[None]] = []
+        self._reaper: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        await pg_listener.subscribe(
+            job_settings.JOB_NOTIFY_CHANNEL, self._on_notify, on_reset=self._wake_all
+        )
+
+        for name, concurrency in self._queues.items():
+            self._slots.extend(
+                asyncio.create_task(self._run_slot(name)) for _ in range(concurrency)
+            )
+        self._reaper = asyncio.create_task(self._run_reaper())
+
+        logger.info("Job worker started: queues=%s", self._queues)
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """새 작업을 가져오지 않고, 실행 중인 작업을 timeout까지 기다린 뒤 종료합니다."""
+        self._stopping.set()
+        self._wake_all()
+        await pg_listener.unsubscribe(job_settings.JOB_NOTIFY_CHANNEL, self._on_notify)
+
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        if self._slots:
+            _, pending = await asyncio.wait(
+                self._slots,
+                timeout=timeout
+                if timeout is not None
+                else job_settings.JOB_SHUTDOWN_TIMEOUT,
+            )
+            # 끝나지 않은 작업은 점유 시간이 지나면 다른 워커가 다시 실행합니다.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._slots.clear()
+
+    def _on_notify(self, payload: str) -> None:
+        wakeup = self._wakeups.get(payload)
+        if wakeup is not None:
+            wakeup.set()
+
+    def _wake_all(self) -> None:
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+
+    async def _wait(self, name: str) -> None:
+        wakeup = self._wakeups[name]
+        try:
+            await asyncio.wait_for(wakeup.wait(), job_settings.JOB_POLL_INTERVAL)
+        except TimeoutError:
+            pass
+        wakeup.clear()
+
+    async def _run_slot(self, name: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                async with get_engine().sessionmaker() as session:
+                    job = await queue.claim(session, name)
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to claim job: queue=%s", name)
+                job = None
+
+            if job is None:
+                await self._wait(name)
+                continue
+
+            await self._execute(job)
+
+    async def _execute(self, job: Job) -> None:
+        handler = get_handler(job.name)
+        if handler is None:
+            await self._finish_failed(job, f"등록되지 않은 작업입니다: {job.name}")
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            async with get_engine().sessionmaker() as session:
+                context = JobContext(
+                    job_id=job.id, attempt=job.attempts, session=session
+                )
+                result = await handler(context, job.payload)
+                # 결과는 완료 기록과 같은 트랜잭션으로 커밋해, 점유를 잃은 실행의 결과는 버립니다.
+                if await queue.succeed(session, job.id, job.attempts, result):
+                    await session.commit()
+                else:
+                    await session.rollback()
+                    self._log_lost_lease(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(
+                "Job failed: id=%s name=%s attempt=%s", job.id, job.name, job.attempts
+            )
+            await self._finish_failed(job, f"{type(e).__name__}: {e}")
+        finally:
+            heartbeat.cancel()
+
+    async def _finish_failed(self, job: Job, error: str) -> None:
+        retry_in = (
+            _retry_delay(job.attempts)
+            if job.attempts < job.max_attempts and get_handler(job.name) is not None
+            else None
+        )
+        try:
+            async with get_engine().sessionmaker() as session:
+                recorded = await queue.fail(
+                    session, job.id, job.attempts, error, retry_in=retry_in
+                )
+                await session.commit()
+        except Exception:
+            # 기록하지 못하면 점유 시간이 지난 뒤 다시 실행됩니다.
+            logger.exception("Failed to record job failure: id=%s", job.id)
+            return
+
+        if not recorded:
+            self._log_lost_lease(job)
+
+    async def _heartbeat(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(job_settings.JOB_LEASE / 3)
+            try:
+                async with get_engine().sessionmaker() as session:
+                    extended = await queue.extend_lease(session, job.id, job.attempts)
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to extend job lease: id=%s", job.id)
+                continue
+
+            if not extended:
+                # 다른 워커가 다시 가져간 작업의 점유 시간을 늘리지 않도록 멈춥니다.
+                logger.warning(
+                    "Job lease lost while running: id=%s attempt=%s",
+                    job.id,
+                    job.attempts,
+                )
+                return
+
+    def _log_lost_lease(self, job: Job) -> None:
+        logger.warning(
+            "Job lease lost, discarding result: id=%s name=%s attempt=%s",
+            job.id,
+            job.name,
+            job.attempts,
+        )
+
+    async def _run_reaper(self) -> None:
+        while True:
+            await asyncio.sleep(job_settings.JOB_LEASE / 2)
+            try:
+                async with get_engine().sessionmaker() as session:
+                    count = await queue.requeue_expired(session)
+                    await session.commit()
+                if count:
+                    logger.warning("Requeued %d expired job(s)", count)
+                    self._wake_all()
+            except Exception:
+                logger.exception("Failed to requeue expired jobs")
+
+
+job_worker = JobWorker()
+"""API 워커 안에서 실행하는 작업 워커 (JOB_WORKER_IN_PROCESS)"""
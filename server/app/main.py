@@ -2,10 +2,14 @@ import logging
 
 from fastapi import FastAPI
 
-from app.core.config import core_settings
+from app.core.config import core_settings, rate_limit_settings
 from app.core.exceptions import register_exception_handlers
+from app.core.lifespan import lifespan
 from app.core.logging import configure_logging
+from app.core.ratelimit import RateLimitMiddleware
 from app.dev.router import router as dev_router
+from app.metrics.config import metrics_settings
+from app.metrics.router import metrics_endpoint
 
 from . import api
 
@@ -21,12 +25,14 @@ def create_app() -> FastAPI:
             docs_url=None,  # Swagger UI 비활성화
             redoc_url=None,  # ReDoc 비활성화
             openapi_url=None,  # OpenAPI 스키마도 비활성화
+            lifespan=lifespan,
         )
     else:
         # 개발/로컬: Swagger 활성화
         app = FastAPI(
             title="OTTRIP API",
             swagger_ui_parameters={"persistAuthorization": True},
+            lifespan=lifespan,
         )
 
     return app
@@ -44,6 +50,12 @@ if core_settings.ENVIRONMENT in ["local", "dev"]:
 
 register_exception_handlers(app)
 
+if metrics_settings.METRICS_ENABLED:
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+if rate_limit_settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 
 @app.get("/")
 def main():
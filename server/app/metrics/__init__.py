@@ -0,0 +1,3 @@
+from .registry import REGISTRY, Counter, Gauge, Histogram
+
+__all__ = ["REGISTRY", "Counter", "Gauge", "Histogram"]
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from app.config import BaseConfig
+
+
+class MetricsConfig(BaseConfig):
+    METRICS_ENABLED: bool = True
+
+    METRICS_AUTH_TOKEN: str | None = None
+    """설정하면 /metrics 요청에 Authorization: Bearer <token>이 있어야 합니다."""
+
+    METRICS_MULTIPROCESS_DIR: Path | None = None
+    """
+    워커가 여럿일 때 워커별 스냅샷을 쓰는 디렉터리. /metrics는 모든 워커의 값을 합쳐 응답합니다.
+    종료된 워커(이전 실행 포함)의 counter, histogram 값은 dead.json에 더해 두므로, 값을 0부터 다시 세려면
+    서버를 시작하기 전에 비웁니다.
+    """
+
+    METRICS_FLUSH_INTERVAL: float = 5.0
+    """워커가 스냅샷을 쓰는 주기 (초). 다른 워커의 값은 최대 이만큼 늦게 반영됩니다."""
+
+
+metrics_settings = MetricsConfig.create()
@@ -0,0 +1,127 @@
+"""앱 전체에서 사용하는 메트릭과 요청별 DB 쿼리 집계"""
+
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from .registry import Counter, Gauge, Histogram
+
+_FAST_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)  # fmt: skip
+_JWT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+NO_ROUTE = "-"
+"""요청 밖(작업 워커, lifespan 등)에서 실행한 쿼리의 route label"""
+
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 요청 수 (동시 처리 수 제한으로 대기 중인 요청 포함)",
+    ["route", "method"],
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 요청 처리 시간",
+    ["route", "method"],
+)
+http_responses_total = Counter(
+    "http_responses_total",
+    "라우트별 응답 수",
+    ["route", "method", "status"],
+)
+http_rate_limited_total = Counter(
+    "http_rate_limited_total",
+    "요청 수 제한으로 429 응답한 요청 수",
+    ["kind"],
+)
+http_request_db_queries = Histogram(
+    "http_request_db_queries",
+    "요청 하나에서 실행한 쿼리 수",
+    ["route"],
+    buckets=_QUERY_COUNT_BUCKETS,
+)
+
+db_query_duration_seconds = Histogram(
+    "db_query_duration_seconds",
+    "라우트별 쿼리 실행 시간",
+    ["route"],
+    buckets=_FAST_BUCKETS,
+)
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+    buckets=_FAST_BUCKETS,
+)
+db_pool_timeouts_total = Counter(
+    "db_pool_timeouts_total", "커넥션을 얻지 못하고 실패한 횟수"
+)
+db_pool_checked_out = Gauge("db_pool_checked_out", "사용 중인 커넥션 수")
+db_pool_checked_in = Gauge("db_pool_checked_in", "풀에서 쉬고 있는 커넥션 수")
+db_pool_overflow = Gauge("db_pool_overflow", "pool_size를 넘어 열린 커넥션 수")
+
+jwt_duration_seconds = Histogram(
+    "jwt_duration_seconds",
+    "JWT 서명(sign)과 검증(verify) 시간. 캐시에서 찾은 검증은 제외합니다.",
+    ["operation"],
+    buckets=_JWT_BUCKETS,
+)
+jwt_verify_total = Counter(
+    "jwt_verify_total",
+    "JWT 검증 결과 (cache_hit, verified, invalid)",
+    ["result"],
+)
+
+http_client_request_duration_seconds = Histogram(
+    "http_client_request_duration_seconds",
+    "외부 API 호출 시간 (응답 헤더를 받을 때까지, 재시도는 각각 기록)",
+    ["host", "method"],
+)
+http_client_responses_total = Counter(
+    "http_client_responses_total",
+    "외부 API 응답 수. 연결/읽기 오류는 status=error",
+    ["host", "method", "status"],
+)
+
+
+class RequestStats:
+    __slots__ = ("route", "queries")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.queries = 0
+
+
+request_stats_var: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+) -> None:
+    setattr(context, "_metrics_started_at", time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+) -> None:
+    started_at: float | None = getattr(context, "_metrics_started_at", None)
+    if started_at is None:
+        return
+
+    # AsyncSession의 쿼리도 요청 task의 context에서 실행되므로 요청의 route를 알 수 있습니다.
+    stats = request_stats_var.get()
+    route = NO_ROUTE
+    if stats is not None:
+        stats.queries += 1
+        route = stats.route
+    db_query_duration_seconds.labels(route).observe(time.perf_counter() - started_at)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """쿼리마다 실행 시간을 route별로 기록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
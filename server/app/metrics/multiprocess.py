@@ -0,0 +1,174 @@
+"""
+워커가 여럿일 때 메트릭 합치기
+
+워커마다 METRICS_MULTIPROCESS_DIR/<pid>.json에 자기 스냅샷을 주기적으로 씁니다. 파일은 임시 파일에 쓴 뒤
+rename 하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+종료된 워커의 파일은 counter와 histogram 값이 줄어들지 않도록 dead.json 하나에 더한 뒤 지우고, gauge는 버립니다.
+합치는 동안 다른 워커가 같은 값을 두 번 읽지 않도록 디렉터리의 .lock 파일로 잠급니다.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+from .config import metrics_settings
+from .registry import REGISTRY, Snapshot
+
+logger = logging.getLogger(__name__)
+
+_DEAD_WORKERS_FILE = "dead.json"
+"""종료된 워커들의 counter, histogram 합계"""
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@contextmanager
+def _locked(directory: Path, *, exclusive: bool) -> Generator[None]:
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _write(directory: Path, data: bytes) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_atomic(directory / f"{os.getpid()}.json", data)
+
+
+def _read(path: Path) -> Snapshot | None:
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        logger.warning("Skipping unreadable metrics snapshot: %s", path)
+        return None
+
+
+def _worker_files(directory: Path) -> list[tuple[Path, int]]:
+    return [
+        (path, int(path.stem))
+        for path in directory.glob("*.json")
+        if path.stem.isdigit()
+    ]
+
+
+def _read_all(directory: Path) -> list[tuple[Snapshot, bool]]:
+    snapshots: list[tuple[Snapshot, bool]] = []
+    with _locked(directory, exclusive=False):
+        dead_workers = directory / _DEAD_WORKERS_FILE
+        if dead_workers.exists() and (snapshot := _read(dead_workers)) is not None:
+            snapshots.append((snapshot, False))
+
+        for path, pid in _worker_files(directory):
+            if (snapshot := _read(path)) is not None:
+                snapshots.append((snapshot, _is_alive(pid)))
+    return snapshots
+
+
+def _collect_dead(directory: Path, *, include_own: bool = False) -> int:
+    """
+    종료된 워커의 파일을 dead.json에 더하고 지운 뒤, 지운 파일 수를 반환합니다.
+    include_own이면 현재 pid의 파일도 합칩니다. 아직 쓰기 전이라면 pid를 재사용한 이전 프로세스의 파일입니다.
+    """
+    with _locked(directory, exclusive=True):
+        dead = [
+            path
+            for path, pid in _worker_files(directory)
+            if not _is_alive(pid) or (include_own and pid == os.getpid())
+        ]
+        if not dead:
+            return 0
+
+        dead_workers = directory / _DEAD_WORKERS_FILE
+        paths = [dead_workers, *dead] if dead_workers.exists() else dead
+        snapshots = [
+            snapshot for path in paths if (snapshot := _read(path)) is not None
+        ]
+        _write_atomic(dead_workers, json.dumps(REGISTRY.merge_dead(snapshots)).encode())
+
+        for path in dead:
+            path.unlink(missing_ok=True)
+            # 쓰는 도중 종료된 워커의 임시 파일
+            path.with_suffix(".tmp").unlink(missing_ok=True)
+        return len(dead)
+
+
+async def flush(directory: Path) -> None:
+    """현재 워커의 스냅샷을 파일에 씁니다. 스냅샷은 이벤트 루프에서 만들고, 파일만 스레드에서 씁니다."""
+    data = json.dumps(REGISTRY.snapshot()).encode()
+    await asyncio.to_thread(_write, directory, data)
+
+
+async def render() -> str:
+    """/metrics 응답. 워커가 여럿이면 방금 쓴 자기 스냅샷과 다른 워커의 스냅샷을 합칩니다."""
+    directory = metrics_settings.METRICS_MULTIPROCESS_DIR
+    if directory is None:
+        return REGISTRY.render([(REGISTRY.snapshot(), True)])
+
+    await flush(directory)
+    snapshots = await asyncio.to_thread(_read_all, directory)
+    return await asyncio.to_thread(REGISTRY.render, snapshots)
+
+
+class MetricsFlusher:
+    """
+    METRICS_FLUSH_INTERVAL마다 스냅샷을 쓰고 종료된 워커의 파일을 정리하며, 종료할 때 마지막 값을 씁니다.
+    """
+
+    def __init__(self):
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        directory = metrics_settings.METRICS_MULTIPROCESS_DIR
+        if directory is None or self._task is not None:
+            return
+
+        # 이전 실행에서 남은 파일(같은 pid로 남은 파일 포함)을 자기 스냅샷을 쓰기 전에 정리합니다.
+        try:
+            await asyncio.to_thread(_collect_dead, directory, include_own=True)
+        except OSError:
+            logger.exception("Failed to collect dead worker metrics")
+        self._task = asyncio.create_task(self._run(directory))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        directory = metrics_settings.METRICS_MULTIPROCESS_DIR
+        if directory is not None:
+            await flush(directory)
+
+    async def _run(self, directory: Path) -> None:
+        while True:
+            try:
+                await flush(directory)
+                await asyncio.to_thread(_collect_dead, directory)
+            except OSError:
+                logger.exception("Failed to write metrics snapshot")
+            await asyncio.sleep(metrics_settings.METRICS_FLUSH_INTERVAL)
+
+
+metrics_flusher = MetricsFlusher()
@@ -0,0 +1,261 @@
+"""
+Prometheus text 형식(0.0.4)으로 내보내는 counter, gauge, histogram
+
+값은 이벤트 루프 스레드에서만 갱신하므로 락 없이 float와 list로 셉니다. (TTLCache와 같은 전제)
+label 조합마다 child를 한 번 만들어 두고, 자주 쓰는 곳에서는 child를 잡아두고 갱신합니다.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, ClassVar, Iterable, Sequence, cast
+
+type LabelValues = tuple[str, ...]
+type Snapshot = dict[str, list[list[Any]]]
+"""메트릭 이름 -> [[label 값 목록, 값], ...] (JSON으로 저장할 수 있는 형태)"""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild:
+    __slots__ = ("_upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        """bucket별 개수 (누적 아님). 마지막은 +Inf"""
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._upper_bounds, value)] += 1
+        self.sum += value
+
+
+class Metric[C](ABC):
+    type: ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        registry: "Registry | None" = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[LabelValues, C] = {}
+        (registry or REGISTRY).register(self)
+
+    def labels(self, *values: str) -> C:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} labels: {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> C: ...
+
+    @abstractmethod
+    def _dump(self, child: C) -> Any: ...
+
+    def snapshot(self) -> list[list[Any]]:
+        return [
+            [list(labels), self._dump(child)]
+            for labels, child in self._children.items()
+        ]
+
+
+class Counter(Metric[CounterChild]):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _dump(self, child: CounterChild) -> Any:
+        return child.value
+
+
+class Gauge(Metric[GaugeChild]):
+    type = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _dump(self, child: GaugeChild) -> Any:
+        return child.value
+
+
+class Histogram(Metric[HistogramChild]):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry=registry)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _dump(self, child: HistogramChild) -> Any:
+        return [list(child.counts), child.sum]
+
+
+type Collector = Callable[[], None]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric[Any]] = {}
+        self._collectors: list[Collector] = []
+
+    def register(self, metric: Metric[Any]) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicated metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Collector) -> None:
+        """내보내기 직전에 호출해 gauge 등을 현재 값으로 채우는 함수 (커넥션 풀 상태 등)"""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Snapshot:
+        for collector in self._collectors:
+            collector()
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def _merge(
+        self, snapshots: Iterable[tuple[Snapshot, bool]]
+    ) -> dict[str, dict[LabelValues, Any]]:
+        merged: dict[str, dict[LabelValues, Any]] = {name: {} for name in self._metrics}
+        for snapshot, alive in snapshots:
+            for name, samples in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None or (metric.type == "gauge" and not alive):
+                    continue
+                values = merged[name]
+                for labels, value in samples:
+                    key = tuple(labels)
+                    values[key] = _add(values.get(key), value)
+        return merged
+
+    def merge_dead(self, snapshots: Iterable[Snapshot]) -> Snapshot:
+        """종료된 워커들의 스냅샷을 하나로 합칩니다. gauge는 종료된 워커에서는 의미가 없으므로 뺍니다."""
+        merged = self._merge((snapshot, False) for snapshot in snapshots)
+        return {
+            name: [[list(labels), value] for labels, value in values.items()]
+            for name, values in merged.items()
+            if values
+        }
+
+    def render(self, snapshots: Iterable[tuple[Snapshot, bool]]) -> str:
+        """
+        여러 워커의 스냅샷을 합쳐 text 형식으로 만듭니다.
+        (스냅샷, 살아있는 워커 여부) 목록을 받으며, gauge는 살아있는 워커의 값만 더합니다.
+        """
+        merged = self._merge(snapshots)
+
+        lines: list[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for labels, value in sorted(merged[name].items()):
+                label_text = _labels(metric.labelnames, labels)
+                if isinstance(metric, Histogram):
+                    lines.extend(_histogram_lines(metric, label_text, value))
+                else:
+                    lines.append(f"{_series(name, label_text)} {_number(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _add(total: Any, value: Any) -> Any:
+    if total is None:
+        return value
+    if isinstance(value, list):
+        total_counts, total_sum = cast(tuple[list[int], float], total)
+        counts, sum_ = cast(tuple[list[int], float], value)
+        return [[a + b for a, b in zip(total_counts, counts)], total_sum + sum_]
+    return total + value
+
+
+def _histogram_lines(
+    metric: Histogram, label_text: str, value: list[Any]
+) -> Iterable[str]:
+    counts, sum_ = value
+    prefix = f"{label_text}," if label_text else ""
+    cumulative = 0
+    for bound, count in zip((*metric.buckets, None), counts):
+        cumulative += count
+        le = "+Inf" if bound is None else _number(bound)
+        yield f'{metric.name}_bucket{{{prefix}le="{le}"}} {cumulative}'
+    yield f"{_series(f'{metric.name}_sum', label_text)} {_number(sum_)}"
+    yield f"{_series(f'{metric.name}_count', label_text)} {cumulative}"
+
+
+def _series(name: str, label_text: str) -> str:
+    return f"{name}{{{label_text}}}" if label_text else name
+
+
+def _labels(names: tuple[str, ...], values: LabelValues) -> str:
+    return ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
+
+
+REGISTRY = Registry()
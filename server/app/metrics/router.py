@@ -0,0 +1,22 @@
+import hmac
+
+from fastapi import Request, Response
+
+from .config import metrics_settings
+from .multiprocess import render
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """
+    Prometheus가 수집하는 메트릭
+    API 라우터가 아닌 앱에 직접 등록하므로 access log, 동시 처리 수 제한, 메트릭 집계에서 빠집니다.
+    """
+    token = metrics_settings.METRICS_AUTH_TOKEN
+    if token is not None and not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return Response(status_code=401)
+
+    return Response(await render(), media_type=CONTENT_TYPE)
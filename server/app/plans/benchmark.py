@@ -0,0 +1,275 @@
+"""
+여행 계획 상세 조회 방식(PLAN_LOADER)별 비용을 비교합니다.
+
+    uv run poe bench-plan-loaders
+    uv run poe bench-plan-loaders --flights 10 --itineraries 100 --expenses 300 --repeat 30
+
+하위 항목 수를 지정한 계획 하나를 트랜잭션 안에서 만든 뒤, 방식마다 받은 row 수, 지연 시간,
+Python 메모리 사용량(tracemalloc peak)을 출력합니다. 끝나면 롤백하므로 DB에 데이터가 남지 않습니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from typing import Any, NamedTuple, cast
+from uuid import uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import dispose_engines, get_engine
+from app.expenses.models import Expense, ExpenseCategory
+from app.flights.models import Flight
+from app.itinerary.models import Itinerary
+from app.users.models import User
+
+from .config import PlanLoader, plan_settings
+from .models import Plan
+from .repository import PlanRepository
+from .schemas import PlanReadWithInforms
+
+
+class LoaderResult(NamedTuple):
+    loader: PlanLoader
+    statements: int
+    rows: int
+    latencies: list[float]
+    """실행마다 걸린 시간 (초)"""
+
+    peak_memory: int
+    """한 번 불러오는 동안의 Python 메모리 사용량 최댓값 (바이트)"""
+
+
+class _Counter:
+    """세션에서 실행한 쿼리 수와 받은 row 수"""
+
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+
+    def after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: Any,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        self.statements += 1
+        # asyncpg 어댑터는 SELECT 결과를 실행할 때 모두 받아 커서에 들고 있습니다.
+        self.rows += len(getattr(cursor, "_rows", ()))
+
+
+async def seed(
+    session: AsyncSession, *, flights: int, itineraries: int, expenses: int
+) -> int:
+    """하위 항목을 가진 계획을 만들고 id를 반환합니다."""
+    user = User(
+        handle=f"bench_{uuid4().hex[:24]}",
+        nickname="bench",
+        description="",
+        gender=None,
+    )
+    session.add(user)
+    await session.flush()
+
+    start = date(2026, 1, 1)
+    plan = Plan(
+        title="benchmark",
+        start_date=start,
+        end_date=start + timedelta(days=max(itineraries, expenses) // 10 + 1),
+        owner_id=user.id,
+    )
+    session.add(plan)
+    await session.flush()
+
+    if flights:
+        await session.execute(
+            insert(Flight),
+            [
+                {
+                    "plan_id": plan.id,
+                    "airline": "KE",
+                    "flight_number": f"KE{i:04d}",
+                    "departure_airport": "ICN",
+                    "arrival_airport": "NRT",
+                    "departure_time": datetime(2026, 1, 1, 9) + timedelta(days=i),
+                    "arrival_time": datetime(2026, 1, 1, 11) + timedelta(days=i),
+                    "seat_class": "economy",
+                    "seat_number": f"{i % 60 + 1}A",
+                }
+                for i in range(flights)
+            ],
+        )
+    if itineraries:
+        await session.execute(
+            insert(Itinerary),
+            [
+                {
+                    "plan_id": plan.id,
+                    "title": f"일정 {i}",
+                    "description": "벤치마크용 일정",
+                    "country": "JP",
+                    "city": "Tokyo",
+                    "location": "Shibuya",
+                    "date": start + timedelta(days=i // 10),
+                    "start_time": dt_time(8 + i % 10),
+                    "end_time": dt_time(8 + i % 10, 50),
+                }
+                for i in range(itineraries)
+            ],
+        )
+    if expenses:
+        categories = list(ExpenseCategory)
+        await session.execute(
+            insert(Expense),
+            [
+                {
+                    "plan_id": plan.id,
+                    "category": categories[i % len(categories)],
+                    "amount": 1000 + i,
+                    "currency": "KRW",
+                    "home_amount": 1000 + i,
+                    "description": f"지출 {i}",
+                    "date": start + timedelta(days=i // 10),
+                }
+                for i in range(expenses)
+            ],
+        )
+
+    return plan.id
+
+
+async def load(
+    repository: PlanRepository, loader: PlanLoader, plan_id: int
+) -> PlanReadWithInforms:
+    """PlanService.read_plan과 같은 경로로 응답 스키마까지 만듭니다."""
+    plan_settings.PLAN_LOADER = loader
+
+    if loader == PlanLoader.JSON_AGG:
+        return PlanReadWithInforms.model_validate(
+            await repository.find_by_id_as_json(plan_id=plan_id)
+        )
+
+    return PlanReadWithInforms.model_validate(
+        await repository.find_by_id(plan_id=plan_id)
+    )
+
+
+async def measure(
+    session: AsyncSession, loader: PlanLoader, plan_id: int, *, repeat: int
+) -> LoaderResult:
+    # @dependency 클래스는 FastAPI가 필드를 주입하는 dataclass 입니다.
+    repository: PlanRepository = cast(Any, PlanRepository)(session=session)
+    counter = _Counter()
+
+    # prepared statement 캐시 등을 채우는 첫 실행은 빼고 잽니다.
+    await load(repository, loader, plan_id)
+    session.expunge_all()
+
+    sync_engine = session.sync_session.get_bind()
+    event.listen(sync_engine, "after_cursor_execute", counter.after_cursor_execute)
+    try:
+        await load(repository, loader, plan_id)
+    finally:
+        event.remove(sync_engine, "after_cursor_execute", counter.after_cursor_execute)
+    session.expunge_all()
+
+    # tracemalloc이 켜져 있으면 느려지므로 메모리는 따로 한 번만 잽니다.
+    tracemalloc.start()
+    try:
+        await load(repository, loader, plan_id)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    session.expunge_all()
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await load(repository, loader, plan_id)
+        latencies.append(time.perf_counter() - started)
+        # identity map에 남은 객체를 재사용하지 않도록 매번 비웁니다.
+        session.expunge_all()
+
+    return LoaderResult(
+        loader=loader,
+        statements=counter.statements,
+        rows=counter.rows,
+        latencies=latencies,
+        peak_memory=peak_memory,
+    )
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def print_results(results: list[LoaderResult]) -> None:
+    print(
+        f"{'loader':<10} {'queries':>7} {'rows':>9} "
+        f"{'median ms':>10} {'p95 ms':>8} {'peak KiB':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.loader.value:<10} {result.statements:>7} {result.rows:>9} "
+            f"{statistics.median(result.latencies) * 1000:>10.2f} "
+            f"{_percentile(result.latencies, 0.95) * 1000:>8.2f} "
+            f"{result.peak_memory / 1024:>9.0f}"
+        )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--flights", type=int, default=10)
+    parser.add_argument("--itineraries", type=int, default=50)
+    parser.add_argument("--expenses", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--loader",
+        type=PlanLoader,
+        action="append",
+        help="비교할 방식 (여러 번 지정 가능, 기본값은 전체)",
+    )
+    return parser.parse_args(argv)
+
+
+async def main() -> int:
+    args = parse_args(sys.argv[1:])
+    loaders: list[PlanLoader] = args.loader or list(PlanLoader)
+
+    try:
+        async with get_engine().sessionmaker() as session:
+            plan_id = await seed(
+                session,
+                flights=args.flights,
+                itineraries=args.itineraries,
+                expenses=args.expenses,
+            )
+            print(
+                f"plan {plan_id}: flights={args.flights} "
+                f"itineraries={args.itineraries} expenses={args.expenses} "
+                f"repeat={args.repeat}"
+            )
+
+            results = [
+                await measure(session, loader, plan_id, repeat=args.repeat)
+                for loader in loaders
+            ]
+            await session.rollback()
+    finally:
+        await dispose_engines()
+
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
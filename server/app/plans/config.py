@@ -0,0 +1,41 @@
+from enum import Enum
+
+from app.config import BaseConfig
+
+
+class PlanLoader(str, Enum):
+    """여행 계획 상세 조회 시 하위 항목(항공/일정/지출)을 불러오는 방식"""
+
+    JOINED = "joined"
+    """한 번의 JOIN 쿼리. 하위 항목 수의 곱만큼 row가 생기므로 큰 계획에서는 느립니다."""
+
+    SELECTIN = "selectin"
+    """하위 항목마다 IN 쿼리를 한 번씩 실행합니다."""
+
+    JSON_AGG = "json_agg"
+    """Postgres에서 json_agg로 한 번에 JSON을 만들어 받습니다. ORM 객체를 만들지 않습니다."""
+
+
+class PlanConfig(BaseConfig):
+    PLAN_LOADER: PlanLoader = PlanLoader.SELECTIN
+
+    PLAN_EVENTS_CHANNEL: str = "plan_events"
+    """계획 변경 이벤트를 보내는 NOTIFY 채널"""
+
+    PLAN_EVENTS_MAX_IDS: int = 100
+    """이벤트에 담는 변경된 항목 id의 최대 개수. 넘으면 id 없이 보내고 클라이언트가 다시 조회합니다."""
+
+    PLAN_EVENTS_MAX_PENDING: int = 100
+    """
+    연결 하나에 보내지 못하고 쌓일 수 있는 이벤트 수
+    넘으면 쌓인 이벤트를 버리고 resync 이벤트 하나만 보냅니다.
+    """
+
+    PLAN_EVENTS_COALESCE_INTERVAL: float = 0.05
+    """연달아 발생한 이벤트를 모아 한 메시지로 보내기 위해 기다리는 시간 (초)"""
+
+    PLAN_EVENTS_SEND_TIMEOUT: float = 10.0
+    """메시지 하나를 보내는 데 이보다 오래 걸리는 느린 연결은 끊습니다. (초)"""
+
+
+plan_settings = PlanConfig.create()
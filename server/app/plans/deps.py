@@ -0,0 +1,24 @@
+from fastapi import HTTPException
+
+from app.auth.deps import CurrentUser
+from app.utils.dependency import dependency
+
+from .repository import PlanRepository
+
+
+@dependency
+class PlanOwnerGuard:
+    """계획에 딸린 항목(지출, 항공, 첨부 파일 등)을 다루기 전에 현재 유저가 계획의 주인인지 확인합니다."""
+
+    current_user: CurrentUser
+    plan_repository: PlanRepository
+
+    async def check(self, *, plan_id: int) -> None:
+        owner_id = await self.plan_repository.find_owner_id(plan_id=plan_id)
+
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="해당 계획을 찾을 수 없습니다.")
+        if owner_id != self.current_user.id:
+            raise HTTPException(
+                status_code=403, detail="해당 계획에 대한 권한이 없습니다."
+            )
@@ -0,0 +1,236 @@
+"""
+계획 변경 이벤트를 WebSocket으로 실시간 전달합니다.
+
+쓰기 요청은 트랜잭션 안에서 NOTIFY로 이벤트를 보내고(커밋될 때만 전달됩니다), 워커마다 하나인
+PlanEventHub가 공유 LISTEN 커넥션(app.database.notify.pg_listener)으로 받아 그 워커에 연결된 구독자에게
+나눠줍니다. NOTIFY payload는 "plan_id:JSON" 형태이며, JSON은 다시 파싱하지 않고 그대로 클라이언트에 보냅니다.
+
+클라이언트는 이벤트의 JSON 배열을 메시지로 받습니다.
+
+    [{"type": "itinerary.moved", "planId": 1, "ids": [3, 4]}]
+
+ids가 null이면 변경된 항목이 많다는 뜻이고, "resync" 이벤트를 받으면 이벤트를 놓쳤을 수 있으므로
+계획 전체를 다시 조회해야 합니다.
+"""
+
+import asyncio
+import contextlib
+import enum
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Collection
+from typing import Generator
+
+from fastapi import WebSocket, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.notify import notify, pg_listener
+
+from .config import plan_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PlanEventType(str, enum.Enum):
+    PLAN_UPDATED = "plan.updated"
+    FLIGHT_CREATED = "flight.created"
+    ITINERARY_CREATED = "itinerary.created"
+    ITINERARY_MOVED = "itinerary.moved"
+    EXPENSE_CREATED = "expense.created"
+    EXPENSE_UPDATED = "expense.updated"
+    EXPENSE_DELETED = "expense.deleted"
+    ATTACHMENT_CREATED = "attachment.created"
+    ATTACHMENT_DELETED = "attachment.deleted"
+    RESYNC = "resync"
+
+
+def _encode(
+    plan_id: int, event_type: PlanEventType, ids: Collection[int] | None = None
+) -> str:
+    return json.dumps(
+        {
+            "type": event_type.value,
+            "planId": plan_id,
+            "ids": sorted(ids) if ids is not None else None,
+        },
+        separators=(",", ":"),
+    )
+
+
+async def publish_plan_event(
+    session: AsyncSession,
+    plan_id: int,
+    event_type: PlanEventType,
+    ids: Collection[int] | None = None,
+) -> None:
+    """현재 트랜잭션이 커밋되면 계획을 구독 중인 모든 워커의 연결에 이벤트를 보냅니다."""
+    if ids is not None and len(ids) > plan_settings.PLAN_EVENTS_MAX_IDS:
+        ids = None
+    event = _encode(plan_id, event_type, ids)
+    await notify(session, plan_settings.PLAN_EVENTS_CHANNEL, f"{plan_id}:{event}")
+
+
+class PlanSubscription:
+    """
+    WebSocket 연결 하나에 보낼 이벤트
+    보내는 동안 들어온 이벤트는 모아뒀다가 한 메시지로 보내며, 같은 이벤트는 한 번만 보냅니다.
+    느린 연결 때문에 max_pending을 넘게 쌓이면 모두 버리고 resync 이벤트 하나로 바꿉니다.
+    """
+
+    def __init__(self, plan_id: int, *, max_pending: int):
+        self.plan_id = plan_id
+        self._max_pending = max_pending
+        self._pending: dict[str, None] = {}
+        self._overflowed = False
+        self._closed = False
+        self._ready = asyncio.Event()
+
+    def push(self, event: str) -> None:
+        if self._overflowed:
+            return
+        if len(self._pending) >= self._max_pending:
+            self.reset()
+            return
+        self._pending[event] = None
+        self._ready.set()
+
+    def reset(self) -> None:
+        self._pending.clear()
+        self._overflowed = True
+        self._ready.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    async def next_batch(self, coalesce_interval: float) -> list[str] | None:
+        """보낼 이벤트 목록. 구독이 끝나면 None"""
+        await self._ready.wait()
+        if coalesce_interval > 0 and not self._closed:
+            await asyncio.sleep(coalesce_interval)
+        self._ready.clear()
+
+        if self._closed:
+            return None
+        if self._overflowed:
+            self._overflowed = False
+            return [_encode(self.plan_id, PlanEventType.RESYNC)]
+
+        events = list(self._pending)
+        self._pending.clear()
+        return events
+
+
+class PlanEventHub:
+    def __init__(self):
+        self._subscriptions: defaultdict[int, set[PlanSubscription]] = defaultdict(set)
+        self._started = False
+
+    async def start(self) -> None:
+        await pg_listener.subscribe(
+            plan_settings.PLAN_EVENTS_CHANNEL, self._on_notify, on_reset=self._on_reset
+        )
+        self._started = True
+
+    async def stop(self) -> None:
+        if self._started:
+            await pg_listener.unsubscribe(
+                plan_settings.PLAN_EVENTS_CHANNEL, self._on_notify
+            )
+            self._started = False
+
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+        self._subscriptions.clear()
+
+    @contextlib.contextmanager
+    def subscribe(self, plan_id: int) -> Generator[PlanSubscription]:
+        subscription = PlanSubscription(
+            plan_id, max_pending=plan_settings.PLAN_EVENTS_MAX_PENDING
+        )
+        self._subscriptions[plan_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(plan_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[plan_id]
+
+    def _on_notify(self, payload: str) -> None:
+        plan_id, _, event = payload.partition(":")
+        try:
+            subscriptions = self._subscriptions.get(int(plan_id))
+        except ValueError:
+            logger.warning("Invalid plan event payload: %s", payload[:100])
+            return
+
+        # 이 워커에 구독자가 없는 계획의 이벤트는 바로 버립니다.
+        for subscription in subscriptions or ():
+            subscription.push(event)
+
+    def _on_reset(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.reset()
+
+    async def serve(self, websocket: WebSocket, plan_id: int) -> None:
+        """연결이 끊기거나 hub가 멈출 때까지 계획의 이벤트를 보냅니다. (accept 된 WebSocket)"""
+        with self.subscribe(plan_id) as subscription:
+            sender = asyncio.create_task(self._send(websocket, subscription))
+            receiver = asyncio.create_task(self._receive(websocket))
+            try:
+                done, _ = await asyncio.wait(
+                    (sender, receiver), return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                sender.cancel()
+                receiver.cancel()
+                await asyncio.gather(sender, receiver, return_exceptions=True)
+
+        if receiver in done:
+            return
+
+        error = sender.exception()
+        if error is None:
+            code = status.WS_1012_SERVICE_RESTART
+        elif isinstance(error, TimeoutError):
+            logger.warning("Closing slow plan event connection: plan_id=%s", plan_id)
+            code = status.WS_1013_TRY_AGAIN_LATER
+        else:
+            # 보내는 중에 연결이 끊긴 경우입니다.
+            return
+
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=code), plan_settings.PLAN_EVENTS_SEND_TIMEOUT
+            )
+
+    @staticmethod
+    async def _send(websocket: WebSocket, subscription: PlanSubscription) -> None:
+        while True:
+            events = await subscription.next_batch(
+                plan_settings.PLAN_EVENTS_COALESCE_INTERVAL
+            )
+            if events is None:
+                return
+            if events:
+                await asyncio.wait_for(
+                    websocket.send_text(f"[{','.join(events)}]"),
+                    plan_settings.PLAN_EVENTS_SEND_TIMEOUT,
+                )
+
+    @staticmethod
+    async def _receive(websocket: WebSocket) -> None:
+        # 클라이언트가 보내는 메시지는 사용하지 않고, 연결이 끊겼는지만 확인합니다.
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+
+plan_event_hub = PlanEventHub()
+"""워커마다 하나인 계획 이벤트 hub"""
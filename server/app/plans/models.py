@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base
@@ -15,11 +15,19 @@ if TYPE_CHECKING:
 
 class Plan(Base):
     __tablename__ = "plan"
+    __table_args__ = (
+        Index(
+            "ix_plan_owner_start_date",
+            "owner_id",
+            "start_date",
+            "id",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
         init=False,
-        index=True,
         autoincrement=True,
     )
 
@@ -1,12 +1,67 @@
 # from fastapi import HTTPException
 
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from datetime import datetime
+from itertools import chain
+from typing import Any, Collection, Sequence
 
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    DateTime,
+    ScalarSelect,
+    String,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.common.schemas import PaginationParams
 from app.database.deps import SessionDep
+from app.database.pagination import KeysetPage, paginate
+from app.expenses.models import Expense
+from app.flights.models import Flight
+from app.itinerary.models import Itinerary
 from app.utils.dependency import dependency
 
+from .config import PlanLoader, plan_settings
+from .events import PlanEventType, publish_plan_event
 from .models import Plan
+from .schedule import ScheduleKind
+
+
+def _json_object(**fields: ColumnExpressionArgument[Any]) -> ColumnElement[Any]:
+    # json_build_object는 가변 인자가 "any" 타입이라 바인드 파라미터를 쓰면 타입 추론에 실패하므로
+    # 키는 리터럴로 넣습니다.
+    return func.json_build_object(
+        *chain.from_iterable(
+            (literal_column(f"'{key}'"), value) for key, value in fields.items()
+        ),
+        type_=JSON,
+    )
+
+
+def _json_array(
+    obj: ColumnElement[Any],
+    *,
+    where: ColumnElement[bool],
+    order_by: tuple[ColumnExpressionArgument[Any], ...],
+) -> ScalarSelect[Any]:
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(obj, *order_by)),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(where)
+        .scalar_subquery()
+    )
 
 
 @dependency
@@ -19,20 +74,166 @@ class PlanRepository:
         return plan
 
     async def find_by_id(self, *, plan_id: int) -> Plan | None:
+        """
+        하위 항목을 함께 불러옵니다.
+        JOINED는 항공 x 일정 x 지출 만큼의 row를 받아 중복 제거하므로, 기본값은 SELECTIN 입니다.
+        """
+        loader = (
+            joinedload
+            if plan_settings.PLAN_LOADER == PlanLoader.JOINED
+            else selectinload
+        )
+
         result = await self.session.execute(
             select(Plan)
             .options(
-                joinedload(Plan.owner),
-                joinedload(Plan.flights),
-                joinedload(Plan.itineraries),
-                joinedload(Plan.expenses),
+                loader(Plan.flights.and_(Flight.is_deleted.is_(False))),
+                loader(Plan.itineraries.and_(Itinerary.is_deleted.is_(False))),
+                loader(Plan.expenses.and_(Expense.is_deleted.is_(False))),
             )
             .where(Plan.id == plan_id, Plan.is_deleted.is_(False))
         )
         return result.unique().scalar_one_or_none()
 
-    async def find_by_user(self, *, user_id: int) -> list[Plan]:
-        result = await self.session.execute(
-            select(Plan).where(Plan.owner_id == user_id, Plan.is_deleted.is_(False))
+    async def find_by_id_as_json(self, *, plan_id: int) -> dict[str, Any] | None:
+        """
+        하위 항목까지 Postgres에서 JSON으로 만들어 한 row로 받습니다.
+        키 이름은 PlanReadWithInforms 필드명과 같습니다.
+        """
+        flights = _json_array(
+            _json_object(
+                id=Flight.id,
+                airline=Flight.airline,
+                flight_number=Flight.flight_number,
+                departure_airport=Flight.departure_airport,
+                arrival_airport=Flight.arrival_airport,
+                departure_time=Flight.departure_time,
+                arrival_time=Flight.arrival_time,
+                seat_class=Flight.seat_class,
+                seat_number=Flight.seat_number,
+            ),
+            where=(Flight.plan_id == Plan.id) & Flight.is_deleted.is_(False),
+            order_by=(Flight.departure_time, Flight.id),
+        )
+        itineraries = _json_array(
+            _json_object(
+                id=Itinerary.id,
+                title=Itinerary.title,
+                description=Itinerary.description,
+                country=Itinerary.country,
+                city=Itinerary.city,
+                location=Itinerary.location,
+                date=Itinerary.date,
+                start_time=Itinerary.start_time,
+                end_time=Itinerary.end_time,
+            ),
+            where=(Itinerary.plan_id == Plan.id) & Itinerary.is_deleted.is_(False),
+            order_by=(Itinerary.date, Itinerary.start_time, Itinerary.id),
+        )
+        expenses = _json_array(
+            _json_object(
+                id=Expense.id,
+                # DB에는 enum 이름(FOOD)이 저장되므로 ExpenseCategory 값(food)으로 바꿉니다.
+                category=func.lower(cast(Expense.category, String)),
+                amount=Expense.amount,
+                currency=Expense.currency,
+                home_amount=Expense.home_amount,
+                description=Expense.description,
+                date=Expense.date,
+            ),
+            where=(Expense.plan_id == Plan.id) & Expense.is_deleted.is_(False),
+            order_by=(Expense.date, Expense.id),
         )
-        return list(result.unique().scalars())
+
+        plan = _json_object(
+            id=Plan.id,
+            title=Plan.title,
+            start_date=Plan.start_date,
+            end_date=Plan.end_date,
+            total_amount=Plan.total_amount,
+            flights=flights,
+            itineraries=itineraries,
+            expenses=expenses,
+        )
+
+        return await self.session.scalar(
+            select(plan).where(Plan.id == plan_id, Plan.is_deleted.is_(False))
+        )
+
+    async def find_version(self, *, plan_id: int) -> datetime | None:
+        """하위 항목을 불러오지 않고 계획의 버전(updated_at)만 조회합니다."""
+        return await self.session.scalar(
+            select(Plan.updated_at).where(
+                Plan.id == plan_id, Plan.is_deleted.is_(False)
+            )
+        )
+
+    async def find_by_user(
+        self, *, user_id: int, params: PaginationParams
+    ) -> KeysetPage[Plan]:
+        """최근 여행부터 (start_date, id) 역순으로 조회합니다. ix_plan_owner_start_date 인덱스를 사용합니다."""
+        return await paginate(
+            self.session,
+            select(Plan).where(Plan.owner_id == user_id, Plan.is_deleted.is_(False)),
+            keys=(Plan.start_date, Plan.id),
+            cursor=params.cursor,
+            limit=params.limit,
+            descending=True,
+            with_count=params.with_count,
+        )
+
+    async def find_owner_id(self, *, plan_id: int) -> int | None:
+        return await self.session.scalar(
+            select(Plan.owner_id).where(Plan.id == plan_id, Plan.is_deleted.is_(False))
+        )
+
+    async def add_total_amount(self, *, plan_id: int, amount: int) -> int | None:
+        """총 금액에 amount를 더하고 변경된 총 금액을 반환합니다."""
+        return await self.session.scalar(
+            update(Plan)
+            .where(Plan.id == plan_id)
+            .values(total_amount=Plan.total_amount + amount)
+            .returning(Plan.total_amount)
+        )
+
+    async def release_connection(self) -> None:
+        """
+        지금까지의 트랜잭션을 끝내고 커넥션을 풀에 돌려줍니다.
+        WebSocket처럼 오래 유지되는 요청에서 권한을 확인한 뒤 호출합니다.
+        """
+        await self.session.commit()
+
+    async def publish_event(
+        self,
+        *,
+        plan_id: int,
+        event_type: PlanEventType,
+        ids: Collection[int] | None = None,
+    ) -> None:
+        """트랜잭션이 커밋되면 계획을 구독 중인 클라이언트에 변경 이벤트를 보냅니다."""
+        await publish_plan_event(self.session, plan_id, event_type, ids)
+
+    async def find_schedule(
+        self, *, plan_ids: Collection[int]
+    ) -> Sequence[tuple[int, ScheduleKind, int, datetime, datetime]]:
+        """계획들의 일정과 항공편이 차지하는 시간 (plan_id, 종류, id, 시작, 종료)"""
+        itineraries = select(
+            Itinerary.plan_id,
+            literal(ScheduleKind.ITINERARY.value, String).label("kind"),
+            Itinerary.id,
+            func.lower(Itinerary.time_range, type_=DateTime).label("start"),
+            func.upper(Itinerary.time_range, type_=DateTime).label("end"),
+        ).where(Itinerary.plan_id.in_(plan_ids), Itinerary.is_deleted.is_(False))
+        flights = select(
+            Flight.plan_id,
+            literal(ScheduleKind.FLIGHT.value, String),
+            Flight.id,
+            Flight.departure_time,
+            Flight.arrival_time,
+        ).where(Flight.plan_id.in_(plan_ids), Flight.is_deleted.is_(False))
+
+        result = await self.session.execute(union_all(itineraries, flights))
+        return [
+            (plan_id, ScheduleKind(kind), id, start, end)
+            for plan_id, kind, id, start, end in result.tuples()
+        ]
@@ -1,11 +1,34 @@
-from fastapi import status
+from datetime import date
+from typing import Annotated
 
+from fastapi import Query, Request, Response, WebSocket, WebSocketException, status
+
+from app.auth.deps import (
+    WEBSOCKET_AUTH_SUBPROTOCOL,
+    WebSocketTokenDep,
+    authenticate_token,
+)
+from app.common.conditional import is_not_modified, not_modified_response
+from app.common.deps import PaginationDep
+from app.common.schemas import Page, PageWithCount
 from app.core.router import create_router
+from app.database.deps import SessionDep
 
-from .schemas import PlanCreate, PlanRead, PlanReadWithInforms, PlansReadByUser
+from .events import plan_event_hub
+from .repository import PlanRepository
+from .schemas import (
+    FreeSlot,
+    PlanCreate,
+    PlanRead,
+    PlanReadWithInforms,
+    ScheduleConflict,
+)
 from .service import PlanService
 
-router = create_router()
+router = create_router(fast_json=True)
+
+ws_router = create_router()
+"""브라우저 WebSocket은 헤더를 보낼 수 없으므로 private 라우터 밖에서 서브프로토콜로 인증합니다."""
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -16,11 +39,26 @@ async def create_plan(
     return await plan_service.create(plan_data=plan_data)
 
 
-@router.get("/{plan_id}", status_code=status.HTTP_200_OK)
+@router.get(
+    "/{plan_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=PlanReadWithInforms,
+    responses={304: {"description": "Not Modified"}},
+)
 async def read_plan(
     plan_service: PlanService,
     plan_id: int,
-) -> PlanReadWithInforms:
+    request: Request,
+    response: Response,
+) -> PlanReadWithInforms | Response:
+    # 버전을 먼저 조회하고 본문을 나중에 불러오므로, 그 사이 변경이 있더라도
+    # ETag는 본문보다 오래된 값이 되어 다음 요청에서 다시 200을 받게 됩니다.
+    validators = await plan_service.read_plan_validators(plan_id=plan_id)
+
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    response.headers.update(validators.headers)
     return await plan_service.read_plan(plan_id=plan_id)
 
 
@@ -28,5 +66,58 @@ async def read_plan(
 async def read_user_plans(
     plan_service: PlanService,
     user_id: int,
-) -> PlansReadByUser:
-    return await plan_service.read_plans_by_user(user_id=user_id)
+    pagination: PaginationDep,
+) -> PageWithCount[PlanRead] | Page[PlanRead]:
+    return await plan_service.read_plans_by_user(user_id=user_id, params=pagination)
+
+
+@router.get("/{plan_id}/schedule/conflicts", status_code=status.HTTP_200_OK)
+async def read_schedule_conflicts(
+    plan_service: PlanService,
+    plan_id: int,
+) -> list[ScheduleConflict]:
+    """계획 안에서 시간이 겹치는 일정/항공편 쌍"""
+    return await plan_service.find_conflicts(plan_id=plan_id)
+
+
+@router.get("/{plan_id}/schedule/free-slots", status_code=status.HTTP_200_OK)
+async def read_schedule_free_slots(
+    plan_service: PlanService,
+    plan_id: int,
+    date: date,
+    min_minutes: Annotated[int, Query(ge=1, le=24 * 60)] = 30,
+) -> list[FreeSlot]:
+    """date 하루 중 일정과 항공편이 없는 min_minutes분 이상의 빈 시간"""
+    return await plan_service.find_free_slots(
+        plan_id=plan_id, on=date, min_minutes=min_minutes
+    )
+
+
+@ws_router.websocket("/{plan_id}")
+async def plan_events(
+    websocket: WebSocket,
+    session: SessionDep,
+    plan_repository: PlanRepository,
+    plan_id: int,
+    token: WebSocketTokenDep,
+) -> None:
+    """
+    계획의 변경 이벤트를 실시간으로 받습니다. (app.plans.events)
+    다른 사용자나 다른 기기에서 계획을 수정하면 이벤트를 받고, 필요한 부분만 다시 조회합니다.
+    access token은 Sec-WebSocket-Protocol로 보냅니다. (get_websocket_token)
+    """
+    user = await authenticate_token(session, token) if token else None
+    if user is None:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason="인증이 필요합니다."
+        )
+    if await plan_repository.find_owner_id(plan_id=plan_id) != user.id:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason="해당 계획에 대한 권한이 없습니다.",
+        )
+    # 연결이 끝날 때까지 DB 커넥션을 잡고 있지 않도록 돌려줍니다.
+    await plan_repository.release_connection()
+
+    await websocket.accept(subprotocol=WEBSOCKET_AUTH_SUBPROTOCOL)
+    await plan_event_hub.serve(websocket, plan_id)
@@ -0,0 +1,145 @@
+"""
+여행 계획의 일정과 항공편이 차지하는 시간을 interval tree로 색인해 겹침과 빈 시간을 찾습니다.
+
+시간은 모두 [시작, 종료) 구간이며, 시작과 종료가 같은 항목은 1µs 길이로 취급해 겹침 검사에서 빠지지 않게 합니다.
+"""
+
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Iterable, Iterator
+
+_MIN_LENGTH = timedelta(microseconds=1)
+
+
+class ScheduleKind(str, Enum):
+    ITINERARY = "itinerary"
+    FLIGHT = "flight"
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleEntry:
+    kind: ScheduleKind
+    id: int
+    start: datetime
+    end: datetime
+
+    @classmethod
+    def of(
+        cls, kind: ScheduleKind, id: int, start: datetime, end: datetime
+    ) -> "ScheduleEntry":
+        return cls(kind, id, start, max(end, start + _MIN_LENGTH))
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        return self.start < end and start < self.end
+
+
+class IntervalIndex:
+    """
+    시작 시간으로 정렬한 배열을 암묵적인 균형 이진 트리로 보고,
+    각 노드에 서브트리의 최대 종료 시간을 저장한 정적 interval tree 입니다.
+    생성 O(n log n), 겹치는 구간 조회 O(log n + k)
+    """
+
+    def __init__(self, entries: Iterable[ScheduleEntry]):
+        self._entries = sorted(entries, key=lambda entry: (entry.start, entry.end))
+        self._max_end: list[datetime] = [entry.end for entry in self._entries]
+        if self._entries:
+            self._build(0, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _build(self, lo: int, hi: int) -> datetime:
+        mid = (lo + hi) // 2
+        max_end = self._max_end[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> list[ScheduleEntry]:
+        """[start, end)와 겹치는 항목을 시작 시간 순으로 반환합니다."""
+        found: list[ScheduleEntry] = []
+        # (lo, hi, 오른쪽 서브트리 방문 여부) 스택으로 중위 순회합니다.
+        stack: list[tuple[int, int, bool]] = [(0, len(self._entries), False)]
+
+        while stack:
+            lo, hi, visited = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+
+            if visited:
+                entry = self._entries[mid]
+                if entry.overlaps(start, end):
+                    found.append(entry)
+                # 오른쪽 서브트리는 모두 mid보다 늦게 시작합니다.
+                if entry.start < end:
+                    stack.append((mid + 1, hi, False))
+                continue
+
+            # 서브트리에서 가장 늦게 끝나는 항목도 start 전에 끝나면 건너뜁니다.
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, hi, True))
+            stack.append((lo, mid, False))
+
+        return found
+
+    def conflicts(self) -> list[tuple[ScheduleEntry, ScheduleEntry]]:
+        """
+        서로 겹치는 모든 항목 쌍을 (먼저 시작하는 항목, 나중 항목) 순으로 반환합니다.
+        시작 시간 순으로 훑으면서 아직 끝나지 않은 항목만 heap에 유지합니다. O(n log n + k)
+        """
+        pairs: list[tuple[ScheduleEntry, ScheduleEntry]] = []
+        active: list[tuple[datetime, int]] = []
+
+        for i, entry in enumerate(self._entries):
+            while active and active[0][0] <= entry.start:
+                heapq.heappop(active)
+            pairs.extend((self._entries[j], entry) for _, j in active)
+            heapq.heappush(active, (entry.end, i))
+
+        return pairs
+
+    def free_slots(
+        self, start: datetime, end: datetime, *, min_length: timedelta
+    ) -> list[tuple[datetime, datetime]]:
+        """[start, end) 안에서 어떤 항목과도 겹치지 않는 min_length 이상의 빈 시간"""
+        return [
+            (slot_start, slot_end)
+            for slot_start, slot_end in self._gaps(start, end)
+            if slot_end - slot_start >= min_length
+        ]
+
+    def _gaps(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, datetime]]:
+        cursor = start
+        for entry in self.overlapping(start, end):
+            if cursor < entry.start:
+                yield cursor, entry.start
+            cursor = max(cursor, entry.end)
+        if cursor < end:
+            yield cursor, end
+
+
+def build_indexes(
+    rows: Iterable[tuple[int, ScheduleKind, int, datetime, datetime]],
+) -> defaultdict[int, IntervalIndex]:
+    """PlanRepository.find_schedule 결과로 계획마다 IntervalIndex를 만듭니다."""
+    entries: defaultdict[int, list[ScheduleEntry]] = defaultdict(list)
+    for plan_id, kind, id, start, end in rows:
+        entries[plan_id].append(ScheduleEntry.of(kind, id, start, end))
+
+    indexes: defaultdict[int, IntervalIndex] = defaultdict(lambda: IntervalIndex(()))
+    indexes.update(
+        (plan_id, IntervalIndex(plan_entries))
+        for plan_id, plan_entries in entries.items()
+    )
+    return indexes
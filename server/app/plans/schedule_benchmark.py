@@ -0,0 +1,113 @@
+"""
+IntervalIndex와 모든 쌍을 비교하는 O(n²) 방식의 비용을 비교합니다.
+
+    uv run poe bench-schedule
+    uv run poe bench-schedule --sizes 1000 5000 20000 --brute-force-max 5000
+
+30일에 걸친 임의의 일정(15분 ~ 4시간)으로 크기마다 생성, 겹치는 쌍 찾기, 하루 단위 빈 시간 찾기,
+1시간 구간 겹침 조회 비용을 잽니다. brute-force-max 이하 크기에서는 O(n²) 방식과 결과가 같은지도 확인합니다.
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from .schedule import IntervalIndex, ScheduleEntry, ScheduleKind
+
+_START = datetime(2026, 1, 1)
+_DAYS = 30
+_QUERIES = 1000
+
+
+def random_entries(n: int, rng: random.Random) -> list[ScheduleEntry]:
+    entries: list[ScheduleEntry] = []
+    for i in range(n):
+        start = _START + timedelta(minutes=rng.randrange(_DAYS * 24 * 60))
+        length = timedelta(minutes=rng.randrange(15, 4 * 60))
+        kind = ScheduleKind.FLIGHT if i % 10 == 0 else ScheduleKind.ITINERARY
+        entries.append(ScheduleEntry.of(kind, i, start, start + length))
+    return entries
+
+
+def brute_force_conflicts(
+    entries: list[ScheduleEntry],
+) -> set[tuple[ScheduleEntry, ScheduleEntry]]:
+    """모든 쌍을 비교합니다. IntervalIndex.conflicts와 같은 (먼저 시작하는 항목, 나중 항목) 순서"""
+    ordered = sorted(entries, key=lambda entry: (entry.start, entry.end))
+    return {
+        (a, b)
+        for i, a in enumerate(ordered)
+        for b in ordered[i + 1 :]
+        if a.overlaps(b.start, b.end)
+    }
+
+
+def timed[T](func: Callable[[], T]) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(n: int, *, brute_force_max: int, rng: random.Random) -> bool:
+    """결과가 O(n²) 방식과 다르면 False를 반환합니다."""
+    entries = random_entries(n, rng)
+
+    index, build_time = timed(lambda: IntervalIndex(entries))
+    pairs, conflicts_time = timed(index.conflicts)
+
+    days = [_START + timedelta(days=day) for day in range(_DAYS)]
+    _, free_slots_time = timed(
+        lambda: [
+            index.free_slots(
+                day, day + timedelta(days=1), min_length=timedelta(minutes=30)
+            )
+            for day in days
+        ]
+    )
+
+    windows = [
+        _START + timedelta(minutes=rng.randrange(_DAYS * 24 * 60))
+        for _ in range(_QUERIES)
+    ]
+    _, overlap_time = timed(
+        lambda: [index.overlapping(w, w + timedelta(hours=1)) for w in windows]
+    )
+
+    print(
+        f"n={n:<6} build {build_time * 1000:8.2f} ms  "
+        f"conflicts {conflicts_time * 1000:8.2f} ms ({len(pairs)} pairs)  "
+        f"free slots {free_slots_time / _DAYS * 1000:6.3f} ms/day  "
+        f"overlap query {overlap_time / _QUERIES * 1e6:6.1f} us"
+    )
+
+    if n > brute_force_max:
+        return True
+
+    expected, brute_force_time = timed(lambda: brute_force_conflicts(entries))
+    matches = set(pairs) == expected and len(pairs) == len(expected)
+    print(
+        f"{'':<8} brute force {brute_force_time * 1000:8.2f} ms  "
+        f"{'matches' if matches else 'MISMATCH'}"
+    )
+    return matches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--brute-force-max", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(sys.argv[1:])
+
+    rng = random.Random(args.seed)
+    ok = all(
+        [run(n, brute_force_max=args.brute_force_max, rng=rng) for n in args.sizes]
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 # from pydantic import Field
 from app.expenses.schemas import ExpenseRead
@@ -6,6 +6,8 @@ from app.flights.schemas import FlightRead
 from app.itinerary.schemas import ItineraryRead
 from app.schemas import APISchema
 
+from .schedule import ScheduleKind
+
 
 class PlanBase(APISchema):
     title: str
@@ -23,6 +25,8 @@ class PlanUpdate(PlanBase):
 
 class PlanRead(PlanBase):
     id: int
+    total_amount: int
+    """지출 총 금액 (주인의 기본 통화)"""
 
 
 class PlanReadWithInforms(PlanRead):
@@ -31,5 +35,22 @@ class PlanReadWithInforms(PlanRead):
     expenses: list[ExpenseRead] | None
 
 
-class PlansReadByUser(APISchema):
-    plans: list[PlanRead]
+class ScheduleEntryRead(APISchema):
+    kind: ScheduleKind
+    id: int
+    """일정 또는 항공편 id"""
+
+    start: datetime
+    end: datetime
+
+
+class ScheduleConflict(APISchema):
+    first: ScheduleEntryRead
+    """먼저 시작하는 항목"""
+
+    second: ScheduleEntryRead
+
+
+class FreeSlot(APISchema):
+    start: datetime
+    end: datetime
@@ -1,17 +1,39 @@
+from datetime import date, datetime, time, timedelta
+
 from fastapi import HTTPException
 
 from app.auth.deps import CurrentUser
+from app.common.conditional import Validators, make_validators
+from app.common.schemas import Page, PageWithCount, PaginationParams
+from app.database.pagination import InvalidCursorError
 from app.utils.dependency import dependency
 
+from .config import PlanLoader, plan_settings
+from .deps import PlanOwnerGuard
 from .models import Plan
 from .repository import PlanRepository
-from .schemas import PlanCreate, PlanRead, PlanReadWithInforms, PlansReadByUser
+from .schedule import IntervalIndex, ScheduleEntry, build_indexes
+from .schemas import (
+    FreeSlot,
+    PlanCreate,
+    PlanRead,
+    PlanReadWithInforms,
+    ScheduleConflict,
+    ScheduleEntryRead,
+)
+
+
+def _entry_read(entry: ScheduleEntry) -> ScheduleEntryRead:
+    return ScheduleEntryRead(
+        kind=entry.kind, id=entry.id, start=entry.start, end=entry.end
+    )
 
 
 @dependency
 class PlanService:
     current_user: CurrentUser
     plan_repository: PlanRepository
+    plan_owner_guard: PlanOwnerGuard
 
     async def create(self, *, plan_data: PlanCreate) -> PlanRead:
         create_plan_data = Plan(
@@ -26,6 +48,16 @@ class PlanService:
         return PlanRead.model_validate(created_plan)
 
     async def read_plan(self, *, plan_id: int) -> PlanReadWithInforms:
+        if plan_settings.PLAN_LOADER == PlanLoader.JSON_AGG:
+            plan_json = await self.plan_repository.find_by_id_as_json(plan_id=plan_id)
+
+            if not plan_json:
+                raise HTTPException(
+                    status_code=404, detail="해당 계획을 찾을 수 없습니다."
+                )
+
+            return PlanReadWithInforms.model_validate(plan_json)
+
         plan = await self.plan_repository.find_by_id(plan_id=plan_id)
 
         if not plan:
@@ -33,8 +65,60 @@ class PlanService:
 
         return PlanReadWithInforms.model_validate(plan)
 
-    async def read_plans_by_user(self, *, user_id: int) -> PlansReadByUser:
-        plans = await self.plan_repository.find_by_user(user_id=user_id)
-        plans_list = [PlanRead.model_validate(plan) for plan in plans]
+    async def read_plan_validators(self, *, plan_id: int) -> Validators:
+        version = await self.plan_repository.find_version(plan_id=plan_id)
+
+        if version is None:
+            raise HTTPException(status_code=404, detail="해당 계획을 찾을 수 없습니다.")
+
+        return make_validators(f"plan-{plan_id}", version)
+
+    async def read_plans_by_user(
+        self, *, user_id: int, params: PaginationParams
+    ) -> Page[PlanRead] | PageWithCount[PlanRead]:
+        try:
+            page = await self.plan_repository.find_by_user(
+                user_id=user_id, params=params
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+        plans_list = [PlanRead.model_validate(plan) for plan in page.items]
+
+        if page.total_count is not None:
+            return PageWithCount(
+                list=plans_list,
+                next_cursor=page.next_cursor,
+                total_count=page.total_count,
+            )
+
+        return Page(list=plans_list, next_cursor=page.next_cursor)
+
+    async def _schedule(self, *, plan_id: int) -> IntervalIndex:
+        await self.plan_owner_guard.check(plan_id=plan_id)
+
+        rows = await self.plan_repository.find_schedule(plan_ids=[plan_id])
+        return build_indexes(rows)[plan_id]
+
+    async def find_conflicts(self, *, plan_id: int) -> list[ScheduleConflict]:
+        schedule = await self._schedule(plan_id=plan_id)
+
+        return [
+            ScheduleConflict(first=_entry_read(first), second=_entry_read(second))
+            for first, second in schedule.conflicts()
+        ]
+
+    async def find_free_slots(
+        self, *, plan_id: int, on: date, min_minutes: int
+    ) -> list[FreeSlot]:
+        schedule = await self._schedule(plan_id=plan_id)
 
-        return PlansReadByUser(plans=plans_list)
+        day_start = datetime.combine(on, time.min)
+        return [
+            FreeSlot(start=start, end=end)
+            for start, end in schedule.free_slots(
+                day_start,
+                day_start + timedelta(days=1),
+                min_length=timedelta(minutes=min_minutes),
+            )
+        ]
@@ -0,0 +1,4 @@
+from .base import StorageBackend, StoredObject, rechunk
+from .storage import close_storage, get_storage
+
+__all__ = ["StorageBackend", "StoredObject", "close_storage", "get_storage", "rechunk"]
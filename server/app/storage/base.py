@@ -0,0 +1,68 @@
+import hashlib
+from dataclasses import dataclass
+from typing import AsyncIterator, Protocol
+
+from fastapi import Response
+
+from .exceptions import ObjectTooLargeError
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    key: str
+    """내용의 SHA-256 (hex). 같은 내용의 파일은 한 번만 저장됩니다."""
+
+    size: int
+
+
+class StorageBackend(Protocol):
+    async def save(
+        self, chunks: AsyncIterator[bytes], *, max_size: int
+    ) -> StoredObject:
+        """
+        chunks를 받는 대로 저장하면서 해시를 계산합니다. 전체 내용을 메모리에 올리지 않습니다.
+        max_size를 넘으면 ObjectTooLargeError가 발생하고 받은 내용은 버립니다.
+        """
+        ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def download(self, key: str, *, filename: str, content_type: str) -> Response:
+        """파일을 내려주는 응답. Range 요청을 지원합니다."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class ContentHasher:
+    """저장하면서 받은 크기와 SHA-256을 계산합니다."""
+
+    def __init__(self, max_size: int):
+        self._hash = hashlib.sha256()
+        self._max_size = max_size
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self._max_size:
+            raise ObjectTooLargeError(self._max_size)
+        self._hash.update(chunk)
+
+    @property
+    def key(self) -> str:
+        return self._hash.hexdigest()
+
+
+async def rechunk(chunks: AsyncIterator[bytes], size: int) -> AsyncIterator[bytes]:
+    """
+    작은 조각(ASGI 서버는 보통 64KB 단위)으로 들어오는 요청 본문을 size 단위로 모읍니다.
+    저장소가 조각마다 스레드로 넘기거나 요청을 보내는 횟수를 줄입니다.
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,31 @@
+from pathlib import Path
+from typing import Literal
+
+from app.config import BaseConfig
+
+
+class StorageConfig(BaseConfig):
+    STORAGE_BACKEND: Literal["local", "s3"] = "local"
+
+    STORAGE_CHUNK_SIZE: int = 1024 * 1024
+    """업로드를 읽고 해시를 계산하는 단위 (바이트)"""
+
+    STORAGE_LOCAL_ROOT: Path = Path("storage")
+    """local 백엔드가 파일을 저장하는 디렉터리"""
+
+    S3_BUCKET: str = ""
+    S3_ENDPOINT_URL: str | None = None
+    """S3 호환 저장소(MinIO 등) 주소. None이면 AWS S3"""
+
+    S3_REGION: str | None = None
+    S3_ACCESS_KEY_ID: str | None = None
+    S3_SECRET_ACCESS_KEY: str | None = None
+
+    S3_PART_SIZE: int = 8 * 1024 * 1024
+    """multipart 업로드의 part 크기 (5MB 이상). 업로드 하나가 메모리에 최대 이만큼 쌓입니다."""
+
+    S3_PRESIGNED_URL_EXPIRES: int = 300
+    """다운로드용 presigned URL 유효 시간 (초)"""
+
+
+storage_settings = StorageConfig.create()
@@ -0,0 +1,8 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from .base import StorageBackend
+from .storage import get_storage
+
+StorageDep = Annotated[StorageBackend, Depends(get_storage)]
@@ -0,0 +1,21 @@
+class StorageError(Exception):
+    """파일 저장소 오류. core.exceptions의 핸들러가 status_code와 detail로 응답합니다."""
+
+    def __init__(self, detail: str, *, status_code: int = 500):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class ObjectNotFoundError(StorageError):
+    def __init__(self, key: str):
+        super().__init__("파일을 찾을 수 없습니다.", status_code=404)
+        self.key = key
+
+
+class ObjectTooLargeError(StorageError):
+    def __init__(self, max_size: int):
+        super().__init__(
+            f"파일은 {max_size // (1024 * 1024)}MB까지 올릴 수 있습니다.",
+            status_code=413,
+        )
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from .base import ContentHasher, StoredObject
+from .exceptions import ObjectNotFoundError
+
+
+class LocalStorage:
+    """
+    로컬 디렉터리에 내용의 해시를 이름으로 저장합니다. (root/ab/cd/abcd...)
+    임시 파일에 끝까지 쓴 뒤 rename 하므로 중간까지 쓴 파일이 보이지 않습니다.
+    다운로드는 FileResponse로 보내므로 Range 요청과 sendfile(zero-copy)을 그대로 사용합니다.
+    """
+
+    def __init__(self, root: Path):
+        self._root = root.resolve()
+        self._tmp = self._root / "tmp"
+
+    def path(self, key: str) -> Path:
+        if len(key) != 64 or not key.isalnum():
+            raise ObjectNotFoundError(key)
+        return self._root / key[:2] / key[2:4] / key
+
+    async def save(
+        self, chunks: AsyncIterator[bytes], *, max_size: int
+    ) -> StoredObject:
+        await asyncio.to_thread(self._tmp.mkdir, parents=True, exist_ok=True)
+        tmp_path = self._tmp / uuid.uuid4().hex
+        hasher = ContentHasher(max_size)
+
+        def write(file: BinaryIO, chunk: bytes) -> None:
+            hasher.update(chunk)
+            file.write(chunk)
+
+        try:
+            file = await asyncio.to_thread(tmp_path.open, "wb")
+            try:
+                async for chunk in chunks:
+                    # 해시 계산과 쓰기를 함께 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+                    await asyncio.to_thread(write, file, chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+
+            stored = StoredObject(key=hasher.key, size=hasher.size)
+            await asyncio.to_thread(self._commit, tmp_path, self.path(stored.key))
+        except BaseException:
+            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            raise
+
+        return stored
+
+    @staticmethod
+    def _commit(tmp_path: Path, path: Path) -> None:
+        if path.exists():
+            # 같은 내용이 이미 있으면 새로 쓴 파일은 버립니다.
+            tmp_path.unlink()
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, path)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.path(key).unlink, missing_ok=True)
+
+    async def download(self, key: str, *, filename: str, content_type: str) -> Response:
+        path = self.path(key)
+        try:
+            stat_result = await asyncio.to_thread(os.stat, path)
+        except FileNotFoundError:
+            raise ObjectNotFoundError(key)
+
+        return FileResponse(
+            path,
+            stat_result=stat_result,
+            media_type=content_type,
+            filename=filename,
+            headers={"Cache-Control": "private, max-age=31536000, immutable"},
+        )
+
+    async def close(self) -> None:
+        pass
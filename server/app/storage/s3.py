@@ -0,0 +1,178 @@
+import contextlib
+import uuid
+from typing import TYPE_CHECKING, AsyncIterator
+from urllib.parse import quote
+
+import aioboto3
+from botocore.exceptions import ClientError
+from fastapi import Response
+from fastapi.responses import RedirectResponse
+
+from .base import ContentHasher, StoredObject
+from .config import StorageConfig
+
+if TYPE_CHECKING:
+    from types_aiobotocore_s3.client import S3Client
+    from types_aiobotocore_s3.type_defs import CompletedPartTypeDef
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in (
+        "404",
+        "NoSuchKey",
+        "NotFound",
+    )
+
+
+class S3Storage:
+    """
+    S3(또는 MinIO 같은 S3 호환 저장소)에 내용의 해시를 key로 저장합니다.
+
+    해시는 다 받은 뒤에야 알 수 있으므로, 임시 key에 multipart로 올리면서 해시를 계산하고
+    끝나면 서버 측 복사로 해시 key에 옮깁니다. 메모리에는 part 하나(S3_PART_SIZE)만 쌓입니다.
+    다운로드는 presigned URL로 redirect 하므로 파일이 API 서버를 거치지 않고, Range 요청은 S3가 처리합니다.
+    """
+
+    def __init__(self, settings: StorageConfig):
+        self._settings = settings
+        self._bucket = settings.S3_BUCKET
+        self._exit_stack: contextlib.AsyncExitStack | None = None
+        self._s3: S3Client | None = None
+
+    async def _client(self) -> "S3Client":
+        if self._s3 is not None:
+            return self._s3
+
+        exit_stack = contextlib.AsyncExitStack()
+        session = aioboto3.Session(
+            aws_access_key_id=self._settings.S3_ACCESS_KEY_ID,
+            aws_secret_access_key=self._settings.S3_SECRET_ACCESS_KEY,
+            region_name=self._settings.S3_REGION,
+        )
+        # client는 연결 풀을 가지므로 한 번 만들어 앱이 끝날 때까지 재사용합니다.
+        self._s3 = await exit_stack.enter_async_context(
+            session.client("s3", endpoint_url=self._settings.S3_ENDPOINT_URL)
+        )
+        self._exit_stack = exit_stack
+        return self._s3
+
+    async def save(
+        self, chunks: AsyncIterator[bytes], *, max_size: int
+    ) -> StoredObject:
+        s3 = await self._client()
+        part_size = self._settings.S3_PART_SIZE
+        hasher = ContentHasher(max_size)
+        tmp_key = f"tmp/{uuid.uuid4().hex}"
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[CompletedPartTypeDef] = []
+
+        try:
+            async for chunk in chunks:
+                hasher.update(chunk)
+                buffer += chunk
+                if len(buffer) < part_size:
+                    continue
+
+                if upload_id is None:
+                    upload = await s3.create_multipart_upload(
+                        Bucket=self._bucket, Key=tmp_key
+                    )
+                    upload_id = upload["UploadId"]
+                part = await s3.upload_part(
+                    Bucket=self._bucket,
+                    Key=tmp_key,
+                    UploadId=upload_id,
+                    PartNumber=len(parts) + 1,
+                    Body=bytes(buffer),
+                )
+                parts.append({"PartNumber": len(parts) + 1, "ETag": part["ETag"]})
+                buffer.clear()
+
+            stored = StoredObject(key=hasher.key, size=hasher.size)
+            if await self._exists(stored.key):
+                if upload_id is not None:
+                    await s3.abort_multipart_upload(
+                        Bucket=self._bucket, Key=tmp_key, UploadId=upload_id
+                    )
+                return stored
+
+            if upload_id is None:
+                # part 하나보다 작은 파일은 바로 해시 key로 올립니다.
+                await s3.put_object(
+                    Bucket=self._bucket, Key=stored.key, Body=bytes(buffer)
+                )
+                return stored
+
+            if buffer:
+                part = await s3.upload_part(
+                    Bucket=self._bucket,
+                    Key=tmp_key,
+                    UploadId=upload_id,
+                    PartNumber=len(parts) + 1,
+                    Body=bytes(buffer),
+                )
+                parts.append({"PartNumber": len(parts) + 1, "ETag": part["ETag"]})
+            await s3.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=tmp_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            upload_id = None
+        except BaseException:
+            if upload_id is not None:
+                await s3.abort_multipart_upload(
+                    Bucket=self._bucket, Key=tmp_key, UploadId=upload_id
+                )
+            raise
+
+        try:
+            await s3.copy_object(
+                Bucket=self._bucket,
+                Key=stored.key,
+                CopySource={"Bucket": self._bucket, "Key": tmp_key},
+            )
+        finally:
+            await s3.delete_object(Bucket=self._bucket, Key=tmp_key)
+
+        return stored
+
+    async def _exists(self, key: str) -> bool:
+        s3 = await self._client()
+        try:
+            await s3.head_object(Bucket=self._bucket, Key=key)
+        except ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise
+        return True
+
+    async def delete(self, key: str) -> None:
+        s3 = await self._client()
+        await s3.delete_object(Bucket=self._bucket, Key=key)
+
+    async def download(self, key: str, *, filename: str, content_type: str) -> Response:
+        # 존재 확인(HEAD)은 하지 않습니다. 없는 key면 S3가 404로 응답합니다.
+        s3 = await self._client()
+        url = await s3.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self._bucket,
+                "Key": key,
+                "ResponseContentType": content_type,
+                "ResponseContentDisposition": _content_disposition(filename),
+            },
+            ExpiresIn=self._settings.S3_PRESIGNED_URL_EXPIRES,
+        )
+        return RedirectResponse(url, headers={"Cache-Control": "no-store"})
+
+    async def close(self) -> None:
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._s3 = None
+
+
+def _content_disposition(filename: str) -> str:
+    return f"attachment; filename*=utf-8''{quote(filename)}"
@@ -0,0 +1,32 @@
+"""
+첨부 파일 저장소
+
+STORAGE_BACKEND에 따라 로컬 디렉터리 또는 S3를 사용합니다. 워커별로 하나를 두고 lifespan에서 정리합니다.
+"""
+
+from .base import StorageBackend
+from .config import storage_settings
+
+_storage: StorageBackend | None = None
+
+
+def get_storage() -> StorageBackend:
+    """STORAGE_BACKEND 설정에 따른 공유 저장소"""
+    global _storage
+    if _storage is None:
+        if storage_settings.STORAGE_BACKEND == "s3":
+            from .s3 import S3Storage
+
+            _storage = S3Storage(storage_settings)
+        else:
+            from .local import LocalStorage
+
+            _storage = LocalStorage(storage_settings.STORAGE_LOCAL_ROOT)
+    return _storage
+
+
+async def close_storage() -> None:
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+    _storage = None
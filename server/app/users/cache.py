@@ -0,0 +1,79 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database.notify import notify, pg_listener
+from app.utils.cache import TTLCache
+
+from .config import user_settings
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """
+    인증된 요청의 유저 정보. 세션과 분리된 불변 스냅샷이므로 요청 간에 공유할 수 있습니다.
+    필요한 필드가 더 생기면 여기에 추가합니다.
+    """
+
+    id: int
+    handle: str
+    home_currency: str
+    is_deleted: bool
+
+    @classmethod
+    def of(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            handle=user.handle,
+            home_currency=user.home_currency,
+            is_deleted=user.is_deleted,
+        )
+
+
+user_cache = TTLCache[int, AuthenticatedUser](
+    maxsize=user_settings.USER_CACHE_SIZE,
+    ttl=user_settings.USER_CACHE_TTL,
+)
+
+
+async def invalidate_user(session: AsyncSession, user_id: int) -> None:
+    """
+    유저 캐시를 무효화합니다.
+    커밋 전에 다른 요청이 이전 값을 다시 채울 수 있으므로 커밋 후에 한 번 더 지웁니다.
+    """
+    user_cache.pop(user_id)
+
+    def _after_commit(_session: Session) -> None:
+        user_cache.pop(user_id)
+
+    event.listen(session.sync_session, "after_commit", _after_commit, once=True)
+
+    if user_settings.USER_CACHE_INVALIDATION_CHANNEL:
+        await notify(
+            session, user_settings.USER_CACHE_INVALIDATION_CHANNEL, str(user_id)
+        )
+
+
+def _on_invalidation(payload: str) -> None:
+    try:
+        user_cache.pop(int(payload))
+    except ValueError:
+        logger.warning("Invalid user cache invalidation payload: %s", payload)
+
+
+async def start_user_cache_invalidation() -> None:
+    """다른 워커에서 보낸 무효화 알림을 구독합니다."""
+    if not user_settings.USER_CACHE_INVALIDATION_CHANNEL:
+        return
+
+    await pg_listener.subscribe(
+        user_settings.USER_CACHE_INVALIDATION_CHANNEL,
+        _on_invalidation,
+        on_reset=user_cache.clear,
+    )
@@ -0,0 +1,33 @@
+from app.config import BaseConfig
+
+
+class UserConfig(BaseConfig):
+    USER_CACHE_SIZE: int = 10_000
+    """인증된 유저 스냅샷을 워커별로 기억해 둘 최대 개수 (0이면 캐시하지 않음)"""
+
+    USER_CACHE_TTL: float = 30.0
+    """인증된 유저 스냅샷 유지 시간 (초)"""
+
+    USER_CACHE_INVALIDATION_CHANNEL: str | None = None
+    """
+    설정하면 유저 변경 시 Postgres NOTIFY로 다른 워커의 캐시도 무효화합니다.
+    설정하지 않으면 다른 워커에서는 최대 USER_CACHE_TTL 동안 이전 값이 보일 수 있습니다.
+    """
+
+    HANDLE_INDEX_ENABLED: bool = True
+    """
+    사용 중인 handle 목록을 워커 메모리에 올려 handle 검사 시 DB 조회를 줄입니다.
+    HANDLE_INDEX_CHANNEL로 다른 워커의 가입을 받는 동안에는 목록에 없는 handle을 DB 조회 없이 사용 가능으로 응답합니다.
+    """
+
+    HANDLE_INDEX_CHANNEL: str | None = "user_handles"
+    """
+    가입한 handle을 Postgres NOTIFY로 다른 워커의 목록에도 추가하는 채널.
+    비워 두면 다른 워커의 가입을 알 수 없으므로, 목록은 추천 handle을 고를 때만 쓰고 handle 검사는 항상 DB로 확인합니다.
+    """
+
+    HANDLE_SUGGESTION_COUNT: int = 5
+    """handle 검사에서 suggest를 요청했을 때 돌려주는 추천 handle 수"""
+
+
+user_settings = UserConfig.create()
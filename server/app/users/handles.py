@@ -0,0 +1,138 @@
+"""
+워커별 handle 목록
+
+가입 화면은 입력할 때마다 handle 사용 가능 여부를 묻기 때문에, 사용 중인 handle을 정렬된 배열로 들고 있다가
+배열에 있는 handle만 DB로 확인합니다. 정렬되어 있으므로 같은 접두사의 handle도 바로 찾을 수 있습니다.
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left, insort
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database.engine import get_engine
+from app.database.notify import notify, pg_listener
+
+from .config import user_settings
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+class HandleIndex:
+    """
+    사용 중인 handle의 정렬된 배열.
+    불러오는 중에 추가된 handle은 따로 모아 두었다가 불러온 뒤 합칩니다.
+    """
+
+    def __init__(self):
+        self._handles: list[str] = []
+        self._pending: set[str] = set()
+        self._loading: asyncio.Task[None] | None = None
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, handle: str) -> bool:
+        index = bisect_left(self._handles, handle)
+        return index < len(self._handles) and self._handles[index] == handle
+
+    def add(self, handle: str) -> None:
+        if not self.ready:
+            self._pending.add(handle)
+        elif handle not in self:
+            insort(self._handles, handle)
+
+    def load(self, handles: list[str]) -> None:
+        """
+        정렬된 handle 목록으로 교체합니다.
+        불러오는 중에 추가된 handle은 목록을 조회한 뒤에 가입했을 수 있으므로 함께 넣습니다.
+        """
+        self._handles = sorted(set(handles) | self._pending)
+        self._pending.clear()
+        self.ready = True
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        start = bisect_left(self._handles, prefix)
+        end = bisect_left(self._handles, prefix + "\U0010ffff", lo=start)
+        return self._handles[start:end]
+
+    async def reload(self) -> None:
+        async with get_engine().sessionmaker() as session:
+            handles = list(
+                await session.scalars(select(User.handle).order_by(User.handle))
+            )
+
+        self.load(handles)
+        logger.info("Handle index loaded: %d handles", len(handles))
+
+    def invalidate(self) -> None:
+        """
+        다른 워커의 가입 알림을 받지 못하는 동안 DB로 확인하도록 합니다.
+        그동안 추가된 handle은 다음에 불러올 때 합칩니다.
+        """
+        self.ready = False
+        if self._loading is not None:
+            # 끊기기 전에 시작한 불러오기가 끝나면서 ready가 되지 않도록 취소합니다.
+            self._loading.cancel()
+            self._loading = None
+
+    def start_reload(self) -> None:
+        """백그라운드에서 다시 불러옵니다. 불러오는 동안에는 DB로 확인합니다."""
+        if self._loading is not None:
+            return
+
+        self.ready = False
+        self._loading = asyncio.create_task(self._reload_task())
+
+    async def _reload_task(self) -> None:
+        try:
+            await self.reload()
+        except Exception:
+            logger.exception("Failed to load handle index")
+        finally:
+            if self._loading is asyncio.current_task():
+                self._loading = None
+
+    async def stop(self) -> None:
+        if self._loading is not None:
+            self._loading.cancel()
+            self._loading = None
+
+
+handle_index = HandleIndex()
+
+
+async def add_handle(session: AsyncSession, handle: str) -> None:
+    """커밋된 뒤 현재 워커의 목록에 handle을 추가하고, 다른 워커에도 알립니다."""
+
+    def _after_commit(_session: Session) -> None:
+        handle_index.add(handle)
+
+    event.listen(session.sync_session, "after_commit", _after_commit, once=True)
+
+    if user_settings.HANDLE_INDEX_CHANNEL:
+        await notify(session, user_settings.HANDLE_INDEX_CHANNEL, handle)
+
+
+async def start_handle_index() -> None:
+    """
+    알림을 먼저 구독한 뒤 목록을 불러오므로, 불러오는 사이에 가입한 handle도 빠지지 않습니다.
+    LISTEN 연결이 끊겨 있는 동안에는 DB로 확인하고, 다시 연결되면 놓친 알림이 있을 수 있으므로 목록을 다시 불러옵니다.
+    """
+    if not user_settings.HANDLE_INDEX_ENABLED:
+        return
+
+    if user_settings.HANDLE_INDEX_CHANNEL:
+        await pg_listener.subscribe(
+            user_settings.HANDLE_INDEX_CHANNEL,
+            handle_index.add,
+            on_reset=handle_index.start_reload,
+            on_lost=handle_index.invalidate,
+        )
+
+    handle_index.start_reload()
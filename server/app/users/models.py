@@ -22,7 +22,6 @@ class User(Base):
     id: Mapped[int] = mapped_column(
         primary_key=True,
         init=False,
-        index=True,
         autoincrement=True,
     )
 
@@ -42,6 +41,14 @@ class User(Base):
 
     gender: Mapped[Gender | None]
 
+    home_currency: Mapped[str] = mapped_column(
+        String(3),
+        default="KRW",
+        server_default="KRW",
+        kw_only=True,
+    )
+    """기본 통화 (ISO 4217). 여행 총 금액과 지출 요약을 이 통화로 보여줍니다."""
+
     plans: Mapped[list["Plan"]] = relationship(
         back_populates="owner",
         cascade="all, delete-orphan",
@@ -3,6 +3,8 @@ from sqlalchemy import exists, select, update
 from app.database.deps import SessionDep
 from app.utils.dependency import dependency
 
+from .cache import invalidate_user
+from .handles import add_handle
 from .models import User
 from .schemas import UserCreate, UserUpdate
 
@@ -16,6 +18,14 @@ class UserRepository:
             await self.session.scalar(select(exists().where(User.handle == handle)))
         )
 
+    async def find_taken_handles(self, *, handles: list[str]) -> set[str]:
+        """handles 중 이미 사용 중인 것"""
+        return set(
+            await self.session.scalars(
+                select(User.handle).where(User.handle.in_(handles))
+            )
+        )
+
     async def find_by_id(self, *, user_id: int) -> User | None:
         return await self.session.get(User, user_id)
 
@@ -29,6 +39,8 @@ class UserRepository:
         self.session.add(created_user)
         await self.session.flush()
         await self.session.refresh(created_user)
+        await invalidate_user(self.session, created_user.id)
+        await add_handle(self.session, created_user.handle)
 
         return created_user
 
@@ -41,5 +53,9 @@ class UserRepository:
             .values(**updated_data_dict)
             .returning(User)
         )
+        await invalidate_user(self.session, user_id)
+        if updated_user is not None and "handle" in updated_data_dict:
+            # 이전 handle은 목록에 남지만, 목록에 있는 handle은 DB로 다시 확인하므로 결과는 정확합니다.
+            await add_handle(self.session, updated_user.handle)
 
         return updated_user
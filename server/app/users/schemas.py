@@ -3,6 +3,8 @@ from typing import Annotated
 
 from pydantic import Field
 
+from app.common.schemas import ValidationResult
+from app.currency.schemas import CurrencyCode
 from app.schemas import APISchema
 
 from .models import Gender
@@ -26,6 +28,7 @@ class UserBase(APISchema):
     nickname: str
     description: Description
     gender: Gender
+    home_currency: CurrencyCode = "KRW"
 
 
 class UserCreate(UserBase):
@@ -38,3 +41,8 @@ class UserUpdate(UserBase):
 
 class UserRead(UserBase):
     pass
+
+
+class HandleValidationResult(ValidationResult):
+    suggestions: list[str] | None = None
+    """handle을 사용할 수 없을 때 추천하는 사용 가능한 handle (suggest 요청 시)"""
@@ -5,12 +5,14 @@ from fastapi import HTTPException
 from app.auth.deps import CurrentUser
 from app.auth.models import UserAuthInfo
 from app.auth.service import AuthInfoService
-from app.common.schemas import ValidationResult
 from app.utils.dependency import dependency
 
+from .config import user_settings
+from .handles import handle_index
 from .models import User
 from .repository import UserRepository
 from .schemas import (
+    HandleValidationResult,
     UserCreate,
     # UserRead,
     # UserUpdate,
@@ -24,23 +26,60 @@ class UserService:
 
     _handle_pattern = re.compile(r"^[a-z0-9_.]{3,36}$")
 
-    async def validate_handle(self, *, handle: str) -> ValidationResult:
-        error = None
-
+    def _check_handle_format(self, handle: str) -> str | None:
         if not self._handle_pattern.fullmatch(handle) or handle == "me":
-            return ValidationResult(
-                error="handle은 3~36자의 영문 소문자, 숫자, 밑줄(_) 또는 마침표(.)만 가능하며, 'me'는 사용할 수 없습니다."
-            )
-        if await self.user_repository.is_handle_taken(handle=handle):
-            error = "이미 사용 중인 핸들입니다."
+            return "handle은 3~36자의 영문 소문자, 숫자, 밑줄(_) 또는 마침표(.)만 가능하며, 'me'는 사용할 수 없습니다."
+        return None
+
+    async def validate_handle(
+        self, *, handle: str, suggest: bool = False
+    ) -> HandleValidationResult:
+        """
+        가입 화면에서 입력할 때마다 호출됩니다.
+        다른 워커의 가입을 알림으로 받는 동안에는 handle 목록에 없으면 DB를 조회하지 않고 사용 가능으로 응답합니다.
+        """
+        if error := self._check_handle_format(handle):
+            return HandleValidationResult(error=error)
+
+        if (
+            handle_index.ready
+            and user_settings.HANDLE_INDEX_CHANNEL
+            and handle not in handle_index
+        ):
+            return HandleValidationResult(error=None)
+
+        if not await self.user_repository.is_handle_taken(handle=handle):
+            return HandleValidationResult(error=None)
+
+        return HandleValidationResult(
+            error="이미 사용 중인 핸들입니다.",
+            suggestions=await self._suggest_handles(handle) if suggest else None,
+        )
 
-        return ValidationResult(error=error)
+    async def _suggest_handles(self, handle: str) -> list[str]:
+        """handle 뒤에 숫자를 붙인 handle 중 사용 가능한 것을 찾습니다."""
+        count = user_settings.HANDLE_SUGGESTION_COUNT
+        base = handle[:33]
+        taken: set[str] = (
+            set(handle_index.with_prefix(base)) if handle_index.ready else set()
+        )
 
-    async def register(self, *, user_data: UserCreate, auth: UserAuthInfo) -> User:
-        handle_validate = await self.validate_handle(handle=user_data.handle)
+        candidates = [
+            candidate
+            for candidate in (f"{base}{n}" for n in range(1, 1000))
+            if candidate not in taken
+        ][: count * 2]
+
+        # 목록은 다른 워커의 가입을 놓쳤을 수 있으므로 후보는 한 번의 쿼리로 확인합니다.
+        taken = await self.user_repository.find_taken_handles(handles=candidates)
+        return [candidate for candidate in candidates if candidate not in taken][:count]
 
-        if handle_validate.error:
-            raise HTTPException(status_code=400, detail=handle_validate.error)
+    async def register(self, *, user_data: UserCreate, auth: UserAuthInfo) -> User:
+        # 가입은 다른 워커의 목록 상태와 관계없이 항상 DB로 확인합니다.
+        if error := self._check_handle_format(user_data.handle):
+            raise HTTPException(status_code=400, detail=error)
+        if await self.user_repository.is_handle_taken(handle=user_data.handle):
+            raise HTTPException(status_code=400, detail="이미 사용 중인 핸들입니다.")
 
         # 1. 사용자 생성
         created_user = await self.user_repository.create(user_data=user_data)
@@ -6,10 +6,13 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
+import app.attachments.models as _
 import app.auth.models as _
+import app.currency.models as _
 import app.expenses.models as _
 import app.flights.models as _
 import app.itinerary.models as _
+import app.jobs.models as _
 import app.plans.models as _
 import app.users.models as _
 
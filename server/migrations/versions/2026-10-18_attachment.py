@@ -0,0 +1,56 @@
+"""attachment
+
+Revision ID: 5e0c8b7a21f4
+Revises: da74d27863b5
+Create Date: 2026-10-18 15:21:07.418532
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0c8b7a21f4"
+down_revision: Union[str, None] = "da74d27863b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attachment",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("plan_id", sa.Integer(), nullable=False),
+        sa.Column("flight_id", sa.Integer(), nullable=True),
+        sa.Column("itinerary_id", sa.Integer(), nullable=True),
+        sa.Column("digest", sa.String(length=64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("content_type", sa.String(length=255), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["flight_id"], ["flight.id"]),
+        sa.ForeignKeyConstraint(["itinerary_id"], ["itinerary.id"]),
+        sa.ForeignKeyConstraint(["plan_id"], ["plan.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_attachment_plan_id",
+        "attachment",
+        ["plan_id"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted IS false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_attachment_plan_id",
+        table_name="attachment",
+        postgresql_where=sa.text("is_deleted IS false"),
+    )
+    op.drop_table("attachment")
@@ -0,0 +1,67 @@
+"""expense currency
+
+Revision ID: 9a248a48d583
+Revises: 9ca6da3049b2
+Create Date: 2026-10-18 11:42:37.815204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a248a48d583"
+down_revision: Union[str, None] = "9ca6da3049b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exchange_rate",
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=20, scale=10), nullable=False),
+        sa.PrimaryKeyConstraint("currency", "date"),
+    )
+
+    op.add_column(
+        "user",
+        sa.Column(
+            "home_currency", sa.String(length=3), server_default="KRW", nullable=False
+        ),
+    )
+    op.add_column(
+        "expense",
+        sa.Column(
+            "currency", sa.String(length=3), server_default="KRW", nullable=False
+        ),
+    )
+
+    # 기존 지출은 모두 KRW이고 유저의 기본 통화도 KRW이므로 환산 금액은 금액과 같습니다.
+    op.add_column(
+        "expense",
+        sa.Column("home_amount", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute("UPDATE expense SET home_amount = amount")
+    op.alter_column("expense", "home_amount", server_default=None)
+
+    # 지금까지 관리되지 않던 total_amount를 환산 금액 합계로 맞춥니다.
+    op.execute(
+        """
+        UPDATE plan SET total_amount = coalesce(
+            (SELECT sum(home_amount) FROM expense
+             WHERE expense.plan_id = plan.id AND expense.is_deleted IS false),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("expense", "home_amount")
+    op.drop_column("expense", "currency")
+    op.drop_column("user", "home_currency")
+    op.drop_table("exchange_rate")
@@ -0,0 +1,67 @@
+"""itinerary time range
+
+Revision ID: ec1b3a42201a
+Revises: 9a248a48d583
+Create Date: 2026-10-18 12:31:05.482913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "ec1b3a42201a"
+down_revision: Union[str, None] = "9a248a48d583"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIME_RANGE_EXPRESSION = """
+tsrange(
+    date + start_time,
+    CASE WHEN end_time < start_time THEN date + 1 + end_time ELSE date + end_time END,
+    CASE WHEN end_time = start_time THEN '[]' ELSE '[)' END
+)
+"""
+
+
+def upgrade() -> None:
+    # GiST 인덱스에 plan_id(integer)를 함께 넣기 위해 필요합니다.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # STORED 생성 컬럼 추가는 테이블을 다시 쓰므로 그동안 itinerary 테이블이 잠깁니다.
+    op.add_column(
+        "itinerary",
+        sa.Column(
+            "time_range",
+            postgresql.TSRANGE(),
+            sa.Computed(TIME_RANGE_EXPRESSION, persisted=True),
+            nullable=False,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_itinerary_plan_time_range",
+            "itinerary",
+            ["plan_id", "time_range"],
+            unique=False,
+            postgresql_using="gist",
+            postgresql_where=sa.text("is_deleted IS false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_itinerary_plan_time_range",
+            table_name="itinerary",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column("itinerary", "time_range")
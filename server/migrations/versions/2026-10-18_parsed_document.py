@@ -0,0 +1,36 @@
+"""parsed document
+
+Revision ID: 109c5d2b5528
+Revises: ec1b3a42201a
+Create Date: 2026-10-18 13:20:44.106375
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "109c5d2b5528"
+down_revision: Union[str, None] = "ec1b3a42201a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parsed_document",
+        sa.Column("digest", sa.String(length=64), nullable=False),
+        sa.Column("parser_version", sa.Integer(), nullable=False),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("digest"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("parsed_document")
@@ -0,0 +1,41 @@
+"""plan owner start_date index
+
+Revision ID: a05039cdb875
+Revises: f3e67109e909
+Create Date: 2026-10-18 11:02:37.581920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a05039cdb875"
+down_revision: Union[str, None] = "f3e67109e909"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 여행 목록 keyset pagination 용. 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성합니다.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_plan_owner_start_date",
+            "plan",
+            ["owner_id", "start_date", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted IS false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_plan_owner_start_date",
+            table_name="plan",
+            postgresql_where=sa.text("is_deleted IS false"),
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,77 @@
+"""plan version triggers
+
+Revision ID: f3e67109e909
+Revises: 701e16732a53
+Create Date: 2026-10-18 10:52:11.204113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3e67109e909"
+down_revision: Union[str, None] = "701e16732a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHILD_TABLES = ("flight", "itinerary", "expense")
+
+
+def upgrade() -> None:
+    # 하위 항목(항공/일정/지출)이 바뀌면 plan.updated_at을 갱신해 ETag가 바뀌도록 합니다.
+    # COPY나 bulk UPDATE도 잡기 위해 ORM 이벤트가 아닌 statement 단위 트리거를 사용합니다.
+    op.execute(
+        """
+        CREATE FUNCTION bump_plan_updated_at() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE plan SET updated_at = clock_timestamp()
+                WHERE id IN (SELECT DISTINCT plan_id FROM new_rows);
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE plan SET updated_at = clock_timestamp()
+                WHERE id IN (SELECT DISTINCT plan_id FROM old_rows);
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+
+    for table in CHILD_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_plan_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_plan_updated_at()
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_plan_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_plan_updated_at()
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_plan_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_plan_updated_at()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in CHILD_TABLES:
+        op.execute(f"DROP TRIGGER {table}_bump_plan_delete ON {table}")
+        op.execute(f"DROP TRIGGER {table}_bump_plan_update ON {table}")
+        op.execute(f"DROP TRIGGER {table}_bump_plan_insert ON {table}")
+
+    op.execute("DROP FUNCTION bump_plan_updated_at()")
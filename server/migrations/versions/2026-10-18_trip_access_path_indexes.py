@@ -0,0 +1,79 @@
+"""trip access path indexes
+
+Revision ID: 9ca6da3049b2
+Revises: a05039cdb875
+Create Date: 2026-10-18 11:10:52.318047
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9ca6da3049b2"
+down_revision: Union[str, None] = "a05039cdb875"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text("is_deleted IS false")
+
+ACCESS_PATH_INDEXES = (
+    ("ix_itinerary_plan_date_start_time", "itinerary", ["plan_id", "date", "start_time"]),
+    ("ix_flight_plan_departure_time", "flight", ["plan_id", "departure_time"]),
+    ("ix_expense_plan_date", "expense", ["plan_id", "date"]),
+)
+
+# PK 인덱스와 중복되는 인덱스 (index=True로 생성됨)
+REDUNDANT_ID_INDEXES = (
+    ("ix_user_id", "user"),
+    ("ix_plan_id", "plan"),
+    ("ix_flight_id", "flight"),
+    ("ix_itinerary_id", "itinerary"),
+    ("ix_expense_id", "expense"),
+)
+
+
+def upgrade() -> None:
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성/삭제합니다. (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, columns in ACCESS_PATH_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=NOT_DELETED,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        for name, table in REDUNDANT_ID_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in REDUNDANT_ID_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        for name, table, _ in ACCESS_PATH_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,39 @@
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.auth.deps import WEBSOCKET_AUTH_SUBPROTOCOL, WebSocketTokenDep
+
+app = FastAPI()
+
+
+@app.websocket("/ws")
+async def echo_token(websocket: WebSocket, token: WebSocketTokenDep) -> None:
+    if token is None:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept(subprotocol=WEBSOCKET_AUTH_SUBPROTOCOL)
+    await websocket.send_text(token)
+    await websocket.close()
+
+
+def test_token_from_subprotocol():
+    with TestClient(app).websocket_connect(
+        "/ws", subprotocols=[WEBSOCKET_AUTH_SUBPROTOCOL, "header.payload.signature"]
+    ) as websocket:
+        assert websocket.accepted_subprotocol == WEBSOCKET_AUTH_SUBPROTOCOL
+        assert websocket.receive_text() == "header.payload.signature"
+
+
+@pytest.mark.parametrize(
+    "subprotocols",
+    [[], [WEBSOCKET_AUTH_SUBPROTOCOL], ["other", "header.payload.signature"]],
+)
+def test_missing_token_is_rejected(subprotocols: list[str]):
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with TestClient(app).websocket_connect("/ws", subprotocols=subprotocols):
+            pass
+
+    assert exc_info.value.code == 1008
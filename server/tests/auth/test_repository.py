@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, cast
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.auth.models import UserAuthInfo
+from app.auth.repository import AuthRepository
+from app.auth.service import AuthInfoService
+from app.users.models import User
+
+from ..conftest import PostgresRunner
+
+CONCURRENCY = 8
+
+
+async def _login_concurrently(
+    engine: AsyncEngine, login: Any, *, concurrency: int = CONCURRENCY
+) -> list[int]:
+    """각자의 커넥션과 트랜잭션에서 동시에 로그인하고, 돌려받은 인증 정보 id 목록을 반환합니다."""
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    barrier = asyncio.Barrier(concurrency)
+
+    async def attempt() -> int:
+        async with sessionmaker() as session:
+            await session.connection()
+            service: AuthInfoService = cast(Any, AuthInfoService)(
+                auth_repository=cast(Any, AuthRepository)(session=session)
+            )
+            # 모든 요청이 커넥션을 잡은 뒤 한꺼번에 실행되도록 맞춥니다.
+            await barrier.wait()
+            auth = await login(service)
+            await session.commit()
+            return auth.id
+
+    return await asyncio.gather(*(attempt() for _ in range(concurrency)))
+
+
+async def _count(engine: AsyncEngine, *where: Any) -> int:
+    async with engine.connect() as conn:
+        return (
+            await conn.scalar(
+                select(func.count()).select_from(UserAuthInfo).where(*where)
+            )
+            or 0
+        )
+
+
+def test_concurrent_first_google_login_creates_one_auth(postgres: PostgresRunner):
+    google_id = f"test-{uuid4().hex}"
+    email = f"{google_id}@example.com"
+
+    async def run(engine: AsyncEngine) -> None:
+        async with engine.connect() as conn:
+            users_before = await conn.scalar(select(func.count()).select_from(User))
+
+        try:
+            ids = await _login_concurrently(
+                engine,
+                lambda service: service.authenticate_with_google(google_id, email),
+            )
+
+            assert len(set(ids)) == 1
+            assert await _count(engine, UserAuthInfo.google_id == google_id) == 1
+            assert await _count(engine, UserAuthInfo.verified_email == email) == 1
+
+            # 로그인은 인증 정보만 만들고, 유저는 가입할 때 만듭니다.
+            async with engine.connect() as conn:
+                users_after = await conn.scalar(select(func.count()).select_from(User))
+            assert users_after == users_before
+        finally:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    delete(UserAuthInfo).where(UserAuthInfo.google_id == google_id)
+                )
+
+    postgres(run)
+
+
+def test_concurrent_google_login_links_existing_email(postgres: PostgresRunner):
+    google_id = f"test-{uuid4().hex}"
+    email = f"{google_id}@example.com"
+
+    async def run(engine: AsyncEngine) -> None:
+        try:
+            email_ids = await _login_concurrently(
+                engine, lambda service: service.authenticate_with_email(email=email)
+            )
+            google_ids = await _login_concurrently(
+                engine,
+                lambda service: service.authenticate_with_google(google_id, email),
+            )
+
+            assert set(email_ids) == set(google_ids)
+            assert len(set(google_ids)) == 1
+            assert await _count(engine, UserAuthInfo.verified_email == email) == 1
+            assert await _count(engine, UserAuthInfo.google_id == google_id) == 1
+        finally:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    delete(UserAuthInfo).where(UserAuthInfo.verified_email == email)
+                )
+
+    postgres(run)
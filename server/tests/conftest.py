@@ -0,0 +1,37 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.database.config import database_settings
+
+type PostgresRunner = Callable[[Callable[[AsyncEngine], Awaitable[None]]], None]
+
+
+@pytest.fixture
+def postgres() -> PostgresRunner:
+    """
+    .env의 DB에 연결한 엔진으로 테스트를 실행합니다. 마이그레이션이 적용된 DB가 필요하며,
+    연결할 수 없으면 건너뜁니다.
+    """
+
+    def run(test: Callable[[AsyncEngine], Awaitable[None]]) -> None:
+        async def main() -> None:
+            engine = create_async_engine(
+                database_settings.DATABASE_URI, connect_args={"timeout": 3}
+            )
+            try:
+                try:
+                    async with engine.connect():
+                        pass
+                except Exception as e:
+                    pytest.skip(f"Postgres에 연결할 수 없습니다: {e}")
+
+                await test(engine)
+            finally:
+                await engine.dispose()
+
+        asyncio.run(main())
+
+    return run
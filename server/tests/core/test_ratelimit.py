@@ -0,0 +1,19 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from app.core.ratelimit import RedisRateLimitBackend
+
+
+def test_unreachable_redis_fails_at_start():
+    backend = RedisRateLimitBackend("redis://127.0.0.1:1/0")
+
+    async def main():
+        try:
+            await backend.start()
+        finally:
+            await backend.close()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(main())
@@ -0,0 +1,35 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import register_exception_handlers
+from app.core.router import create_router
+from app.metrics.instruments import http_responses_total
+from app.storage.exceptions import (
+    ObjectNotFoundError,
+    ObjectTooLargeError,
+    StorageError,
+)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ObjectTooLargeError(1024 * 1024), ObjectNotFoundError("key")],
+)
+def test_storage_error_is_recorded_with_its_status(error: StorageError):
+    path = f"/storage-error/{error.status_code}"
+    router = create_router()
+
+    @router.get(path)
+    async def fail() -> None:
+        raise error
+
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+
+    response = TestClient(app).get(path)
+
+    assert response.status_code == error.status_code
+    assert http_responses_total.labels(path, "GET", str(error.status_code)).value == 1
+    assert http_responses_total.labels(path, "GET", "500").value == 0
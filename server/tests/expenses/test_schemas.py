@@ -0,0 +1,20 @@
+import pytest
+from pydantic import ValidationError
+
+from app.expenses.schemas import ExpenseUpdate
+
+
+def test_update_keeps_unset_fields_out():
+    update = ExpenseUpdate.model_validate({"amount": 1000})
+
+    assert update.model_dump(exclude_unset=True) == {"amount": 1000}
+
+
+@pytest.mark.parametrize(
+    "field", ["category", "amount", "currency", "description", "date"]
+)
+def test_update_rejects_explicit_null(field: str):
+    with pytest.raises(ValidationError) as exc_info:
+        ExpenseUpdate.model_validate({field: None})
+
+    assert exc_info.value.errors()[0]["loc"] == (field,)
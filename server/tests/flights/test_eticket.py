@@ -0,0 +1,42 @@
+import pytest
+
+from app.flights.eticket import TicketParseError, extract_text
+
+
+def _pdf(text: str) -> bytes:
+    """글꼴 하나와 텍스트 한 줄만 있는 최소한의 PDF"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+        b" /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+
+    body = b"%PDF-1.4\n"
+    offsets: list[int] = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return body
+
+
+def test_extract_pdf_text():
+    text = extract_text(_pdf("KE0703 ICN NRT 2026-10-18 09:00"), "application/pdf")
+
+    assert "KE0703 ICN NRT 2026-10-18 09:00" in text
+
+
+def test_broken_pdf_is_rejected():
+    with pytest.raises(TicketParseError):
+        extract_text(b"%PDF-1.4\nnot a pdf", "application/pdf")
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.metrics.multiprocess import _collect_dead, _read_all
+from app.metrics.registry import Snapshot
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _write(path: Path, responses: float, in_flight: float) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "http_responses_total": [[["/plans", "GET", "200"], responses]],
+                "http_requests_in_flight": [[["/plans", "GET"], in_flight]],
+            }
+        )
+    )
+
+
+def _responses(snapshots: list[tuple[Snapshot, bool]]) -> float:
+    return sum(
+        value
+        for snapshot, _ in snapshots
+        for _, value in snapshot.get("http_responses_total", [])
+    )
+
+
+def test_dead_worker_files_are_merged_and_removed(tmp_path: Path):
+    dead_pid = _dead_pid()
+    _write(tmp_path / f"{dead_pid}.json", responses=3, in_flight=1)
+    (tmp_path / f"{dead_pid}.tmp").write_text("{")
+    _write(tmp_path / "dead.json", responses=2, in_flight=0)
+    _write(tmp_path / f"{os.getpid()}.json", responses=5, in_flight=2)
+
+    assert _collect_dead(tmp_path) == 1
+
+    assert not (tmp_path / f"{dead_pid}.json").exists()
+    assert not (tmp_path / f"{dead_pid}.tmp").exists()
+    dead = json.loads((tmp_path / "dead.json").read_text())
+    assert dead == {"http_responses_total": [[["/plans", "GET", "200"], 5]]}
+
+    snapshots = _read_all(tmp_path)
+    assert _responses(snapshots) == 10
+    assert sorted(alive for _, alive in snapshots) == [False, True]
+
+
+def test_own_pid_file_from_previous_process_is_collected(tmp_path: Path):
+    _write(tmp_path / f"{os.getpid()}.json", responses=4, in_flight=1)
+
+    assert _collect_dead(tmp_path) == 0
+    assert _collect_dead(tmp_path, include_own=True) == 1
+
+    assert [path.name for path in tmp_path.glob("*.json")] == ["dead.json"]
+    assert _responses(_read_all(tmp_path)) == 4
@@ -0,0 +1,14 @@
+import pytest
+
+from app.metrics.registry import CounterChild, Metric, Registry
+
+
+def test_metric_without_hooks_fails_on_creation():
+    class Incomplete(Metric[CounterChild]):
+        type = "counter"
+
+        def _new_child(self) -> CounterChild:
+            return CounterChild()
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete_total", "", registry=Registry())
@@ -0,0 +1,39 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from fastapi import HTTPException
+
+from app.plans.deps import PlanOwnerGuard
+
+
+class FakePlanRepository:
+    def __init__(self, owners: dict[int, int]):
+        self.owners = owners
+
+    async def find_owner_id(self, *, plan_id: int) -> int | None:
+        return self.owners.get(plan_id)
+
+
+def _guard(user_id: int) -> PlanOwnerGuard:
+    return cast(Any, PlanOwnerGuard)(
+        current_user=SimpleNamespace(id=user_id),
+        plan_repository=FakePlanRepository({1: 10}),
+    )
+
+
+def test_owner_passes():
+    asyncio.run(_guard(10).check(plan_id=1))
+
+
+@pytest.mark.parametrize(
+    ("user_id", "plan_id", "status_code"), [(10, 2, 404), (11, 1, 403)]
+)
+def test_missing_plan_or_other_owner_is_rejected(
+    user_id: int, plan_id: int, status_code: int
+):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(_guard(user_id).check(plan_id=plan_id))
+
+    assert exc_info.value.status_code == status_code
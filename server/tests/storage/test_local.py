@@ -0,0 +1,90 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import register_exception_handlers
+from app.storage.exceptions import ObjectTooLargeError
+from app.storage.local import LocalStorage
+
+_CONTENT = b"0123456789" * 100
+
+
+async def _chunks(content: bytes, size: int = 64) -> AsyncIterator[bytes]:
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+def _files(root: Path) -> list[Path]:
+    return sorted(path for path in root.rglob("*") if path.is_file())
+
+
+def test_save_stores_content_under_its_hash(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+
+    stored = asyncio.run(storage.save(_chunks(_CONTENT), max_size=len(_CONTENT)))
+
+    assert stored.key == hashlib.sha256(_CONTENT).hexdigest()
+    assert stored.size == len(_CONTENT)
+    assert storage.path(stored.key).read_bytes() == _CONTENT
+    assert _files(tmp_path) == [storage.path(stored.key)]
+
+
+def test_same_content_is_stored_once(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+
+    first = asyncio.run(storage.save(_chunks(_CONTENT), max_size=len(_CONTENT)))
+    second = asyncio.run(storage.save(_chunks(_CONTENT, 100), max_size=len(_CONTENT)))
+
+    assert first == second
+    assert _files(tmp_path) == [storage.path(first.key)]
+
+
+def test_too_large_upload_is_discarded(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(ObjectTooLargeError) as exc_info:
+        asyncio.run(storage.save(_chunks(_CONTENT), max_size=len(_CONTENT) - 1))
+
+    assert exc_info.value.status_code == 413
+    assert _files(tmp_path) == []
+
+
+def _client(storage: LocalStorage) -> TestClient:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/files/{key}")
+    async def download(key: str) -> Response:
+        return await storage.download(
+            key, filename="영수증.txt", content_type="text/plain"
+        )
+
+    return TestClient(app)
+
+
+def test_download_supports_range(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+    stored = asyncio.run(storage.save(_chunks(_CONTENT), max_size=len(_CONTENT)))
+    client = _client(storage)
+
+    full = client.get(f"/files/{stored.key}")
+    partial = client.get(f"/files/{stored.key}", headers={"Range": "bytes=10-19"})
+
+    assert full.status_code == 200
+    assert full.content == _CONTENT
+    assert full.headers["accept-ranges"] == "bytes"
+    assert partial.status_code == 206
+    assert partial.content == _CONTENT[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(_CONTENT)}"
+
+
+def test_download_missing_object_is_404(tmp_path: Path):
+    client = _client(LocalStorage(tmp_path))
+
+    assert client.get(f"/files/{'0' * 64}").status_code == 404
+    assert client.get("/files/not-a-key").status_code == 404
@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+from typing import Any, AsyncIterator
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.storage.config import StorageConfig
+from app.storage.exceptions import ObjectTooLargeError
+from app.storage.s3 import S3Storage
+
+_PART_SIZE = 100
+
+
+class FakeS3Client:
+    """S3Storage가 쓰는 메서드만 흉내 내는 메모리 S3"""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.calls: list[str] = []
+
+    async def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+        return {}
+
+    async def create_multipart_upload(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.calls.append("create_multipart_upload")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    async def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict[str, Any]:
+        self.calls.append("upload_part")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    async def complete_multipart_upload(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        MultipartUpload: dict[str, list[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        self.calls.append("complete_multipart_upload")
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+        return {}
+
+    async def abort_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str
+    ) -> dict[str, Any]:
+        self.calls.append("abort_multipart_upload")
+        del self.uploads[UploadId]
+        return {}
+
+    async def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.calls.append("head_object")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": len(self.objects[Key])}
+
+    async def copy_object(
+        self, *, Bucket: str, Key: str, CopySource: dict[str, str]
+    ) -> dict[str, Any]:
+        self.calls.append("copy_object")
+        self.objects[Key] = self.objects[CopySource["Key"]]
+        return {}
+
+    async def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.calls.append("delete_object")
+        self.objects.pop(Key, None)
+        return {}
+
+
+def _storage() -> tuple[S3Storage, FakeS3Client]:
+    storage = S3Storage(StorageConfig(S3_BUCKET="test", S3_PART_SIZE=_PART_SIZE))
+    client = FakeS3Client()
+    storage._s3 = client  # type: ignore
+    return storage, client
+
+
+async def _chunks(content: bytes, size: int = 30) -> AsyncIterator[bytes]:
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+def test_small_file_is_put_directly():
+    storage, client = _storage()
+    content = b"a" * (_PART_SIZE - 1)
+
+    stored = asyncio.run(storage.save(_chunks(content), max_size=1000))
+
+    assert stored.key == hashlib.sha256(content).hexdigest()
+    assert client.objects == {stored.key: content}
+    assert client.calls == ["head_object", "put_object"]
+
+
+def test_large_file_is_uploaded_in_parts_and_copied():
+    storage, client = _storage()
+    content = bytes(range(256)) * 2
+
+    stored = asyncio.run(storage.save(_chunks(content), max_size=1000))
+
+    assert stored.size == len(content)
+    assert client.objects == {stored.key: content}
+    assert client.uploads == {}
+    assert client.calls.count("upload_part") == 5
+    assert client.calls[-3:] == [
+        "complete_multipart_upload",
+        "copy_object",
+        "delete_object",
+    ]
+
+
+def test_existing_content_aborts_the_upload():
+    storage, client = _storage()
+    content = b"b" * (_PART_SIZE * 3)
+    client.objects[hashlib.sha256(content).hexdigest()] = content
+
+    stored = asyncio.run(storage.save(_chunks(content), max_size=1000))
+
+    assert client.objects == {stored.key: content}
+    assert client.uploads == {}
+    assert client.calls[-2:] == ["head_object", "abort_multipart_upload"]
+    assert "complete_multipart_upload" not in client.calls
+
+
+def test_existing_small_content_is_not_put_again():
+    storage, client = _storage()
+    content = b"c" * 10
+    client.objects[hashlib.sha256(content).hexdigest()] = content
+
+    asyncio.run(storage.save(_chunks(content), max_size=1000))
+
+    assert client.calls == ["head_object"]
+
+
+def test_too_large_upload_is_aborted():
+    storage, client = _storage()
+
+    with pytest.raises(ObjectTooLargeError):
+        asyncio.run(storage.save(_chunks(b"d" * 500), max_size=250))
+
+    assert client.objects == {}
+    assert client.uploads == {}
+    assert client.calls[-1] == "abort_multipart_upload"
@@ -0,0 +1,76 @@
+import asyncio
+
+from app.users.handles import HandleIndex
+
+
+def test_add_before_load_is_kept():
+    index = HandleIndex()
+    index.add("bob")
+
+    index.load(["alice", "carol"])
+
+    assert index.ready
+    assert "bob" in index
+    assert index.with_prefix("") == ["alice", "bob", "carol"]
+
+
+def test_add_during_reload_is_kept():
+    index = HandleIndex()
+    index.load(["alice"])
+
+    # start_reload()가 ready를 내린 뒤, 목록을 조회하는 사이에 가입한 handle
+    index.ready = False
+    index.add("dave")
+    index.load(["alice", "carol"])
+
+    assert "dave" in index
+    assert index.with_prefix("") == ["alice", "carol", "dave"]
+
+
+def test_pending_handle_already_loaded_is_not_duplicated():
+    index = HandleIndex()
+    index.add("alice")
+
+    index.load(["alice", "bob"])
+
+    assert index.with_prefix("") == ["alice", "bob"]
+    assert len(index) == 2
+
+
+def test_invalidate_falls_back_until_reload():
+    index = HandleIndex()
+    index.load(["alice"])
+
+    # LISTEN 연결이 끊긴 동안 가입한 handle
+    index.invalidate()
+    index.add("erin")
+
+    assert not index.ready
+    index.load(["alice", "frank"])
+    assert index.ready
+    assert index.with_prefix("") == ["alice", "erin", "frank"]
+
+
+def test_invalidate_cancels_reload_in_progress():
+    index = HandleIndex()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_reload() -> None:
+        started.set()
+        await release.wait()
+        index.load(["alice"])
+
+    index.reload = slow_reload
+
+    async def main():
+        index.start_reload()
+        await started.wait()
+        index.invalidate()
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert not index.ready